@@ -0,0 +1,241 @@
+from collections.abc import Iterator, Sequence
+from typing import Any, Protocol
+
+from common.database.enums import BulkInsertMethodEnum
+from common.logger import get_logger
+from sqlalchemy import Column, MetaData, Table, TypeDecorator, func, insert, inspect, literal, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.schema import ScalarElementColumnDefault
+
+
+__all__ = ["bulk_insert_joined"]
+
+
+logger = get_logger(__name__)
+
+
+# Ограничение протокола PostgreSQL на количество параметров в одном запросе
+MAX_QUERY_PARAMETERS = 32767
+
+
+class _Dumpable(Protocol):
+    def model_dump(self) -> dict[str, Any]: ...
+
+
+def _chunks[T](items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class _JoinedTablesPlan:
+    """Раскладывает плоские данные модели с joined-table наследованием по таблицам иерархии."""
+
+    def __init__(self, model: type[Any]) -> None:
+        mapper = inspect(model)
+
+        self.tables: list[Table] = []
+        for table in reversed([m.local_table for m in mapper.iterate_to_root()]):
+            if table not in self.tables:
+                self.tables.append(table)
+
+        self.base_table = self.tables[0]
+        (self.pk_column,) = self.base_table.primary_key.columns
+        self._keys = {
+            column: mapper.get_property_by_column(column).key
+            for table in self.tables
+            for column in table.columns
+            if not column.primary_key
+        }
+        self._polymorphic_on = mapper.polymorphic_on
+        self._polymorphic_identity = mapper.polymorphic_identity
+
+    def columns(self, table: Table) -> list[Column[Any]]:
+        return [column for column in table.columns if column.primary_key or column in self._keys]
+
+    def row(self, table: Table, pk: int | None, data: dict[str, Any]) -> dict[str, Any]:
+        row: dict[str, Any] = {}
+        for column in self.columns(table):
+            if column.primary_key:
+                if pk is not None:
+                    row[column.name] = pk
+                continue
+
+            if column is self._polymorphic_on:
+                row[column.name] = self._polymorphic_identity
+            elif (key := self._keys[column]) in data:
+                row[column.name] = data[key]
+            elif isinstance(column.default, ScalarElementColumnDefault):
+                row[column.name] = column.default.arg
+            else:
+                row[column.name] = None
+
+        return row
+
+
+async def bulk_insert_joined(
+    session: AsyncSession,
+    model: type[Any],
+    items: Sequence[_Dumpable],
+    method: BulkInsertMethodEnum = BulkInsertMethodEnum.INSERT,
+    unique_column: str | None = None,
+) -> list[int | None]:
+    """Массово вставляет записи модели с joined-table наследованием, минуя unit of work ORM.
+    Принимает pydantic-схемы: поля берутся из `model_dump()` по именам атрибутов модели.
+    Возвращает первичные ключи вставленных записей в порядке `items`.
+
+    - INSERT: многострочный INSERT ... RETURNING в базовую таблицу и по одному INSERT в каждую дочернюю.
+    - COPY: ключи резервируются из последовательности базовой таблицы, затем строки всех таблиц
+      загружаются через COPY asyncpg. Быстрее на больших пачках.
+
+    Если передан `unique_column`, вставка идемпотентна: базовая таблица заполняется через
+    INSERT ... ON CONFLICT DO NOTHING без указания ограничения, поэтому пропускаются записи, нарушающие
+    любое уникальное ограничение базовой таблицы, и для них возвращается None. По значению
+    `unique_column` вставленные записи сопоставляются с переданными.
+    С COPY строки базовой таблицы сначала загружаются во временную таблицу и переносятся из нее
+    одним INSERT ... SELECT ... ON CONFLICT, а дочерние таблицы заполняются через COPY.
+    """
+    if not items:
+        return []
+
+    plan = _JoinedTablesPlan(model)
+    data = [item.model_dump() for item in items]
+
+    ids: list[int | None]
+    if method == BulkInsertMethodEnum.COPY and unique_column is None:
+        ids = list(await _reserve_ids(session, plan, len(data)))
+        for table in plan.tables:
+            await _copy_rows(session, table, [plan.row(table, pk, row) for pk, row in zip(ids, data, strict=True)])
+    else:
+        base_rows = [plan.row(plan.base_table, None, row) for row in data]
+        if unique_column is None:
+            ids = list(await _insert_base_rows(session, plan, base_rows))
+        elif method == BulkInsertMethodEnum.COPY:
+            ids = await _copy_base_rows_skip_conflicts(session, plan, base_rows, unique_column)
+        else:
+            ids = await _insert_base_rows_skip_conflicts(session, plan, base_rows, unique_column)
+
+        inserted = [(pk, row) for pk, row in zip(ids, data, strict=True) if pk is not None]
+        for table in plan.tables[1:]:
+            rows = [plan.row(table, pk, row) for pk, row in inserted]
+            if method == BulkInsertMethodEnum.COPY:
+                await _copy_rows(session, table, rows)
+            else:
+                await _insert_rows(session, table, rows)
+
+    logger.debug(
+        "Bulk inserted %d of %d rows into %s using %s",
+        sum(pk is not None for pk in ids),
+        len(ids),
+        plan.tables[-1].fullname,
+        method,
+    )
+
+    return ids
+
+
+async def _insert_base_rows(session: AsyncSession, plan: _JoinedTablesPlan, rows: list[dict[str, Any]]) -> list[int]:
+    # sort_by_parameter_order гарантирует, что RETURNING вернет ключи в порядке переданных строк
+    stmt = insert(plan.base_table).returning(plan.pk_column, sort_by_parameter_order=True)
+    result = await session.execute(stmt, rows)
+
+    return list(result.scalars().all())
+
+
+async def _insert_base_rows_skip_conflicts(
+    session: AsyncSession, plan: _JoinedTablesPlan, rows: list[dict[str, Any]], unique_column: str
+) -> list[int | None]:
+    # Пропущенные строки не попадают в RETURNING, поэтому ключи сопоставляются по значению unique_column
+    unique_key = plan.base_table.c[unique_column]
+    inserted_ids: dict[Any, int] = {}
+    for chunk in _chunks(rows, MAX_QUERY_PARAMETERS // len(rows[0])):
+        stmt = (
+            pg_insert(plan.base_table)
+            .values(list(chunk))
+            .on_conflict_do_nothing()
+            .returning(plan.pk_column, unique_key)
+        )
+        result = await session.execute(stmt)
+        inserted_ids.update((value, pk) for pk, value in result.tuples().all())
+
+    # Повторы значения внутри пачки тоже пропускаются: ключ достается только первой строке
+    return [inserted_ids.pop(row[unique_column], None) for row in rows]
+
+
+async def _copy_base_rows_skip_conflicts(
+    session: AsyncSession, plan: _JoinedTablesPlan, rows: list[dict[str, Any]], unique_column: str
+) -> list[int | None]:
+    # ON CONFLICT недоступен в COPY, поэтому строки загружаются во временную таблицу без ограничений,
+    # а в базовую таблицу переносятся одним INSERT ... SELECT, пропускающим конфликты
+    connection = await session.connection()
+    preparer = connection.dialect.identifier_preparer
+    columns = [plan.base_table.c[name] for name in rows[0]]
+    staging = Table(
+        f"_bulk_{plan.base_table.name}", MetaData(), *(Column(column.name, column.type) for column in columns)
+    )
+    staging_name = preparer.format_table(staging)
+    column_names = ", ".join(preparer.format_column(column) for column in columns)
+    await session.execute(
+        text(
+            f"CREATE TEMPORARY TABLE {staging_name} ON COMMIT DROP AS "  # noqa: S608
+            f"SELECT {column_names} FROM {preparer.format_table(plan.base_table)} WITH NO DATA"
+        )
+    )
+
+    await _copy_rows(session, staging, rows)
+
+    unique_key = plan.base_table.c[unique_column]
+    stmt = (
+        pg_insert(plan.base_table)
+        .from_select([column.name for column in columns], select(*staging.columns))
+        .on_conflict_do_nothing()
+        .returning(plan.pk_column, unique_key)
+    )
+    result = await session.execute(stmt)
+    inserted_ids: dict[Any, int] = {value: pk for pk, value in result.tuples().all()}
+
+    # При ошибке таблицу удалит откат транзакции, а после успеха она удаляется сразу,
+    # чтобы следующая пачка в той же транзакции могла создать ее заново
+    await session.execute(text(f"DROP TABLE {staging_name}"))
+
+    # Из повторов значения внутри пачки вставляется только один, ключ достается первой строке
+    return [inserted_ids.pop(row[unique_column], None) for row in rows]
+
+
+async def _insert_rows(session: AsyncSession, table: Table, rows: list[dict[str, Any]]) -> None:
+    if not rows:
+        return
+
+    for chunk in _chunks(rows, MAX_QUERY_PARAMETERS // len(rows[0])):
+        await session.execute(insert(table).values(list(chunk)))
+
+
+async def _reserve_ids(session: AsyncSession, plan: _JoinedTablesPlan, count: int) -> list[int]:
+    sequence = func.pg_get_serial_sequence(literal(plan.base_table.fullname), literal(plan.pk_column.name))
+    stmt = select(func.nextval(sequence)).select_from(func.generate_series(1, count))
+    result = await session.execute(stmt)
+
+    return list(result.scalars().all())
+
+
+async def _copy_rows(session: AsyncSession, table: Table, rows: list[dict[str, Any]]) -> None:
+    if not rows:
+        return
+
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    columns = list(rows[0])
+
+    # COPY идет в обход SQLAlchemy, поэтому пользовательские типы колонок преобразуются вручную
+    for column in table.columns:
+        if column.name in columns and isinstance(column.type, TypeDecorator):
+            for row in rows:
+                row[column.name] = column.type.process_bind_param(row[column.name], connection.dialect)
+
+    # COPY выполняется на том же соединении, поэтому попадает в текущую транзакцию сессии
+    await raw_connection.driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+        table.name,
+        schema_name=table.schema,
+        columns=columns,
+        records=[tuple(row[column] for column in columns) for row in rows],
+    )
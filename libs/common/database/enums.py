@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class BulkInsertMethodEnum(StrEnum):
+    INSERT = "insert"
+    COPY = "copy"
@@ -0,0 +1,86 @@
+from collections.abc import AsyncIterable, Sequence
+from typing import Any
+
+from common.redis.config import redis_config
+from common.redis.engine import get_async_redis_client
+from redis.asyncio import Redis
+
+
+__all__ = ["RedisBloomFilter"]
+
+
+class RedisBloomFilter:
+    """Bloom-фильтр Redis (`BF.*`) в ключе `bloom:<name>`.
+    Фильтр отвечает «точно нет» или «возможно есть», поэтому проверка в БД нужна только для второго ответа.
+    Пока фильтр не построен через `rebuild`, он считает все элементы возможно существующими.
+    """
+
+    def __init__(self, name: str, error_rate: float, capacity: int) -> None:
+        self.name = name
+        self.error_rate = error_rate
+        self.capacity = capacity
+
+    @property
+    def key(self) -> str:
+        return f"bloom:{self.name}"
+
+    @property
+    def rebuild_key(self) -> str:
+        return f"{self.key}:rebuild"
+
+    @staticmethod
+    async def _execute(redis_client: Redis, *args: str | float) -> Any:
+        """Выполняет команду `BF.*`: типизированных методов для них в redis-py нет."""
+        return await redis_client.execute_command(*args)  # type: ignore[no-untyped-call]
+
+    async def might_contain(self, items: Sequence[str]) -> list[bool]:
+        """Для каждого элемента возвращает, может ли он быть в фильтре."""
+        if not items:
+            return []
+
+        redis_client = get_async_redis_client(redis_config.filters_dsn)
+
+        # Без этой проверки отсутствующий фильтр отвечал бы «точно нет» на любой элемент
+        if not await redis_client.exists(self.key):
+            return [True] * len(items)
+
+        result: list[int] = await self._execute(redis_client, "BF.MEXISTS", self.key, *items)
+        return [bool(exists) for exists in result]
+
+    async def add(self, items: Sequence[str]) -> None:
+        """Добавляет элементы в фильтр и в строящуюся копию, если идет перестроение.
+        Отсутствующий фильтр не создается: пустой фильтр отвечал бы «точно нет» на уже существующие элементы.
+        """
+        if not items:
+            return
+
+        redis_client = get_async_redis_client(redis_config.filters_dsn)
+
+        async with redis_client.pipeline(transaction=False) as pipeline:
+            for key in (self.key, self.rebuild_key):
+                pipeline.execute_command("BF.INSERT", key, "NOCREATE", "ITEMS", *items)
+            # Ошибки NOCREATE для ненайденных ключей ожидаемы
+            await pipeline.execute(raise_on_error=False)
+
+    async def rebuild(self, batches: AsyncIterable[Sequence[str]]) -> int:
+        """Строит фильтр заново из всех элементов и атомарно подменяет им текущий.
+        Копия создается до чтения первой пачки, поэтому элементы, добавленные через `add`
+        во время перестроения, в нее тоже попадут. Возвращает количество загруженных элементов.
+        """
+        redis_client = get_async_redis_client(redis_config.filters_dsn)
+
+        await redis_client.delete(self.rebuild_key)
+        await self._execute(redis_client, "BF.RESERVE", self.rebuild_key, self.error_rate, self.capacity)
+
+        count = 0
+        try:
+            async for batch in batches:
+                if batch:
+                    await self._execute(redis_client, "BF.MADD", self.rebuild_key, *batch)
+                    count += len(batch)
+        except BaseException:
+            await redis_client.delete(self.rebuild_key)
+            raise
+
+        await redis_client.rename(self.rebuild_key, self.key)
+        return count
@@ -12,6 +12,8 @@ class RedisConfig(BaseSettings):
     celery_broker_db: int = 1
     celery_result_db: int = 2
     bot_db: int = 3
+    events_db: int = 4
+    filters_db: int = 5
 
     model_config = SettingsConfigDict(env_prefix="REDIS_")
 
@@ -31,6 +33,14 @@ class RedisConfig(BaseSettings):
     def bot_bot_dsn(self) -> RedisDsn:
         return self.dsn(db=self.bot_db)
 
+    @property
+    def events_dsn(self) -> RedisDsn:
+        return self.dsn(db=self.events_db)
+
+    @property
+    def filters_dsn(self) -> RedisDsn:
+        return self.dsn(db=self.filters_db)
+
     @model_validator(mode="after")
     def check_unique_dbs(self) -> Self:
         """Проверяет, что все БД уникальны."""
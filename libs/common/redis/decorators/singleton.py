@@ -21,6 +21,9 @@ def singleton(cache_ttl: int | timedelta) -> Callable[[Callable[P, R]], Callable
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R | None:
             lock_name = f"lock:{func.__module__}.{func.__name__}"
+            # Вызовы с разными аргументами блокируются независимо
+            if args or kwargs:
+                lock_name += ":" + ",".join([*map(str, args), *(f"{k}={v}" for k, v in sorted(kwargs.items()))])
             acquired = redis_client.set(lock_name, "locked", nx=True, ex=cache_ttl)
 
             if not acquired:
@@ -0,0 +1,88 @@
+from typing import cast
+
+from common.logger import get_logger
+from common.redis.config import redis_config
+from common.redis.engine import get_async_redis_client
+from pydantic import BaseModel, ValidationError
+from redis.exceptions import ResponseError
+
+
+__all__ = ["RedisStream"]
+
+
+logger = get_logger(__name__)
+
+
+class RedisStream[EventType: BaseModel]:
+    """Поток событий в Redis Streams `stream:<name>`. Событие хранится в поле `event` записи как JSON.
+    Потребители читают поток через consumer group и подтверждают (XACK) каждое обработанное событие.
+    """
+
+    def __init__(self, name: str, event_schema: type[EventType], maxlen: int) -> None:
+        self.name = name
+        self.event_schema = event_schema
+        self.maxlen = maxlen
+
+    @property
+    def key(self) -> str:
+        return f"stream:{self.name}"
+
+    async def publish(self, event: EventType) -> str:
+        redis_client = get_async_redis_client(redis_config.events_dsn)
+
+        # Приблизительное ограничение длины дешевле точного и не дает потоку расти бесконечно
+        message_id = cast(
+            "bytes",
+            await redis_client.xadd(self.key, {"event": event.model_dump_json()}, maxlen=self.maxlen, approximate=True),
+        )
+        return message_id.decode()
+
+    async def create_group(self, group: str) -> None:
+        """Создает consumer group, если ее еще нет. Новая группа читает поток с начала."""
+        redis_client = get_async_redis_client(redis_config.events_dsn)
+
+        try:
+            await redis_client.xgroup_create(self.key, group, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def read(self, group: str, consumer: str, count: int, block_ms: int) -> list[tuple[str, EventType]]:
+        """Читает новые события группы, ожидая их не дольше `block_ms` миллисекунд."""
+        redis_client = get_async_redis_client(redis_config.events_dsn)
+
+        response = await redis_client.xreadgroup(group, consumer, {self.key: ">"}, count=count, block=block_ms)
+        if not response:
+            return []
+
+        [(_, messages)] = response
+        return await self._parse_messages(group, messages)
+
+    async def claim_stale(self, group: str, consumer: str, min_idle_ms: int, count: int) -> list[tuple[str, EventType]]:
+        """Забирает себе события, которые другие потребители прочитали, но не подтвердили за `min_idle_ms`."""
+        redis_client = get_async_redis_client(redis_config.events_dsn)
+
+        _, messages, *_ = await redis_client.xautoclaim(
+            self.key, group, consumer, min_idle_time=min_idle_ms, start_id="0-0", count=count
+        )
+        return await self._parse_messages(group, messages)
+
+    async def ack(self, group: str, *message_ids: str) -> None:
+        redis_client = get_async_redis_client(redis_config.events_dsn)
+
+        await redis_client.xack(self.key, group, *message_ids)
+
+    async def _parse_messages(
+        self, group: str, messages: list[tuple[bytes, dict[bytes, bytes]]]
+    ) -> list[tuple[str, EventType]]:
+        events: list[tuple[str, EventType]] = []
+        for raw_message_id, fields in messages:
+            message_id = raw_message_id.decode()
+            try:
+                events.append((message_id, self.event_schema.model_validate_json(fields[b"event"])))
+            except (KeyError, ValidationError) as e:
+                # Битое событие не обработается и при повторе, поэтому сразу подтверждается
+                logger.exception("Invalid event %s in stream %s", message_id, self.key, exc_info=e)
+                await self.ack(group, message_id)
+
+        return events
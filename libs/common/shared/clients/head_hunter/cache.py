@@ -0,0 +1,101 @@
+import time
+import zlib
+
+from common.logger import get_logger
+from common.redis.config import redis_config
+from common.redis.engine import get_async_redis_client
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+
+__all__ = ["HeadHunterDetailCache", "HeadHunterDetailCacheEntry"]
+
+
+logger = get_logger(__name__)
+
+
+# Обновляет fetched_at и TTL только у существующей записи с телом
+_TOUCH_SCRIPT = """
+if redis.call("HEXISTS", KEYS[1], "body") == 0 then
+    return 0
+end
+redis.call("HSET", KEYS[1], "fetched_at", ARGV[1])
+redis.call("EXPIRE", KEYS[1], ARGV[2])
+return 1
+"""
+
+
+class HeadHunterDetailCacheEntry(BaseModel):
+    body: bytes
+    etag: str | None
+    fetched_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+
+class HeadHunterDetailCache:
+    """Кеш детальных вакансий HH в Redis: исходный JSON ответа (сжатый) вместе с его ETag.
+    Запись хранится в хеше `cache:head_hunter_vacancy:<id>` и живет ttl секунд с последней проверки.
+    Ошибки Redis не прерывают загрузку: кеш пропускается, и вакансия запрашивается у HH.
+    """
+
+    name = "head_hunter_vacancy"
+
+    def __init__(self, ttl: int) -> None:
+        self.ttl = ttl
+
+    def _key(self, vacancy_id: int) -> str:
+        return f"cache:{self.name}:{vacancy_id}"
+
+    async def get(self, vacancy_id: int) -> HeadHunterDetailCacheEntry | None:
+        """Возвращает запись кеша. Недоступность Redis и неполная запись считаются промахом."""
+        try:
+            redis_client = get_async_redis_client(redis_config.cache_dsn)
+            data = await redis_client.hgetall(self._key(vacancy_id))  # type: ignore[misc]
+        except RedisError as e:
+            logger.warning("Failed to get hh vacancy %s from cache", vacancy_id, exc_info=e)
+            return None
+
+        if b"body" not in data or b"fetched_at" not in data:
+            return None
+
+        etag = data.get(b"etag")
+        return HeadHunterDetailCacheEntry(
+            body=zlib.decompress(data[b"body"]),
+            etag=etag.decode() if etag else None,
+            fetched_at=float(data[b"fetched_at"]),
+        )
+
+    async def set(self, vacancy_id: int, body: bytes, etag: str | None) -> None:
+        key = self._key(vacancy_id)
+        try:
+            redis_client = get_async_redis_client(redis_config.cache_dsn)
+            async with redis_client.pipeline(transaction=True) as pipeline:
+                await pipeline.delete(key)
+                await pipeline.hset(key, mapping={"body": zlib.compress(body), "fetched_at": str(time.time())})  # type: ignore[misc]
+                if etag:
+                    await pipeline.hset(key, "etag", etag)  # type: ignore[misc]
+                await pipeline.expire(key, self.ttl)
+                await pipeline.execute()
+        except RedisError as e:
+            logger.warning("Failed to cache hh vacancy %s", vacancy_id, exc_info=e)
+
+    async def touch(self, vacancy_id: int) -> None:
+        """Отмечает запись как подтвержденную HH (ответ 304) и продлевает ее TTL.
+        Запись, истекшая после `get`, не воссоздается: иначе в кеше остался бы хеш без тела.
+        """
+        try:
+            redis_client = get_async_redis_client(redis_config.cache_dsn)
+            script = redis_client.register_script(_TOUCH_SCRIPT)
+            await script(keys=[self._key(vacancy_id)], args=[str(time.time()), self.ttl])
+        except RedisError as e:
+            logger.warning("Failed to touch hh vacancy %s in cache", vacancy_id, exc_info=e)
+
+    async def delete(self, vacancy_id: int) -> None:
+        try:
+            redis_client = get_async_redis_client(redis_config.cache_dsn)
+            await redis_client.delete(self._key(vacancy_id))
+        except RedisError as e:
+            logger.warning("Failed to delete hh vacancy %s from cache", vacancy_id, exc_info=e)
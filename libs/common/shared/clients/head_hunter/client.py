@@ -1,12 +1,18 @@
 import asyncio
 from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from bs4 import BeautifulSoup
 from common.logger import get_logger
 from common.shared.clients import BaseClient
+from common.shared.clients.head_hunter.cache import HeadHunterDetailCache, HeadHunterDetailCacheEntry
 from common.shared.clients.head_hunter.config import head_hunter_config
-from common.shared.clients.head_hunter.schemas import HeadHunterVacancyDetailResponse, HeadHunterVacancyListResponse
+from common.shared.clients.head_hunter.schemas import (
+    HeadHunterSearchShard,
+    HeadHunterVacancyDetailResponse,
+    HeadHunterVacancyListResponse,
+)
 from common.shared.decorators.concurency import limit_requests
 from httpx import URL, QueryParams, codes
 
@@ -20,47 +26,108 @@ class HeadHunterClient(BaseClient):
 
     vacancies_per_page = 100  # Количество вакансий на странице. Максимум 100
     vacancies_period = 1  # Количество дней, в пределах которых производится поиск по вакансиям
+    max_search_results = 2000  # HH отдает не больше 2000 результатов одного поиска
+    min_shard_window = timedelta(minutes=10)  # Окно публикации, которое уже не делится дальше
+    date_format = "%Y-%m-%dT%H:%M:%S%z"  # Формат дат в параметрах поиска HH, без долей секунды
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._update_headers()
+        self.detail_cache = HeadHunterDetailCache(ttl=head_hunter_config.detail_cache_ttl)
+
+    async def get_newest_vacancies(
+        self, professions: Iterable[str], date_from: datetime | None = None
+    ) -> dict[int, datetime]:
+        """Асинхронно получает id и даты публикации актуальных вакансиий, опубликованных после date_from,
+        но не раньше vacancies_period дней назад.
+        Поиск разбивается на шарды по профессиям, а шард, в котором найдено больше max_search_results
+        вакансий, делится пополам по времени публикации, пока не уложится в ограничение выдачи HH.
+        Шарды загружаются параллельно в рамках общего ограничения частоты запросов _fetch_page.
+        """
+        date_to = datetime.now(UTC).replace(microsecond=0)
+        period_start = date_to - timedelta(days=self.vacancies_period)
+        date_from = period_start if date_from is None else max(date_from.replace(microsecond=0), period_start)
+        shards = [HeadHunterSearchShard(text=p, date_from=date_from, date_to=date_to) for p in professions]
+        logger.debug("Getting hh newest vacancies ids after %s in %d shards", date_from, len(shards))
+
+        shard_vacancies: dict[HeadHunterSearchShard, dict[int, datetime]] = {}
+        await asyncio.gather(*(self._search_shard(shard, shard_vacancies) for shard in shards))
+
+        all_vacancies: dict[int, datetime] = {}
+        for shard, vacancies in sorted(shard_vacancies.items(), key=lambda item: len(item[1]), reverse=True):
+            new_ids_count = len(vacancies.keys() - all_vacancies.keys())
+            all_vacancies.update(vacancies)
+            logger.info("Shard %s: %d ids, %d new", shard, len(vacancies), new_ids_count)
+
+        logger.info("Found %s hh new vacancies in %d shards", len(all_vacancies), len(shard_vacancies))
+
+        return all_vacancies
+
+    async def _search_shard(
+        self, shard: HeadHunterSearchShard, shard_vacancies: dict[HeadHunterSearchShard, dict[int, datetime]]
+    ) -> None:
+        """Загружает все страницы шарда в shard_vacancies или делит шард, если он не помещается в выдачу HH."""
+        first_page_data = await self._fetch_page(page=0, shard=shard)
+
+        if first_page_data.found > self.max_search_results:
+            if shard.date_to - shard.date_from > self.min_shard_window:
+                logger.debug("Shard %s found %d vacancies, splitting", shard, first_page_data.found)
+                await asyncio.gather(*(self._search_shard(part, shard_vacancies) for part in shard.split()))
+                return
+
+            logger.warning(
+                "Shard %s found %d vacancies, only first %d are available",
+                shard,
+                first_page_data.found,
+                self.max_search_results,
+            )
+
+        vacancies = {vacancy.id: vacancy.published_at for vacancy in first_page_data.items}
+
+        total_pages = min(first_page_data.pages, self.max_search_results // self.vacancies_per_page)
+        tasks = [self._fetch_page(page=p, shard=shard) for p in range(1, total_pages)]
+        for coro in asyncio.as_completed(tasks):
+            page_data = await coro
+            vacancies.update((vacancy.id, vacancy.published_at) for vacancy in page_data.items)
+
+        shard_vacancies[shard] = vacancies
 
-    async def get_newest_vacancies_ids(self, professions: Iterable[str]) -> set[int]:
-        """Асинхронно получает id актуальных вакансиий."""
-        logger.debug("Getting hh newest vacancies ids after %s")
-        text_query = " OR ".join(professions)
-
-        first_page_data = await self._fetch_page(page=0, text_query=text_query)
-        all_vacancy_ids = {vacancy.id for vacancy in first_page_data.items}
-
-        total_pages = first_page_data.pages
-        if total_pages > 1:
-            logger.debug("Fetching remaining %s pages...", total_pages - 1)
-
-            tasks = [self._fetch_page(page=p, text_query=text_query) for p in range(1, total_pages)]
-            for coro in asyncio.as_completed(tasks):
-                page_data = await coro
-                all_vacancy_ids.update(vacancy.id for vacancy in page_data.items)
-
-        logger.debug("Found %s hh new vacancies", len(all_vacancy_ids))
+    async def get_vacancy_by_id(self, vacancy_id: int) -> HeadHunterVacancyDetailResponse | None:
+        """Загружает и валидирует одну детальную вакансию по ее ID.
+        Недавно загруженная вакансия берется из кеша без запроса, а более старая перепроверяется
+        условным запросом с If-None-Match: если вакансия не менялась, HH отвечает 304 без тела.
+        """
+        cached = await self.detail_cache.get(vacancy_id)
+        if cached is not None and cached.age < head_hunter_config.detail_cache_fresh_ttl:
+            logger.debug("Got hh vacancy %s from cache", vacancy_id)
+            return HeadHunterVacancyDetailResponse.model_validate_json(cached.body)
 
-        return all_vacancy_ids
+        return await self._fetch_vacancy(vacancy_id, cached)
 
     # FIXME ограничить на уровне клиента, а не метода
     @limit_requests(20)
-    async def get_vacancy_by_id(self, vacancy_id: int) -> HeadHunterVacancyDetailResponse | None:
-        """Загружает и валидирует одну детальную вакансию по ее ID."""
+    async def _fetch_vacancy(
+        self, vacancy_id: int, cached: HeadHunterDetailCacheEntry | None
+    ) -> HeadHunterVacancyDetailResponse | None:
         logger.debug("Getting hh vacancies by id %s", vacancy_id)
         detailed_url = f"{self.url}/vacancies/{vacancy_id}"
-        response = await self.client.get(detailed_url)
+        headers = {"If-None-Match": cached.etag} if cached is not None and cached.etag else None
+        response = await self.client.get(detailed_url, headers=headers)
 
         if response.status_code == codes.NOT_FOUND:
+            await self.detail_cache.delete(vacancy_id)
             return None
 
+        if response.status_code == codes.NOT_MODIFIED and cached is not None:
+            logger.debug("Hh vacancy %s not modified", vacancy_id)
+            await self.detail_cache.touch(vacancy_id)
+            return HeadHunterVacancyDetailResponse.model_validate_json(cached.body)
+
         response.raise_for_status()
-        data = response.json()
+        vacancy = HeadHunterVacancyDetailResponse.model_validate_json(response.content)
+        await self.detail_cache.set(vacancy_id, response.content, response.headers.get("ETag"))
 
-        return HeadHunterVacancyDetailResponse.model_validate(data)
+        return vacancy
 
     # FIXME Узнать ограничение числа запросов
     @limit_requests(20)
@@ -100,21 +167,19 @@ class HeadHunterClient(BaseClient):
     # Где-то нашел инфу, что ограничение на 30 запросов в секунду,
     # но стабильно работает только 5, иначе возникает 400 ошибка
     @limit_requests(5)
-    async def _fetch_page(self, page: int, text_query: str) -> HeadHunterVacancyListResponse:
-        """Загружает и валидирует одну страницу вакансий."""
+    async def _fetch_page(self, page: int, shard: HeadHunterSearchShard) -> HeadHunterVacancyListResponse:
+        """Загружает и валидирует одну страницу вакансий шарда."""
         params = QueryParams(
             {
-                "text": text_query,
+                "text": shard.text,
                 "per_page": self.vacancies_per_page,
-                "period": self.vacancies_period,
+                "date_from": shard.date_from.strftime(self.date_format),
+                "date_to": shard.date_to.strftime(self.date_format),
                 "page": page,
                 "order_by": "publication_time",
             }
         )
 
-        if len(str(params)) > 2000:  # noqa: PLR2004
-            logger.warning("Possible long query")
-
         url = f"{self.url}/vacancies"
         response = await self.client.get(url, params=params)
         response.raise_for_status()
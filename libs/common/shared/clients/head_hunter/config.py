@@ -7,6 +7,9 @@ class HeadHunterConfig(BaseSettings):
     access_token: str
     email: str
     app_name: str = "syncit"
+    detail_cache_ttl: int = 604800  # 7 days
+    # В пределах этого времени вакансия из кеша отдается без перепроверки в HH
+    detail_cache_fresh_ttl: int = 3600  # 1 hour
 
     model_config = SettingsConfigDict(env_prefix="SHARED_CLIENT_HEAD_HUNTER_")
 
@@ -2,10 +2,11 @@ from datetime import datetime
 
 from common.logger import get_logger
 from common.shared.clients.head_hunter.enums import SalaryCurrency, SalaryMode
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 __all__ = [
+    "HeadHunterSearchShard",
     "HeadHunterVacancyDetailResponse",
     "HeadHunterVacancyListResponse",
     "HeadHunterVacancySchema",
@@ -95,9 +96,40 @@ class HeadHunterVacancyDetailResponse(HeadHunterVacancySchema):
     published_at: datetime
 
 
+class HeadHunterVacancyListItemSchema(HeadHunterVacancySchema):
+    published_at: datetime
+
+
 class HeadHunterVacancyListResponse(BaseModel):
-    items: list[HeadHunterVacancySchema]
+    items: list[HeadHunterVacancyListItemSchema]
     page: int
     pages: int
     per_page: int
     found: int
+
+
+class HeadHunterSearchShard(BaseModel):
+    """Часть поискового запроса: одна профессия в пределах окна публикации [date_from, date_to)."""
+
+    text: str
+    date_from: datetime
+    date_to: datetime
+
+    model_config = ConfigDict(frozen=True)
+
+    def split(self) -> tuple["HeadHunterSearchShard", "HeadHunterSearchShard"]:
+        """Делит окно публикации пополам. Граница округляется до целых секунд, так как HH не принимает дробные.
+        Окно должно быть длиннее двух секунд, иначе граница не окажется строго внутри него.
+        """
+        middle = (self.date_from + (self.date_to - self.date_from) / 2).replace(microsecond=0)
+        if not self.date_from < middle < self.date_to:
+            msg = f"Shard {self} is too small to split"
+            raise ValueError(msg)
+
+        return (
+            self.model_copy(update={"date_to": middle}),
+            self.model_copy(update={"date_from": middle}),
+        )
+
+    def __str__(self) -> str:
+        return f"'{self.text}' {self.date_from:%d.%m %H:%M}-{self.date_to:%d.%m %H:%M}"
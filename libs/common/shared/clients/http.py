@@ -1,4 +1,62 @@
-from httpx import AsyncClient, Limits
+from collections.abc import AsyncIterator, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from httpx import AsyncBaseTransport, AsyncByteStream, AsyncClient, AsyncHTTPTransport, Limits, Request, Response
+
+
+class DownloadCounter:
+    """Количество байт, скачанных клиентом за время подсчета (до распаковки gzip и т.п.)."""
+
+    def __init__(self) -> None:
+        self.bytes = 0
+
+
+_download_counter: ContextVar[DownloadCounter | None] = ContextVar("download_counter", default=None)
+
+
+@contextmanager
+def count_downloaded_bytes() -> Generator[DownloadCounter]:
+    """Считает байты всех ответов, полученных в этом контексте, в том числе из порожденных в нем задач asyncio."""
+    counter = DownloadCounter()
+    token = _download_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _download_counter.reset(token)
+
+
+class _CountingByteStream(AsyncByteStream):
+    def __init__(self, stream: AsyncByteStream, counter: DownloadCounter) -> None:
+        self._stream = stream
+        self._counter = counter
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            self._counter.bytes += len(chunk)
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+
+class _CountingTransport(AsyncBaseTransport):
+    """Транспорт, который учитывает тело ответа в текущем `DownloadCounter` по мере чтения."""
+
+    def __init__(self, transport: AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: Request) -> Response:
+        response = await self._transport.handle_async_request(request)
+
+        counter = _download_counter.get()
+        if counter is not None and isinstance(response.stream, AsyncByteStream):
+            response.stream = _CountingByteStream(response.stream, counter)
+
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
 
 
 limits = Limits(
@@ -7,4 +65,4 @@ limits = Limits(
     keepalive_expiry=30,
 )
 
-http_client: AsyncClient = AsyncClient(limits=limits)
+http_client: AsyncClient = AsyncClient(transport=_CountingTransport(AsyncHTTPTransport(limits=limits)))
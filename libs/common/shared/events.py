@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from common.redis.streams import RedisStream
+from pydantic import BaseModel
+
+
+__all__ = ["NewVacanciesEvent", "new_vacancies_stream"]
+
+
+class NewVacanciesEvent(BaseModel):
+    """Пачка вакансий, сохраненная парсером."""
+
+    hashes: list[str]
+    source: str
+    created_at: datetime
+
+
+new_vacancies_stream = RedisStream("vacancies:new", NewVacanciesEvent, maxlen=10000)
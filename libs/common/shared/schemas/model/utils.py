@@ -1,6 +1,6 @@
 from typing import Any
 
-from sqlalchemy import BigInteger, DateTime, Integer, String
+from sqlalchemy import BigInteger, DateTime, Integer, String, TypeDecorator
 from sqlalchemy.exc import NoForeignKeysError
 from sqlalchemy.orm import InstrumentedAttribute
 
@@ -31,6 +31,9 @@ def col(model_field: InstrumentedAttribute[Any]) -> dict[str, Any]:
         data["max_length"] = getattr(col_type, "length", None)
     elif isinstance(col_type, DateTime):
         pass
+    elif isinstance(col_type, TypeDecorator):
+        # Хранимое в БД представление кастомного типа не ограничивает значение на стороне Python
+        pass
     else:
         raise TypeError(f"Unsupported column type: {col_type}")
 
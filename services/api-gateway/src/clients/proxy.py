@@ -2,7 +2,13 @@ from common.environment.config import env_config
 from common.gateway.enums import ServiceEnum
 from common.shared.clients import BaseClient
 from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import HttpUrl
+from starlette.background import BackgroundTask
+
+
+# Ответы этих типов отдаются клиенту по мере получения, а не после полной загрузки
+STREAMING_MEDIA_TYPES = frozenset({"application/x-ndjson"})
 
 
 class _ProxyClient(BaseClient):
@@ -19,18 +25,33 @@ class _ProxyClient(BaseClient):
             path=path,
         )
 
-        response = await self.client.request(
+        upstream_request = self.client.build_request(
             method=request.method,
             url=str(url),
             headers=request.headers,
             params=str(request.query_params),  # Без str некорректно формирует list params
             content=await request.body(),
         )
+        response = await self.client.send(upstream_request, stream=True)
+
+        media_type = response.headers.get("content-type", "").split(";")[0].strip()
+        if media_type in STREAMING_MEDIA_TYPES:
+            return StreamingResponse(
+                response.aiter_raw(),
+                status_code=response.status_code,
+                headers=response.headers,
+                background=BackgroundTask(response.aclose),
+            )
+
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
 
         return Response(
             status_code=response.status_code,
             headers=response.headers,
-            content=response.content,
+            content=content,
         )
 
 
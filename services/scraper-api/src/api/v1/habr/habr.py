@@ -1,6 +1,12 @@
 from typing import Annotated
 
-from api.v1.habr.schemas import HabrVacanciesQuery, HabrVacancyDetailedResponse, HabrVacancyListResponse
+from api.v1.habr.schemas import (
+    HabrCacheStatsResponse,
+    HabrVacanciesQuery,
+    HabrVacancyDetailedResponse,
+    HabrVacancyListResponse,
+)
+from cache import habr_vacancy_cache
 from clients import habr_client
 from common.logger import get_logger
 from fastapi import APIRouter, Query
@@ -18,6 +24,13 @@ async def get_vacancies(query: Annotated[HabrVacanciesQuery, Query()]) -> HabrVa
     return HabrVacancyListResponse(vacancies=vacancy_ids)
 
 
+@router.get("/vacancies/cache")
+async def get_vacancy_cache_stats() -> HabrCacheStatsResponse:
+    stats = await habr_vacancy_cache.stats()
+
+    return HabrCacheStatsResponse.model_validate(stats.model_dump())
+
+
 @router.get("/vacancies/{vacancy_id}")
 async def get_vacancy(vacancy_id: int) -> HabrVacancyDetailedResponse:
     vacancy = await habr_client.get_vacancy_by_id(vacancy_id)
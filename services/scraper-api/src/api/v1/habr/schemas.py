@@ -12,3 +12,9 @@ class HabrVacancyListResponse(BaseModel):
 
 class HabrVacancyDetailedResponse(BaseModel):
     vacancy: HabrDetailedVacancySchema
+
+
+class HabrCacheStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    size: int
@@ -5,9 +5,26 @@ from schemas import DateGTEUTCMixin, TelegramChannelMessageSchema
 class TelegramVacanciesQuery(DateGTEUTCMixin):
     channel_username: str = Field(description="Username телеграм канала")
     channel_topic_id: int | None = Field(None, description="ID топика телеграм канала")
+    after_id: int | None = Field(None, ge=0, description="Вернуть только сообщения с ID больше указанного")
 
     model_config = ConfigDict(extra="forbid")
 
 
 class TelegramChannelMessagesResponse(BaseModel):
     messages: list[TelegramChannelMessageSchema]
+    newest_message_id: int | None = Field(None, description="ID самого нового сообщения в канале на момент запроса")
+
+
+class TelegramChannelsBatchRequest(BaseModel):
+    channels: list[TelegramVacanciesQuery] = Field(min_length=1, max_length=500)
+    min_text_length: int = Field(0, ge=0, description="Не возвращать сообщения с текстом короче указанного")
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class TelegramChannelMessagesStreamItem(TelegramChannelMessagesResponse):
+    """Строка NDJSON-ответа: результат обработки одного канала из пачки."""
+
+    channel_username: str
+    channel_topic_id: int | None
+    error: str | None = Field(None, description="Текст ошибки, если канал не удалось обработать")
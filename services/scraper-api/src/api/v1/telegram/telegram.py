@@ -1,49 +1,119 @@
+import asyncio
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Annotated
 
-from api.v1.telegram.schemas import TelegramChannelMessagesResponse, TelegramVacanciesQuery
+from api.v1.telegram.schemas import (
+    TelegramChannelMessagesResponse,
+    TelegramChannelMessagesStreamItem,
+    TelegramChannelsBatchRequest,
+    TelegramVacanciesQuery,
+)
 from clients import telegram_client, telethon_client
+from common.logger import get_logger
+from core.config import service_config
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 
 if TYPE_CHECKING:
     from schemas import TelegramChannelMessageSchema
 
 
+logger = get_logger(__name__)
+
 router = APIRouter()
 
 
 @router.get("/messages")
 async def channel_messages(query: Annotated[TelegramVacanciesQuery, Query()]) -> TelegramChannelMessagesResponse:
+    return await _get_channel_messages(query)
+
+
+@router.post("/messages/batch")
+async def channels_messages_batch(request: TelegramChannelsBatchRequest) -> StreamingResponse:
+    """Обрабатывает пачку каналов параллельно и отдает NDJSON: по строке на канал по мере готовности."""
+    return StreamingResponse(_stream_channels_messages(request), media_type="application/x-ndjson")
+
+
+async def _stream_channels_messages(request: TelegramChannelsBatchRequest) -> AsyncIterator[str]:
+    # Запросы страниц превью дополнительно ограничены общим лимитом клиента
+    semaphore = asyncio.Semaphore(service_config.telegram_batch_concurrency)
+
+    async def process(query: TelegramVacanciesQuery) -> TelegramChannelMessagesStreamItem:
+        async with semaphore:
+            try:
+                response = await _get_channel_messages(query)
+            except Exception as e:
+                logger.exception("Error processing channel '%s'", query.channel_username, exc_info=e)
+                return TelegramChannelMessagesStreamItem(
+                    channel_username=query.channel_username,
+                    channel_topic_id=query.channel_topic_id,
+                    messages=[],
+                    newest_message_id=None,
+                    error=e.detail if isinstance(e, HTTPException) else repr(e),
+                )
+
+        messages = [message for message in response.messages if len(message.text) >= request.min_text_length]
+        return TelegramChannelMessagesStreamItem(
+            channel_username=query.channel_username,
+            channel_topic_id=query.channel_topic_id,
+            messages=messages,
+            newest_message_id=response.newest_message_id,
+        )
+
+    tasks = [asyncio.create_task(process(query)) for query in request.channels]
+    try:
+        for completed in asyncio.as_completed(tasks):
+            item = await completed
+            yield item.model_dump_json() + "\n"
+    finally:
+        # Клиент мог отключиться, не дочитав ответ
+        for task in tasks:
+            task.cancel()
+
+
+async def _get_channel_messages(query: TelegramVacanciesQuery) -> TelegramChannelMessagesResponse:
     # TELETHON
     if query.channel_topic_id:
         if not telethon_client.is_available:
             raise HTTPException(status_code=503, detail="Telethon client is unavailable")
         messages = await telethon_client.get_detailed_messages(
-            query.date_gte, query.channel_username, query.channel_topic_id
+            query.date_gte, query.channel_username, query.channel_topic_id, min_id=query.after_id or 0
         )
-        return TelegramChannelMessagesResponse(messages=messages)
+        newest_message_id = messages[0].id if messages else query.after_id
+        return TelegramChannelMessagesResponse(messages=messages, newest_message_id=newest_message_id)
 
     # HTTP
-    newest_message_id = await telegram_client.get_newest_message_id(query.channel_username)
+    page = await telegram_client.get_messages_page(query.channel_username)
 
-    if not newest_message_id:
+    if page is None or page.max_message_id is None:
         return TelegramChannelMessagesResponse(messages=[])
 
+    newest_message_id = page.max_message_id
+    after_id = query.after_id or 0
+
+    # Новых сообщений с прошлого опроса не появилось
+    if newest_message_id <= after_id:
+        return TelegramChannelMessagesResponse(messages=[], newest_message_id=newest_message_id)
+
     messages: list[TelegramChannelMessageSchema] = []  # type: ignore[no-redef]
-    current_id = newest_message_id
 
-    while current_id > 0:
-        message = await telegram_client.get_detailed_message(query.channel_username, current_id)
+    while page is not None and page.min_message_id is not None:
+        for message in page.messages:
+            # Дальше идут сообщения, просмотренные при прошлых опросах, или старее date_gte
+            if message.id <= after_id or message.datetime < query.date_gte:
+                return TelegramChannelMessagesResponse(messages=messages, newest_message_id=newest_message_id)
 
-        if message is None:
-            current_id -= 1
-            continue
+            messages.append(message)
 
-        # Если сообщение старее, чем date_gte
-        if message.datetime < query.date_gte:
+        if page.min_message_id <= after_id + 1:
             break
 
-        messages.append(message)
-        current_id -= 1
+        previous_min_message_id = page.min_message_id
+        page = await telegram_client.get_messages_page(query.channel_username, before=previous_min_message_id)
+
+        # Защита от зацикливания, если Telegram вернул ту же страницу
+        if page is not None and page.min_message_id is not None and page.min_message_id >= previous_min_message_id:
+            break
 
-    return TelegramChannelMessagesResponse(messages=messages)
+    return TelegramChannelMessagesResponse(messages=messages, newest_message_id=newest_message_id)
@@ -0,0 +1,165 @@
+"""Сравнение бэкендов разбора HTML на сохраненных страницах.
+
+Каждая страница разбирается всеми бэкендами: результат сверяется с эталонным BeautifulSoup,
+затем замеряется скорость разбора в страницах в секунду. Для страниц Habr отдельно замеряется
+чтение из встроенного JSON-состояния, и его результат тоже сверяется с эталонным разбором DOM.
+
+Ожидаемая структура каталога с фикстурами:
+    <fixtures>/habr/<vacancy_id>.html
+    <fixtures>/telegram/<channel_username>/<любое имя>.html
+
+Недостающие фикстуры можно скачать флагами --habr-ids и --telegram-channels.
+
+Запуск из каталога src:
+    python -m benchmarks.html_parsers --fixtures ./fixtures --repeat 20
+"""
+
+import argparse
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+import time
+
+from common.logger import get_logger
+from core.enums import HTMLParserBackendEnum
+from httpx import AsyncClient
+from parsers import HabrParser, TelegramParser
+from pydantic import BaseModel
+
+
+logger = get_logger(__name__)
+
+
+REFERENCE_BACKEND = HTMLParserBackendEnum.BEAUTIFULSOUP
+
+
+@dataclass
+class Fixture:
+    path: Path
+    parse: Callable[[HTMLParserBackendEnum], BaseModel]
+    parse_ssr_state: Callable[[], BaseModel] | None = None
+
+
+def load_fixtures(fixtures_dir: Path) -> list[Fixture]:
+    fixtures: list[Fixture] = []
+
+    for path in sorted((fixtures_dir / "habr").glob("*.html")):
+        html_content, vacancy_id = path.read_text(), int(path.stem)
+        parse_ssr_state = None
+        if HabrParser.SSR_STATE_PATTERN.search(html_content):
+            parse_ssr_state = partial(HabrParser.parse_detailed_vacancy, html_content, vacancy_id)
+        else:
+            logger.warning("SSR state not found in %s", path)
+
+        fixtures.append(
+            Fixture(
+                path,
+                partial(HabrParser.parse_detailed_vacancy, html_content, vacancy_id, use_ssr_state=False),
+                parse_ssr_state,
+            )
+        )
+
+    for path in sorted((fixtures_dir / "telegram").glob("*/*.html")):
+        html_content, channel_username = path.read_text(), path.parent.name
+        fixtures.append(Fixture(path, partial(TelegramParser.parse_messages_page, html_content, channel_username)))
+
+    return fixtures
+
+
+async def download_fixtures(fixtures_dir: Path, habr_ids: list[int], telegram_channels: list[str], pages: int) -> None:
+    async with AsyncClient(follow_redirects=False, timeout=30) as client:
+        for vacancy_id in habr_ids:
+            path = fixtures_dir / "habr" / f"{vacancy_id}.html"
+            if path.exists():
+                continue
+
+            response = await client.get(f"https://career.habr.com/vacancies/{vacancy_id}")
+            response.raise_for_status()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(response.text)
+            logger.info("Saved %s", path)
+
+        for channel_username in telegram_channels:
+            before: int | None = None
+            for page in range(pages):
+                params = {"before": before} if before else {}
+                response = await client.get(f"https://t.me/s/{channel_username}", params=params)
+                response.raise_for_status()
+
+                path = fixtures_dir / "telegram" / channel_username / f"{page}.html"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(response.text)
+                logger.info("Saved %s", path)
+
+                before = TelegramParser.parse_messages_page(response.text, channel_username).min_message_id
+                if before is None:
+                    break
+
+
+def check_outputs(fixtures: list[Fixture]) -> int:
+    """Сверяет результат каждого бэкенда и чтения JSON-состояния с эталоном. Возвращает количество расхождений."""
+    mismatches = 0
+    for fixture in fixtures:
+        expected = fixture.parse(REFERENCE_BACKEND)
+        if fixture.parse_ssr_state is not None and fixture.parse_ssr_state() != expected:
+            logger.warning("Output of ssr_state differs from %s for %s", REFERENCE_BACKEND, fixture.path)
+            mismatches += 1
+
+        for backend in HTMLParserBackendEnum:
+            if backend != REFERENCE_BACKEND and fixture.parse(backend) != expected:
+                logger.warning("Output of %s differs from %s for %s", backend, REFERENCE_BACKEND, fixture.path)
+                mismatches += 1
+
+    return mismatches
+
+
+def measure(fixtures: list[Fixture], repeat: int) -> None:
+    for backend in HTMLParserBackendEnum:
+        started_at = time.perf_counter()
+        for _ in range(repeat):
+            for fixture in fixtures:
+                fixture.parse(backend)
+        duration = time.perf_counter() - started_at
+
+        logger.info("%s: pages_per_sec=%.1f total=%.2fs", backend, len(fixtures) * repeat / duration, duration)
+
+    ssr_state_parsers = [fixture.parse_ssr_state for fixture in fixtures if fixture.parse_ssr_state is not None]
+    if not ssr_state_parsers:
+        return
+
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        for parse in ssr_state_parsers:
+            parse()
+    duration = time.perf_counter() - started_at
+
+    logger.info("ssr_state: pages_per_sec=%.1f total=%.2fs", len(ssr_state_parsers) * repeat / duration, duration)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", type=Path, default=Path("fixtures"), help="Каталог с сохраненными страницами")
+    parser.add_argument("--repeat", type=int, default=20, help="Сколько раз разбирать каждую страницу")
+    parser.add_argument("--habr-ids", type=int, nargs="*", default=[], help="ID вакансий Habr для скачивания")
+    parser.add_argument("--telegram-channels", nargs="*", default=[], help="Telegram каналы для скачивания")
+    parser.add_argument("--telegram-pages", type=int, default=5, help="Сколько страниц канала скачать")
+    args = parser.parse_args()
+
+    if args.habr_ids or args.telegram_channels:
+        asyncio.run(download_fixtures(args.fixtures, args.habr_ids, args.telegram_channels, args.telegram_pages))
+
+    fixtures = load_fixtures(args.fixtures)
+    if not fixtures:
+        logger.warning("No fixtures found in %s", args.fixtures)
+        return
+
+    mismatches = check_outputs(fixtures)
+    logger.info("Checked %d pages, %d mismatches", len(fixtures), mismatches)
+
+    measure(fixtures, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+from cache.base import BaseModelCache, CacheStats
+from cache.disk import DiskModelCache
+from cache.redis import RedisModelCache
+from core.config import service_config
+from core.enums import CacheBackendEnum
+from schemas import HabrDetailedVacancySchema
+
+
+__all__ = [
+    "BaseModelCache",
+    "CacheStats",
+    "habr_vacancy_cache",
+]
+
+
+def _create_habr_vacancy_cache() -> BaseModelCache[HabrDetailedVacancySchema]:
+    name, model = "habr_vacancy", HabrDetailedVacancySchema
+    ttl, max_entries = service_config.habr_cache_ttl, service_config.habr_cache_max_entries
+
+    if service_config.habr_cache_backend == CacheBackendEnum.REDIS:
+        return RedisModelCache(name, model, ttl, max_entries)
+
+    return DiskModelCache(name, model, ttl, max_entries, service_config.habr_cache_dir)
+
+
+habr_vacancy_cache = _create_habr_vacancy_cache()
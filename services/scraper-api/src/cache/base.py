@@ -0,0 +1,73 @@
+from abc import ABC, abstractmethod
+import zlib
+
+from common.logger import get_logger
+from pydantic import BaseModel, ValidationError
+
+
+__all__ = ["BaseModelCache", "CacheStats"]
+
+
+logger = get_logger(__name__)
+
+
+class CacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+
+class BaseModelCache[ModelType: BaseModel](ABC):
+    """Кеш pydantic-моделей с TTL и вытеснением давно не читавшихся записей (LRU).
+    Модели хранятся в виде сжатого JSON, счетчики попаданий ведутся в рамках процесса.
+    """
+
+    def __init__(self, name: str, model: type[ModelType], ttl: int, max_entries: int) -> None:
+        self.name = name
+        self.model = model
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._hits = 0
+        self._misses = 0
+
+    async def get(self, key: str | int) -> ModelType | None:
+        data = await self._get(str(key))
+        if data is None:
+            self._misses += 1
+            logger.debug("Cache %s miss. key=%s", self.name, key)
+            return None
+
+        try:
+            value = self.model.model_validate_json(zlib.decompress(data))
+        except (zlib.error, ValidationError) as e:
+            # Запись повреждена или осталась от старой схемы модели
+            logger.warning("Cache %s entry is invalid, deleting. key=%s error=%s", self.name, key, e)
+            await self._delete(str(key))
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        logger.debug("Cache %s hit. key=%s", self.name, key)
+        return value
+
+    async def set(self, key: str | int, value: ModelType) -> None:
+        await self._set(str(key), zlib.compress(value.model_dump_json().encode()))
+
+    async def stats(self) -> CacheStats:
+        return CacheStats(hits=self._hits, misses=self._misses, size=await self._size())
+
+    @abstractmethod
+    async def _get(self, key: str) -> bytes | None:
+        """Возвращает сжатое значение и отмечает запись как недавно использованную."""
+
+    @abstractmethod
+    async def _set(self, key: str, data: bytes) -> None:
+        """Сохраняет сжатое значение и вытесняет лишние записи."""
+
+    @abstractmethod
+    async def _delete(self, key: str) -> None:
+        """Удаляет запись."""
+
+    @abstractmethod
+    async def _size(self) -> int:
+        """Количество записей в кеше."""
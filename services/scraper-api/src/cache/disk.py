@@ -0,0 +1,114 @@
+import asyncio
+import contextlib
+import os
+from pathlib import Path
+import struct
+import threading
+import time
+from uuid import uuid4
+
+from cache.base import BaseModelCache
+from common.logger import get_logger
+from pydantic import BaseModel
+
+
+__all__ = ["DiskModelCache"]
+
+
+logger = get_logger(__name__)
+
+
+# Перед данными хранится время истечения записи
+_HEADER = struct.Struct(">d")
+
+
+class DiskModelCache[ModelType: BaseModel](BaseModelCache[ModelType]):
+    """Кеш в локальном каталоге: запись — файл, время последнего чтения — его mtime.
+    Количество записей считается приблизительно и пересчитывается после вытеснения.
+    Файловые операции выполняются в потоках, поэтому счетчик записей защищен блокировкой.
+    """
+
+    # При переполнении кеш сокращается до этой доли от max_entries, чтобы не чистить его на каждой записи
+    EVICTION_RATIO = 0.9
+
+    def __init__(self, name: str, model: type[ModelType], ttl: int, max_entries: int, directory: Path) -> None:
+        super().__init__(name, model, ttl, max_entries)
+        self.directory = directory
+        self._entries: int | None = None
+        self._entries_lock = threading.Lock()
+
+    async def _get(self, key: str) -> bytes | None:
+        return await asyncio.to_thread(self._read, self._path(key))
+
+    async def _set(self, key: str, data: bytes) -> None:
+        await asyncio.to_thread(self._write, self._path(key), data)
+
+    async def _delete(self, key: str) -> None:
+        await asyncio.to_thread(self._remove, self._path(key))
+
+    async def _size(self) -> int:
+        return await asyncio.to_thread(self._count_entries)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.zlib"
+
+    def _read(self, path: Path) -> bytes | None:
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        try:
+            (expires_at,) = _HEADER.unpack_from(content)
+        except struct.error:
+            logger.warning("Cache %s file %s is truncated, deleting", self.name, path)
+            self._remove(path)
+            return None
+
+        if expires_at < time.time():
+            self._remove(path)
+            return None
+
+        # mtime служит временем последнего обращения для LRU. Запись могли вытеснить после чтения
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(path)
+        return content[_HEADER.size :]
+
+    def _write(self, path: Path, data: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Запись через временный файл, чтобы читатели не увидели недописанные данные
+        tmp_path = path.with_name(f"{path.name}.{uuid4().hex}.tmp")
+        tmp_path.write_bytes(_HEADER.pack(time.time() + self.ttl) + data)
+
+        with self._entries_lock:
+            entries = self._count_entries_locked() + (not path.exists())
+            tmp_path.replace(path)
+
+            self._entries = entries
+            if entries > self.max_entries:
+                self._evict_locked()
+
+    def _remove(self, path: Path) -> None:
+        with self._entries_lock:
+            path.unlink(missing_ok=True)
+            self._entries = None
+
+    def _count_entries(self) -> int:
+        with self._entries_lock:
+            return self._count_entries_locked()
+
+    def _count_entries_locked(self) -> int:
+        if self._entries is None:
+            self._entries = sum(1 for _ in self.directory.glob("*.zlib")) if self.directory.exists() else 0
+
+        return self._entries
+
+    def _evict_locked(self) -> None:
+        paths = sorted(self.directory.glob("*.zlib"), key=lambda p: p.stat().st_mtime)
+        excess = len(paths) - int(self.max_entries * self.EVICTION_RATIO)
+        for path in paths[: max(excess, 0)]:
+            path.unlink(missing_ok=True)
+
+        self._entries = None
+        logger.info("Evicted %d entries from cache %s", max(excess, 0), self.name)
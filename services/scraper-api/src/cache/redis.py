@@ -0,0 +1,71 @@
+import time
+from typing import cast
+
+from cache.base import BaseModelCache
+from common.logger import get_logger
+from common.redis.config import redis_config
+from common.redis.engine import get_async_redis_client
+from pydantic import BaseModel
+
+
+__all__ = ["RedisModelCache"]
+
+
+logger = get_logger(__name__)
+
+
+class RedisModelCache[ModelType: BaseModel](BaseModelCache[ModelType]):
+    """Кеш в Redis: значения живут под TTL, а время последнего чтения хранится в отсортированном множестве."""
+
+    @property
+    def _lru_key(self) -> str:
+        return f"cache:{self.name}:lru"
+
+    def _key(self, key: str) -> str:
+        return f"cache:{self.name}:{key}"
+
+    async def _get(self, key: str) -> bytes | None:
+        redis_client = get_async_redis_client(redis_config.cache_dsn)
+
+        data = cast("bytes | None", await redis_client.get(self._key(key)))
+        if data is not None:
+            await redis_client.zadd(self._lru_key, {key: time.time()})
+
+        return data
+
+    async def _set(self, key: str, data: bytes) -> None:
+        redis_client = get_async_redis_client(redis_config.cache_dsn)
+
+        now = time.time()
+        async with redis_client.pipeline(transaction=False) as pipeline:
+            await pipeline.set(self._key(key), data, ex=self.ttl)
+            await pipeline.zadd(self._lru_key, {key: now})
+            # Записи, не читавшиеся дольше TTL, уже истекли в Redis
+            await pipeline.zremrangebyscore(self._lru_key, "-inf", now - self.ttl)
+            await pipeline.zcard(self._lru_key)
+            *_, size = await pipeline.execute()
+
+        excess = size - self.max_entries
+        if excess <= 0:
+            return
+
+        evicted = [key.decode() for key in await redis_client.zrange(self._lru_key, 0, excess - 1)]
+        async with redis_client.pipeline(transaction=False) as pipeline:
+            await pipeline.delete(*(self._key(key) for key in evicted))
+            await pipeline.zrem(self._lru_key, *evicted)
+            await pipeline.execute()
+
+        logger.info("Evicted %d entries from cache %s", len(evicted), self.name)
+
+    async def _delete(self, key: str) -> None:
+        redis_client = get_async_redis_client(redis_config.cache_dsn)
+
+        async with redis_client.pipeline(transaction=False) as pipeline:
+            await pipeline.delete(self._key(key))
+            await pipeline.zrem(self._lru_key, key)
+            await pipeline.execute()
+
+    async def _size(self) -> int:
+        redis_client = get_async_redis_client(redis_config.cache_dsn)
+
+        return cast("int", await redis_client.zcard(self._lru_key))
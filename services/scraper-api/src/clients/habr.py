@@ -1,5 +1,7 @@
+import asyncio
 from datetime import datetime
 
+from cache import habr_vacancy_cache
 from clients.base import BaseParserClient
 from clients.schemas import HabrVacancyListResponse, PingResponse
 from common.logger import get_logger
@@ -15,6 +17,8 @@ class _HabrClient(BaseParserClient):
     url = URL("https://career.habr.com/vacancies")
     _api_url = URL("https://career.habr.com/api/frontend/vacancies")
     parser = HabrParser
+    # Количество страниц списка, загружаемых заранее
+    PREFETCH_PAGES = 4
 
     async def ping(self) -> PingResponse:
         response = await self.client.get(self.url)
@@ -23,37 +27,78 @@ class _HabrClient(BaseParserClient):
         return PingResponse()
 
     async def get_vacancy_by_id(self, vacancy_id: int) -> HabrDetailedVacancySchema:
+        # Опубликованная вакансия почти не меняется, поэтому разобранная страница кешируется
+        cached_vacancy = await habr_vacancy_cache.get(vacancy_id)
+        if cached_vacancy is not None:
+            return cached_vacancy
+
         detailed_url = f"{self.url}/{vacancy_id}"
         response = await self.client.get(detailed_url)
 
         response.raise_for_status()
 
-        return self.parser.parse_detailed_vacancy(response.text, vacancy_id)
+        vacancy = self.parser.parse_detailed_vacancy(response.text, vacancy_id)
+        await habr_vacancy_cache.set(vacancy_id, vacancy)
+
+        return vacancy
 
     async def get_newest_vacancies_ids(self, date_gte: datetime) -> list[int]:
+        """Возвращает ID вакансий, опубликованных не раньше date_gte, от новых к старым.
+        Страницы списка отсортированы по дате, поэтому следующие PREFETCH_PAGES страниц загружаются
+        заранее скользящим окном, а после первой вакансии старее date_gte оставшиеся загрузки отменяются.
+        """
         newest_vacancy_ids: list[int] = []
 
         logger.info("Getting newest vacancies ids after %s", date_gte)
 
         first_page = await self._fetch_vacancies(page=1)
-        logger.debug("Total pages: %s", first_page.meta.total_pages)
+        total_pages = first_page.meta.total_pages
+        logger.debug("Total pages: %s", total_pages)
 
-        current_page = 1
-        continue_pagination = True
+        pages_needed = 1
+        reached_old = self._collect_newest_ids(first_page, date_gte, newest_vacancy_ids)
 
-        while continue_pagination and current_page <= first_page.meta.total_pages:
-            vacancies_response = await self._fetch_vacancies(page=current_page)
-            for vacancy in vacancies_response.list:
-                if vacancy.published_date.date < date_gte:
-                    logger.debug("Found old vacancy. Break.")
-                    continue_pagination = False
+        prefetched: dict[int, asyncio.Task[HabrVacancyListResponse]] = {}
+        next_page = 2
+        try:
+            for current_page in range(2, total_pages + 1):
+                if reached_old:
                     break
 
-                newest_vacancy_ids.append(vacancy.id)
-            current_page += 1
+                while next_page <= total_pages and len(prefetched) < self.PREFETCH_PAGES:
+                    prefetched[next_page] = asyncio.create_task(self._fetch_vacancies(page=next_page))
+                    next_page += 1
+
+                vacancies_response = await prefetched.pop(current_page)
+                pages_needed += 1
+                reached_old = self._collect_newest_ids(vacancies_response, date_gte, newest_vacancy_ids)
+        finally:
+            for task in prefetched.values():
+                task.cancel()
+
+        logger.info(
+            "Got %d newest vacancies ids: %d of %d pages needed, %d pages requested, %d prefetched pages discarded",
+            len(newest_vacancy_ids),
+            pages_needed,
+            total_pages,
+            next_page - 1,
+            len(prefetched),
+        )
 
         return sorted(newest_vacancy_ids, reverse=True)
 
+    @staticmethod
+    def _collect_newest_ids(page: HabrVacancyListResponse, date_gte: datetime, vacancy_ids: list[int]) -> bool:
+        """Добавляет ID вакансий страницы не старее date_gte. Возвращает True, если встретилась более старая."""
+        for vacancy in page.list:
+            if vacancy.published_date.date < date_gte:
+                logger.debug("Found old vacancy. Break.")
+                return True
+
+            vacancy_ids.append(vacancy.id)
+
+        return False
+
     async def _fetch_vacancies(self, page: int = 1) -> HabrVacancyListResponse:
         params = QueryParams({"sort": "date", "type": "all", "page": page})
         response = await self.client.get(self._api_url, params=params)
@@ -7,8 +7,8 @@ class PingResponse(BaseModel):
     status: str = "pong"
 
 
-class TelegramDetailedMessageParams(BaseModel):
-    before: int
+class TelegramMessagesPageParams(BaseModel):
+    before: int | None = None
 
 
 class HabrVacancyPublishedDateSchema(BaseModel):
@@ -1,12 +1,12 @@
 from clients.base import BaseParserClient
-from clients.schemas import PingResponse, TelegramDetailedMessageParams
+from clients.schemas import PingResponse, TelegramMessagesPageParams
 from common.logger import get_logger
 from common.shared.clients.http import limits as http_limits
 from common.shared.decorators.concurency import limit_requests
 from core.config import service_config
 from httpx import URL, AsyncClient
 from parsers import TelegramParser
-from schemas import TelegramChannelMessageSchema
+from schemas import TelegramChannelPageSchema
 
 
 logger = get_logger(__name__)
@@ -28,29 +28,23 @@ class TelegramClient(BaseParserClient):
 
         return PingResponse()
 
-    async def get_newest_message_id(self, channel_username: str) -> int | None:
+    @limit_requests(20)
+    async def get_messages_page(
+        self, channel_username: str, before: int | None = None
+    ) -> TelegramChannelPageSchema | None:
+        """Возвращает страницу превью канала: около 20 сообщений с ID меньше before (или самые новые)."""
         url = f"{self.url}/s/{channel_username}"
-        response = await self.client.get(url)
+        params_model = TelegramMessagesPageParams(before=before)
+
+        response = await self.client.get(url, params=params_model.model_dump(exclude_none=True))
 
         if response.is_redirect:
-            logger.debug("Channel %s is private or does not exist")
+            logger.debug("Channel %s is private or does not exist", channel_username)
             return None
 
         response.raise_for_status()
 
-        return self.parser.parse_message_id(response.text)
-
-    @limit_requests(20)
-    async def get_detailed_message(self, channel_username: str, message_id: int) -> TelegramChannelMessageSchema | None:
-        url = f"{self.url}/s/{channel_username}/{message_id}"
-
-        # +1 т.к. надо подгрузить до переданного message_id
-        params_model = TelegramDetailedMessageParams(before=message_id + 1)
-
-        response = await self.client.get(url, params=params_model.model_dump())
-        response.raise_for_status()
-
-        return self.parser.parse_detailed_message(response.text, channel_username, message_id)
+        return self.parser.parse_messages_page(response.text, channel_username)
 
 
 telegram_client = TelegramClient()
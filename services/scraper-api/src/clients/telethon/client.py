@@ -1,4 +1,5 @@
 from datetime import UTC, datetime
+import time
 
 from clients.telethon.exceptions import TelethonNotAuthorizedError
 from common.logger import get_logger
@@ -6,15 +7,21 @@ from core.config import service_config
 from schemas import TelegramChannelMessageSchema
 from telethon import TelegramClient  # type: ignore[import-untyped]
 from telethon.sessions import StringSession  # type: ignore[import-untyped]
+from telethon.tl.functions.messages import GetHistoryRequest, GetRepliesRequest  # type: ignore[import-untyped]
+from telethon.tl.types import Message, TypeInputPeer  # type: ignore[import-untyped]
 
 
 logger = get_logger(__name__)
 
 
 class TelethonClient:
+    # Максимальный размер страницы истории в MTProto
+    HISTORY_BATCH_SIZE = 100
+
     def __init__(self, client: TelegramClient) -> None:
         self._client = client
         self._is_started = False
+        self._entities: dict[str, tuple[TypeInputPeer, float]] = {}
 
     @property
     def is_available(self) -> bool:
@@ -41,27 +48,69 @@ class TelethonClient:
             self._is_started = False
 
     async def get_detailed_messages(
-        self, date_gte: datetime, channel_username: str, topic_id: int
+        self, date_gte: datetime, channel_username: str, topic_id: int | None, min_id: int = 0
     ) -> list[TelegramChannelMessageSchema]:
-        channel = await self.client.get_entity(channel_username)
+        """Возвращает сообщения канала (или его топика) от новых к старым, не старее date_gte и с ID больше min_id.
+        История читается страницами по HISTORY_BATCH_SIZE сообщений, фильтр min_id применяется на стороне Telegram.
+        """
+        peer = await self._get_input_entity(channel_username)
 
         result: list[TelegramChannelMessageSchema] = []
+        offset_id = 0
+
+        while True:
+            page_params = {
+                "peer": peer,
+                "offset_id": offset_id,
+                "offset_date": None,
+                "add_offset": 0,
+                "limit": self.HISTORY_BATCH_SIZE,
+                "max_id": 0,
+                "min_id": min_id,
+                "hash": 0,
+            }
+            # Сообщения топика - это ответы на его первое сообщение
+            request = (
+                GetRepliesRequest(msg_id=topic_id, **page_params) if topic_id else GetHistoryRequest(**page_params)
+            )
 
-        async for message in self.client.iter_messages(channel, reply_to=topic_id):
-            message_datetime = message.date.astimezone(UTC)
+            batch = (await self.client(request)).messages
+            if not batch:
+                return result
 
-            if message_datetime < date_gte:
-                break
+            for message in batch:
+                if not isinstance(message, Message):
+                    continue
 
-            result.append(
-                TelegramChannelMessageSchema(
-                    id=message.id,
-                    datetime=message_datetime,
-                    text=message.message.strip(),
+                message_datetime = message.date.astimezone(UTC)
+                if message_datetime < date_gte:
+                    return result
+
+                result.append(
+                    TelegramChannelMessageSchema(
+                        id=message.id,
+                        datetime=message_datetime,
+                        text=message.message.strip(),
+                    )
                 )
-            )
 
-        return result
+            # Неполная страница означает, что дошли до min_id или до начала истории
+            if len(batch) < self.HISTORY_BATCH_SIZE:
+                return result
+
+            offset_id = batch[-1].id
+
+    async def _get_input_entity(self, channel_username: str) -> TypeInputPeer:
+        """Разрешает username канала с кешированием, чтобы не тратить запрос к Telegram на каждый вызов."""
+        cached = self._entities.get(channel_username)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        entity = await self.client.get_input_entity(channel_username)
+        self._entities[channel_username] = (entity, time.monotonic() + service_config.telethon_entity_cache_ttl)
+        logger.debug("Resolved telegram entity for channel %s", channel_username)
+
+        return entity
 
 
 telethon_client = TelethonClient(
@@ -1,3 +1,7 @@
+from pathlib import Path
+import tempfile
+
+from core.enums import CacheBackendEnum, HTMLParserBackendEnum
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -5,7 +9,15 @@ class ServiceConfig(BaseSettings):
     telethon_api_id: int
     telethon_api_hash: str
     telethon_session_string: str
+    telethon_entity_cache_ttl: int = 86400  # 1 day
     proxy: str | None = None
+    html_parser: HTMLParserBackendEnum = HTMLParserBackendEnum.SELECTOLAX
+    telegram_batch_concurrency: int = 10
+
+    habr_cache_backend: CacheBackendEnum = CacheBackendEnum.DISK
+    habr_cache_dir: Path = Path(tempfile.gettempdir()) / "scraper-api" / "habr"
+    habr_cache_ttl: int = 604800  # 7 days
+    habr_cache_max_entries: int = 20000
 
     model_config = SettingsConfigDict(env_prefix="SCRAPER_API_")
 
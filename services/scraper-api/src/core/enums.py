@@ -0,0 +1,11 @@
+from enum import StrEnum
+
+
+class HTMLParserBackendEnum(StrEnum):
+    SELECTOLAX = "selectolax"
+    BEAUTIFULSOUP = "beautifulsoup"
+
+
+class CacheBackendEnum(StrEnum):
+    DISK = "disk"
+    REDIS = "redis"
@@ -1,9 +1,13 @@
 from datetime import UTC, datetime
+import re
 
-from bs4 import BeautifulSoup
 from common.logger import get_logger
+from core.enums import HTMLParserBackendEnum
 from parsers import BaseParser
 from parsers.exceptions import ParserBlockNotFoundError
+from parsers.html import parse_html
+from parsers.schemas import HabrStateSchema
+from pydantic import ValidationError
 from schemas import HabrDetailedVacancySchema
 
 
@@ -14,9 +18,67 @@ logger = get_logger(__name__)
 
 
 class HabrParser(BaseParser):
-    @staticmethod
-    def parse_detailed_vacancy(html_content: str, vacancy_id: int) -> HabrDetailedVacancySchema:
-        soup = BeautifulSoup(html_content, "html.parser")
+    # Скрипт с состоянием ищется регуляркой, чтобы не разбирать DOM всей страницы
+    SSR_STATE_PATTERN = re.compile(r"<script[^>]*\bdata-ssr-state\b[^>]*>(.*?)</script>", re.DOTALL)
+
+    @classmethod
+    def parse_detailed_vacancy(
+        cls,
+        html_content: str,
+        vacancy_id: int,
+        backend: HTMLParserBackendEnum | None = None,
+        *,
+        use_ssr_state: bool = True,
+    ) -> HabrDetailedVacancySchema:
+        """Разбирает страницу вакансии. Сначала данные читаются из встроенного в страницу JSON-состояния,
+        а если его нет или формат изменился, то из DOM.
+        """
+        if use_ssr_state:
+            vacancy = cls._parse_ssr_state(html_content, vacancy_id, backend)
+            if vacancy is not None:
+                return vacancy
+
+        return cls._parse_dom(html_content, vacancy_id, backend)
+
+    @classmethod
+    def _parse_ssr_state(
+        cls, html_content: str, vacancy_id: int, backend: HTMLParserBackendEnum | None
+    ) -> HabrDetailedVacancySchema | None:
+        match = cls.SSR_STATE_PATTERN.search(html_content)
+        if match is None:
+            logger.info("SSR state not found for vacancy %s, falling back to DOM", vacancy_id)
+            return None
+
+        try:
+            state = HabrStateSchema.model_validate_json(match.group(1))
+        except ValidationError as e:
+            logger.warning("Unexpected SSR state for vacancy %s, falling back to DOM: %s", vacancy_id, e)
+            return None
+
+        vacancy_state = state.vacancy
+        company = vacancy_state.company or state.company
+        if company is None:
+            logger.warning("Company not found in SSR state for vacancy %s, falling back to DOM", vacancy_id)
+            return None
+
+        company_description = (
+            parse_html(company.description, backend).get_text(strip=True) if company.description else None
+        )
+        description = parse_html(vacancy_state.description, backend).get_text(strip=True, separator="\n")
+        skills = [skill.title for skill in vacancy_state.skills]
+
+        return HabrDetailedVacancySchema(
+            id=vacancy_id,
+            text=cls._build_text(company.title, company_description, description, skills),
+            datetime=vacancy_state.published_date.date.astimezone(UTC),
+            skills=skills,
+        )
+
+    @classmethod
+    def _parse_dom(
+        cls, html_content: str, vacancy_id: int, backend: HTMLParserBackendEnum | None
+    ) -> HabrDetailedVacancySchema:
+        soup = parse_html(html_content, backend)
 
         company_name_block = soup.select_one("div.company_name")
         if company_name_block is None:
@@ -25,37 +87,49 @@ class HabrParser(BaseParser):
         # Не у каждой компании есть этот блок
         company_description_block = soup.select_one("div.company_about")
 
-        description_block = soup.select_one("article.vacancy-show")
-        if description_block is None:
+        vacancy_block = soup.select_one("article.vacancy-show")
+        if vacancy_block is None:
             raise ParserBlockNotFoundError
 
-        blocks_to_remove = [
-            "div.vacancy-company__footer",
-            "div.similar_vacancies",
-            "div.mq-mobile-only",
-            "div.opposing-items",
-        ]
+        # Похожие вакансии лежат внутри статьи и тоже ссылаются на навыки
+        similar_vacancies_block = vacancy_block.select_one("div.similar_vacancies")
+        if similar_vacancies_block:
+            similar_vacancies_block.decompose()
+
+        description_block = vacancy_block.select_one("div.vacancy-description__text")
+        if description_block is None:
+            raise ParserBlockNotFoundError
 
-        for block in blocks_to_remove:
-            item = description_block.select_one(block)
-            if item:
-                item.decompose()
-            else:
-                logger.info("Block %s not found", block)
+        skill_links = vacancy_block.select('a[href*="skills[]="]')
+        skills = list(dict.fromkeys(link.get_text(strip=True) for link in skill_links))
 
         time_tag = soup.select_one("div.vacancy-header__date time")
         if time_tag is None:
             raise ParserBlockNotFoundError
 
-        iso_str = str(time_tag["datetime"])  # '2025-09-28T12:27:09+03:00'
+        iso_str = str(time_tag.get_attribute("datetime"))  # '2025-09-28T12:27:09+03:00'
 
         dt_local = datetime.fromisoformat(iso_str)
         dt_utc = dt_local.astimezone(UTC)
 
-        text = f"Название компании: {company_name_block.get_text(strip=True)}\n"
-        if company_description_block:
-            text += f"Информация о компании: {company_description_block.get_text(strip=True)}\n"
+        text = cls._build_text(
+            company_name_block.get_text(strip=True),
+            company_description_block.get_text(strip=True) if company_description_block else None,
+            description_block.get_text(strip=True, separator="\n"),
+            skills,
+        )
+
+        return HabrDetailedVacancySchema(id=vacancy_id, text=text, datetime=dt_utc, skills=skills)
+
+    @staticmethod
+    def _build_text(company_name: str, company_description: str | None, description: str, skills: list[str]) -> str:
+        """Собирает текст вакансии из одинакового набора разделов для разбора SSR-состояния и DOM."""
+        text = f"Название компании: {company_name}\n"
+        if company_description:
+            text += f"Информация о компании: {company_description}\n"
 
-        text += f"Описание вакансии: {description_block.get_text(strip=True, separator='\n')}"
+        text += f"Описание вакансии: {description}"
+        if skills:
+            text += f"\nНавыки: {', '.join(skills)}"
 
-        return HabrDetailedVacancySchema(id=vacancy_id, text=text, datetime=dt_utc)
+        return text
@@ -0,0 +1,19 @@
+from core.config import service_config
+from core.enums import HTMLParserBackendEnum
+from parsers.html.base import HTMLNode
+from parsers.html.lexbor import SelectolaxNode
+from parsers.html.soup import SoupNode
+
+
+__all__ = ["HTMLNode", "parse_html"]
+
+
+_backends: dict[HTMLParserBackendEnum, type[HTMLNode]] = {
+    HTMLParserBackendEnum.SELECTOLAX: SelectolaxNode,
+    HTMLParserBackendEnum.BEAUTIFULSOUP: SoupNode,
+}
+
+
+def parse_html(html_content: str, backend: HTMLParserBackendEnum | None = None) -> HTMLNode:
+    """Разбирает HTML бэкендом из настроек (или явно переданным) и возвращает корневой узел."""
+    return _backends[backend or service_config.html_parser].from_html(html_content)
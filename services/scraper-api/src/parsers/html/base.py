@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import Self
+
+
+class HTMLNode(ABC):
+    """Минимальный интерфейс узла HTML, через который парсеры работают с любым бэкендом.
+    Семантика методов повторяет BeautifulSoup, чтобы бэкенды давали одинаковый результат.
+    """
+
+    @classmethod
+    @abstractmethod
+    def from_html(cls, html_content: str) -> Self:
+        """Разбирает документ и возвращает его корневой узел."""
+
+    @abstractmethod
+    def select_one(self, selector: str) -> Self | None:
+        """Первый потомок, подходящий под CSS-селектор."""
+
+    @abstractmethod
+    def select(self, selector: str) -> list[Self]:
+        """Все потомки, подходящие под CSS-селектор."""
+
+    @abstractmethod
+    def get_attribute(self, name: str) -> str | None:
+        """Значение атрибута или None, если атрибута нет."""
+
+    @abstractmethod
+    def get_text(self, separator: str = "", *, strip: bool = False) -> str:
+        """Текст всех потомков, как `Tag.get_text` в BeautifulSoup."""
+
+    @abstractmethod
+    def decompose(self) -> None:
+        """Удаляет узел вместе с потомками из документа."""
+
+    @abstractmethod
+    def replace_line_breaks(self) -> None:
+        """Заменяет все `<br>` внутри узла переводами строки."""
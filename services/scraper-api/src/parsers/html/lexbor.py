@@ -0,0 +1,71 @@
+from collections.abc import Iterator
+from typing import Self
+
+from parsers.html.base import HTMLNode
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+
+__all__ = ["SelectolaxNode"]
+
+
+# Текст этих тегов BeautifulSoup не включает в get_text
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+# Внутри этих тегов BeautifulSoup не схлопывает пробельные строки
+_PRESERVE_WHITESPACE_TAGS = frozenset({"pre", "textarea"})
+_ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+
+
+class SelectolaxNode(HTMLNode):
+    """Бэкенд на selectolax (lexbor): разбор и CSS-селекторы выполняются в C."""
+
+    def __init__(self, node: LexborNode) -> None:
+        self._node = node
+
+    @classmethod
+    def from_html(cls, html_content: str) -> Self:
+        return cls(LexborHTMLParser(html_content).root)  # type: ignore[arg-type]
+
+    def select_one(self, selector: str) -> Self | None:
+        node = self._node.css_first(selector)
+        return None if node is None else type(self)(node)
+
+    def select(self, selector: str) -> list[Self]:
+        return [type(self)(node) for node in self._node.css(selector)]
+
+    def get_attribute(self, name: str) -> str | None:
+        return self._node.attributes.get(name)
+
+    def get_text(self, separator: str = "", *, strip: bool = False) -> str:
+        strings = self._iter_strings()
+        if strip:
+            strings = (string for s in strings if (string := s.strip()))
+
+        return separator.join(strings)
+
+    def decompose(self) -> None:
+        self._node.decompose()
+
+    def replace_line_breaks(self) -> None:
+        for br in self._node.css("br"):
+            br.replace_with("\n")
+
+    def _iter_strings(self) -> Iterator[str]:
+        for node in self._node.traverse(include_text=True):
+            if not node.is_text_node or node.parent is None or node.parent.tag in _NON_TEXT_TAGS:
+                continue
+
+            text = node.text_content or ""
+            # BeautifulSoup схлопывает строки из одних пробелов до одного пробела или перевода строки
+            if text and not text.strip(_ASCII_SPACES) and not self._preserves_whitespace(node):
+                text = "\n" if "\n" in text else " "
+
+            yield text
+
+    def _preserves_whitespace(self, node: LexborNode) -> bool:
+        parent = node.parent
+        while parent is not None and parent.mem_id != self._node.mem_id:
+            if parent.tag in _PRESERVE_WHITESPACE_TAGS:
+                return True
+            parent = parent.parent
+
+        return False
@@ -0,0 +1,42 @@
+from typing import Self
+
+from bs4 import BeautifulSoup, Tag
+from parsers.html.base import HTMLNode
+
+
+__all__ = ["SoupNode"]
+
+
+class SoupNode(HTMLNode):
+    """Бэкенд на BeautifulSoup со встроенным `html.parser`. Медленный, но эталонный."""
+
+    def __init__(self, tag: Tag) -> None:
+        self._tag = tag
+
+    @classmethod
+    def from_html(cls, html_content: str) -> Self:
+        return cls(BeautifulSoup(html_content, "html.parser"))
+
+    def select_one(self, selector: str) -> Self | None:
+        tag = self._tag.select_one(selector)
+        return None if tag is None else type(self)(tag)
+
+    def select(self, selector: str) -> list[Self]:
+        return [type(self)(tag) for tag in self._tag.select(selector)]
+
+    def get_attribute(self, name: str) -> str | None:
+        value = self._tag.get(name)
+        if value is None:
+            return None
+
+        return value if isinstance(value, str) else " ".join(value)
+
+    def get_text(self, separator: str = "", *, strip: bool = False) -> str:
+        return self._tag.get_text(separator, strip=strip)
+
+    def decompose(self) -> None:
+        self._tag.decompose()
+
+    def replace_line_breaks(self) -> None:
+        for br in self._tag.find_all("br"):
+            br.replace_with("\n")
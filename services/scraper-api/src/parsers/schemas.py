@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from pydantic import AliasChoices, BaseModel, Field
+
+
+__all__ = ["HabrStateSchema"]
+
+
+class HabrStateDateSchema(BaseModel):
+    date: datetime
+
+
+class HabrStateSkillSchema(BaseModel):
+    title: str
+
+
+class HabrStateCompanySchema(BaseModel):
+    title: str
+    description: str | None = Field(None, validation_alias=AliasChoices("aboutHtml", "about", "description"))
+
+
+class HabrStateVacancySchema(BaseModel):
+    id: int
+    description: str = Field(validation_alias=AliasChoices("descriptionHtml", "description"))
+    published_date: HabrStateDateSchema = Field(alias="publishedDate")
+    company: HabrStateCompanySchema | None = None
+    skills: list[HabrStateSkillSchema] = []
+
+
+class HabrStateSchema(BaseModel):
+    """Состояние страницы вакансии, которое Habr встраивает в HTML для гидрации SSR."""
+
+    vacancy: HabrStateVacancySchema
+    company: HabrStateCompanySchema | None = None
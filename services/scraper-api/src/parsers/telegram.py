@@ -1,52 +1,49 @@
 from datetime import datetime
 
-from bs4 import BeautifulSoup
 from common.logger import get_logger
+from core.enums import HTMLParserBackendEnum
 from parsers import BaseParser
-from schemas import TelegramChannelMessageSchema
+from parsers.html import HTMLNode, parse_html
+from schemas import TelegramChannelMessageSchema, TelegramChannelPageSchema
 
 
 logger = get_logger(__name__)
 
 
 class TelegramParser(BaseParser):
-    @staticmethod
-    def parse_message_id(html_content: str) -> int:
-        soup = BeautifulSoup(html_content, "html.parser")
-        last_message_widget = soup.select("div.tgme_widget_message")[-1]
-        data_post = last_message_widget.attrs["data-post"]
+    @classmethod
+    def parse_messages_page(
+        cls, html_content: str, channel_username: str, backend: HTMLParserBackendEnum | None = None
+    ) -> TelegramChannelPageSchema:
+        """Разбирает все сообщения со страницы превью канала `t.me/s/<channel>`."""
+        soup = parse_html(html_content, backend)
+        data_post_prefix = f"{channel_username}/".lower()
 
-        return int(str(data_post).split("/")[-1])
+        message_ids: list[int] = []
+        messages: list[TelegramChannelMessageSchema] = []
+        for message_block in soup.select("div.tgme_widget_message"):
+            data_post = str(message_block.get_attribute("data-post")).lower()
+            if not data_post.startswith(data_post_prefix):
+                logger.error("Data-post value mismatch. Expected %s<id>, got %s", data_post_prefix, data_post)
+                continue
 
-    @staticmethod
-    def parse_detailed_message(
-        html_content: str, channel_username: str, message_id: int
-    ) -> TelegramChannelMessageSchema | None:
-        soup = BeautifulSoup(html_content, "html.parser")
-        data_post_value = f"{channel_username}/{message_id}".lower()
-
-        message_block = soup.find(
-            "div",
-            class_="tgme_widget_message",
-            attrs={
-                "data-post": lambda v: bool(v) and str(v).lower() == data_post_value,
-            },
-        )
-        if message_block is None:
-            # Если сообщение удалено
-            logger.debug("Message with id %s was deleted", message_id)
-            return None
+            message_id = int(data_post.removeprefix(data_post_prefix))
+            message_ids.append(message_id)
 
-        data_post = str(message_block.attrs.get("data-post")).lower()
-        if data_post != data_post_value:
-            logger.error(
-                "Data-post value mismatch for message with id %s. Expected %s, got %s",
-                message_id,
-                data_post_value,
-                data_post,
-            )
-            return None
+            message = cls._parse_message_block(message_block, message_id)
+            if message is not None:
+                messages.append(message)
 
+        messages.sort(key=lambda message: message.id, reverse=True)
+
+        return TelegramChannelPageSchema(
+            messages=messages,
+            min_message_id=min(message_ids, default=None),
+            max_message_id=max(message_ids, default=None),
+        )
+
+    @staticmethod
+    def _parse_message_block(message_block: HTMLNode, message_id: int) -> TelegramChannelMessageSchema | None:
         is_not_supported_message = message_block.select_one("div.message_media_not_supported")
         # Сообщение не поддерживается: Please open Telegram to view this post
         if is_not_supported_message is not None:
@@ -64,11 +61,10 @@ class TelegramParser(BaseParser):
             logger.warning("Message time not found for message with id %s", message_id)
             return None
 
-        message_datetime_str = str(message_time_block.attrs["datetime"])
+        message_datetime_str = str(message_time_block.get_attribute("datetime"))
         message_datetime = datetime.fromisoformat(message_datetime_str)
 
-        for br in message_text_block.find_all("br"):
-            br.replace_with("\n")
+        message_text_block.replace_line_breaks()
 
         return TelegramChannelMessageSchema(
             id=message_id,
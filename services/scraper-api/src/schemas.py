@@ -31,7 +31,15 @@ class TelegramChannelMessageSchema(BaseModel):
     text: str
 
 
+class TelegramChannelPageSchema(BaseModel):
+    messages: list[TelegramChannelMessageSchema]
+    # Границы ID учитывают и сообщения без текста, чтобы по ним можно было листать страницы
+    min_message_id: int | None
+    max_message_id: int | None
+
+
 class HabrDetailedVacancySchema(BaseModel):
     id: int
     datetime: datetime
     text: str
+    skills: list[str] = []
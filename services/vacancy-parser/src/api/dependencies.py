@@ -4,10 +4,10 @@ from typing import Annotated
 from fastapi import Depends
 from unitofwork import UnitOfWork
 
-from services import VacancyService
+from services import ParserRunService, VacancyService
 
 
-__all__ = ["get_vacancy_service"]
+__all__ = ["get_parser_run_service", "get_vacancy_service"]
 
 
 async def _get_uow_session() -> AsyncGenerator[UnitOfWork]:
@@ -22,3 +22,10 @@ def get_vacancy_service(
 ) -> VacancyService:
     """FastAPI зависимость для получения экземпляра сервиса VacancyService."""
     return VacancyService(uow)
+
+
+def get_parser_run_service(
+    uow: Annotated[UnitOfWork, Depends(_get_uow_session)],
+) -> ParserRunService:
+    """FastAPI зависимость для получения экземпляра сервиса ParserRunService."""
+    return ParserRunService(uow)
@@ -1,4 +1,4 @@
-from api.v1 import vacancies
+from api.v1 import parser_runs, vacancies
 from fastapi import APIRouter
 
 
@@ -7,3 +7,4 @@ __all__ = ["router"]
 
 router = APIRouter()
 router.include_router(vacancies.router)
+router.include_router(parser_runs.router)
@@ -0,0 +1,36 @@
+from datetime import timedelta
+from typing import Annotated
+
+from api.dependencies import get_parser_run_service
+from api.v1.schemas import ParserRunListResponse, ParserRunsListQuery, ParserRunsStatsQuery, ParserRunsStatsResponse
+from fastapi import APIRouter, Depends, Query
+
+from services import ParserRunService
+
+
+__all__ = ["router"]
+
+
+router = APIRouter()
+
+
+@router.get("/parser-runs")
+async def get_parser_runs(
+    query: Annotated[ParserRunsListQuery, Query()],
+    service: Annotated[ParserRunService, Depends(get_parser_run_service)],
+) -> ParserRunListResponse:
+    """Возвращает последние запуски парсеров, от новых к старым."""
+    runs = await service.get_recent_runs(query.limit, query.source, query.scope)
+
+    return ParserRunListResponse(runs=runs)
+
+
+@router.get("/parser-runs/stats")
+async def get_parser_runs_stats(
+    query: Annotated[ParserRunsStatsQuery, Query()],
+    service: Annotated[ParserRunService, Depends(get_parser_run_service)],
+) -> ParserRunsStatsResponse:
+    """Сводка запусков по частям источников за последние `hours` часов: пропускная способность, задержки и трафик."""
+    sources = await service.get_sources_stats(timedelta(hours=query.hours))
+
+    return ParserRunsStatsResponse(sources=sources)
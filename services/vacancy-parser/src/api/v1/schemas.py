@@ -1,9 +1,24 @@
-from pydantic import BaseModel, ConfigDict, Field
+from datetime import datetime
+from typing import Any, Self
+
+from core.enums import VacancyExportFieldEnum
+from database.models.enums import SourceEnum
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from schemas.parser_run import ParserRunRead, ParserSourceStats
 from schemas.vacancy.vacancy import VacancyRead
 
 
 __all__ = [
+    "ParserRunListResponse",
+    "ParserRunsListQuery",
+    "ParserRunsStatsQuery",
+    "ParserRunsStatsResponse",
+    "VacanciesExportQuery",
     "VacanciesListQuery",
+    "VacancyClaimBody",
+    "VacancyClaimResponse",
+    "VacancyLeaseBody",
+    "VacancyLeaseRenewResponse",
     "VacancyListResponse",
     "VacancyProcessedBody",
     "VacancyProcessedResponse",
@@ -20,6 +35,53 @@ class VacanciesListQuery(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
+class VacanciesExportQuery(BaseModel):
+    limit: int = Field(default=1000, ge=1, le=10000, description="Лимит вакансий")
+    fields: list[VacancyExportFieldEnum] = Field(
+        default=[
+            VacancyExportFieldEnum.ID,
+            VacancyExportFieldEnum.SOURCE,
+            VacancyExportFieldEnum.HASH,
+            VacancyExportFieldEnum.LINK,
+            VacancyExportFieldEnum.DATA,
+            VacancyExportFieldEnum.PUBLISHED_AT,
+        ],
+        description="Выгружаемые поля через запятую. Поля курсора (published_at, id) выгружаются всегда",
+    )
+    before_published_at: datetime | None = Field(default=None, description="Дата публикации из курсора")
+    before_id: int | None = Field(default=None, description="ID вакансии из курсора")
+
+    model_config = ConfigDict(extra="forbid")
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def split_fields(cls, value: Any) -> Any:
+        """Принимает как `fields=hash,link`, так и `fields=hash&fields=link`."""
+        if isinstance(value, str):
+            value = [value]
+        if isinstance(value, list):
+            return [field.strip() for item in value for field in str(item).split(",") if field.strip()]
+        return value
+
+    @field_validator("fields")
+    @classmethod
+    def add_cursor_fields(cls, value: list[VacancyExportFieldEnum]) -> list[VacancyExportFieldEnum]:
+        cursor_fields = [VacancyExportFieldEnum.PUBLISHED_AT, VacancyExportFieldEnum.ID]
+        return list(dict.fromkeys([*value, *cursor_fields]))
+
+    @model_validator(mode="after")
+    def validate_cursor(self) -> Self:
+        if (self.before_published_at is None) != (self.before_id is None):
+            raise ValueError("before_published_at and before_id must be passed together")
+        return self
+
+    @property
+    def before(self) -> tuple[datetime, int] | None:
+        if self.before_published_at is None or self.before_id is None:
+            return None
+        return self.before_published_at, self.before_id
+
+
 class VacancyListResponse(BaseModel):
     vacancies: list[VacancySchema]
 
@@ -32,3 +94,52 @@ class VacancyProcessedBody(BaseModel):
 
 class VacancyProcessedResponse(BaseModel):
     count: int
+
+
+class VacancyClaimBody(BaseModel):
+    worker_id: str = Field(max_length=64, description="Идентификатор воркера обработчика")
+    limit: int = Field(default=100, ge=1, le=1000, description="Лимит вакансий")
+    hashes: list[str] | None = Field(default=None, description="Взять только вакансии с этими хешами")
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class VacancyClaimResponse(BaseModel):
+    vacancies: list[VacancySchema]
+    lease_ttl: int = Field(description="Срок аренды в секундах, за который ее нужно продлить или подтвердить")
+
+
+class VacancyLeaseBody(BaseModel):
+    worker_id: str = Field(max_length=64, description="Идентификатор воркера обработчика")
+    hashes: list[str] = Field(description="Хеши вакансий")
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class VacancyLeaseRenewResponse(BaseModel):
+    hashes: list[str] = Field(description="Хеши вакансий, аренда которых продлена")
+    lease_ttl: int
+
+
+class ParserRunsListQuery(BaseModel):
+    limit: int = Field(default=50, ge=1, le=1000, description="Лимит запусков")
+    source: SourceEnum | None = Field(default=None, description="Источник вакансий")
+    scope: str | None = Field(
+        default=None, max_length=32, description="Часть источника, например группа каналов Telegram"
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class ParserRunListResponse(BaseModel):
+    runs: list[ParserRunRead]
+
+
+class ParserRunsStatsQuery(BaseModel):
+    hours: int = Field(default=24, ge=1, le=24 * 90, description="Период сводки в часах")
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class ParserRunsStatsResponse(BaseModel):
+    sources: list[ParserSourceStats]
@@ -1,8 +1,22 @@
-from typing import Annotated
+from collections.abc import AsyncIterator
+from typing import Annotated, Any
 
 from api.dependencies import get_vacancy_service
-from api.v1.schemas import VacanciesListQuery, VacancyListResponse, VacancyProcessedBody, VacancyProcessedResponse
+from api.v1.schemas import (
+    VacanciesExportQuery,
+    VacanciesListQuery,
+    VacancyClaimBody,
+    VacancyClaimResponse,
+    VacancyLeaseBody,
+    VacancyLeaseRenewResponse,
+    VacancyListResponse,
+    VacancyProcessedBody,
+    VacancyProcessedResponse,
+)
+from core import service_config
 from fastapi import APIRouter, Body, Depends, Query
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 from services import VacancyService
 
@@ -12,6 +26,8 @@ __all__ = ["router"]
 
 router = APIRouter()
 
+_row_adapter = TypeAdapter(dict[str, Any])
+
 
 @router.get("/vacancies")
 async def get_vacancies(
@@ -24,6 +40,19 @@ async def get_vacancies(
     return VacancyListResponse(vacancies=vacancies)
 
 
+@router.get("/vacancies/export")
+async def export_vacancies(
+    query: Annotated[VacanciesExportQuery, Query()],
+    service: Annotated[VacancyService, Depends(get_vacancy_service)],
+) -> StreamingResponse:
+    """Выгружает необработанные вакансии в NDJSON от новых к старым: по строке на вакансию.
+    Следующая страница запрашивается с `published_at` и `id` последней полученной вакансии.
+    """
+    vacancies = service.stream_unprocessed_vacancies(query.fields, query.limit, query.before)
+
+    return StreamingResponse(_dump_ndjson(vacancies), media_type="application/x-ndjson")
+
+
 @router.post("/vacancies/mark-processed")
 async def mark_vacancies_as_processed(
     data: Annotated[VacancyProcessedBody, Body()],
@@ -32,3 +61,42 @@ async def mark_vacancies_as_processed(
     await service.mark_vacancies_as_processed(data.hashes)
 
     return VacancyProcessedResponse(count=len(data.hashes))
+
+
+@router.post("/vacancies/claim")
+async def claim_vacancies(
+    data: Annotated[VacancyClaimBody, Body()],
+    service: Annotated[VacancyService, Depends(get_vacancy_service)],
+) -> VacancyClaimResponse:
+    """Закрепляет за воркером пачку необработанных вакансий.
+    Пока аренда не истекла, эти вакансии не выдаются другим воркерам.
+    """
+    vacancies = await service.claim_vacancies(data.worker_id, data.limit, data.hashes)
+
+    return VacancyClaimResponse(vacancies=vacancies, lease_ttl=service_config.claim_lease_ttl)
+
+
+@router.post("/vacancies/claim/renew")
+async def renew_vacancies_leases(
+    data: Annotated[VacancyLeaseBody, Body()],
+    service: Annotated[VacancyService, Depends(get_vacancy_service)],
+) -> VacancyLeaseRenewResponse:
+    hashes = await service.renew_vacancies_leases(data.worker_id, data.hashes)
+
+    return VacancyLeaseRenewResponse(hashes=hashes, lease_ttl=service_config.claim_lease_ttl)
+
+
+@router.post("/vacancies/claim/ack")
+async def ack_vacancies(
+    data: Annotated[VacancyLeaseBody, Body()],
+    service: Annotated[VacancyService, Depends(get_vacancy_service)],
+) -> VacancyProcessedResponse:
+    """Подтверждает обработку вакансий воркером: они помечаются обработанными."""
+    hashes = await service.ack_vacancies(data.worker_id, data.hashes)
+
+    return VacancyProcessedResponse(count=len(hashes))
+
+
+async def _dump_ndjson(rows: AsyncIterator[dict[str, Any]]) -> AsyncIterator[bytes]:
+    async for row in rows:
+        yield _row_adapter.dump_json(row) + b"\n"
@@ -0,0 +1,145 @@
+"""Сравнение способов массовой вставки вакансий с joined-table наследованием.
+
+Синтетические вакансии Habr вставляются через ORM (`session.add_all`), многострочным INSERT ... RETURNING
+и через COPY. Каждая пачка вставляется в отдельной транзакции, которая затем откатывается,
+поэтому данные в БД не меняются.
+
+Перед замерами проверяется идемпотентная вставка: пачка, совпадающая с уже вставленными вакансиями
+не по хешу, а по хешу содержимого или ссылке, должна быть пропущена целиком, а не падать с IntegrityError.
+
+Запуск из каталога src:
+    python -m benchmarks.bulk_insert --batches 20 --batch-size 500
+"""
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+import random
+import time
+
+from common.database.bulk import bulk_insert_joined
+from common.database.engine import async_session_factory
+from common.database.enums import BulkInsertMethodEnum
+from common.logger import get_logger
+from database.models import HabrVacancy
+from schemas.vacancy import HabrVacancyCreate
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+logger = get_logger(__name__)
+
+
+type InsertFunc = Callable[[AsyncSession, list[HabrVacancyCreate]], Awaitable[None]]
+
+
+def generate_vacancies(count: int, rng: random.Random) -> list[HabrVacancyCreate]:
+    """Генерирует вакансии с уникальными external_id вне диапазона реальных вакансий Habr."""
+    vacancies = []
+    for _ in range(count):
+        external_id = rng.randrange(10**12, 10**13)
+        words = " ".join(f"word{rng.randrange(10_000)}" for _ in range(50))
+        vacancies.append(make_vacancy(external_id, words, f"https://career.habr.com/vacancies/{external_id}"))
+
+    return vacancies
+
+
+def make_vacancy(external_id: int, text: str, link: str) -> HabrVacancyCreate:
+    return HabrVacancyCreate(
+        data=text,
+        fingerprint=text,
+        link=link,
+        published_at=datetime.now(tz=UTC),
+        external_id=external_id,
+    )
+
+
+async def check_skip_conflicts(method: BulkInsertMethodEnum, rng: random.Random) -> None:
+    """Вставляет пачку, а затем пачку с другими хешами, но тем же содержимым или той же ссылкой.
+    Вторая пачка должна быть пропущена целиком.
+    """
+    originals = generate_vacancies(10, rng)
+    fresh = generate_vacancies(len(originals), rng)
+    collisions = [
+        # Тот же текст, то есть тот же content_hash
+        *(
+            make_vacancy(new.external_id, old.data, str(new.link))
+            for old, new in zip(originals[:5], fresh[:5], strict=True)
+        ),
+        # Та же ссылка
+        *(
+            make_vacancy(new.external_id, new.data, str(old.link))
+            for old, new in zip(originals[5:], fresh[5:], strict=True)
+        ),
+    ]
+
+    async with async_session_factory() as session:
+        await bulk_insert_joined(session, HabrVacancy, originals, method=method, unique_column="hash")
+        ids = await bulk_insert_joined(session, HabrVacancy, collisions, method=method, unique_column="hash")
+        await session.rollback()
+
+    inserted = sum(pk is not None for pk in ids)
+    if inserted:
+        raise AssertionError(f"{method}: inserted {inserted} of {len(collisions)} colliding vacancies")
+    logger.info("%s: skipped all %d vacancies colliding on content_hash or link", method, len(collisions))
+
+
+async def insert_orm(session: AsyncSession, vacancies: list[HabrVacancyCreate]) -> None:
+    session.add_all([HabrVacancy(**v.model_dump()) for v in vacancies])
+    await session.flush()
+
+
+async def insert_multirow(session: AsyncSession, vacancies: list[HabrVacancyCreate]) -> None:
+    await bulk_insert_joined(session, HabrVacancy, vacancies, method=BulkInsertMethodEnum.INSERT)
+
+
+async def insert_copy(session: AsyncSession, vacancies: list[HabrVacancyCreate]) -> None:
+    await bulk_insert_joined(session, HabrVacancy, vacancies, method=BulkInsertMethodEnum.COPY)
+
+
+async def measure(name: str, insert: InsertFunc, batches: list[list[HabrVacancyCreate]]) -> None:
+    durations = []
+    for vacancies in batches:
+        async with async_session_factory() as session:
+            started_at = time.perf_counter()
+            await insert(session, vacancies)
+            durations.append(time.perf_counter() - started_at)
+            await session.rollback()
+
+    durations.sort()
+    rows = sum(len(vacancies) for vacancies in batches)
+    logger.info(
+        "%s: batch_p50=%.1fms batch_max=%.1fms total=%.2fs rows_per_sec=%.0f",
+        name,
+        durations[len(durations) // 2] * 1000,
+        durations[-1] * 1000,
+        sum(durations),
+        rows / sum(durations),
+    )
+
+
+async def run(batches_count: int, batch_size: int, seed: int) -> None:
+    rng = random.Random(seed)  # noqa: S311
+    batches = [generate_vacancies(batch_size, rng) for _ in range(batches_count)]
+    for method in BulkInsertMethodEnum:
+        await check_skip_conflicts(method, rng)
+
+    logger.info("Inserting %d batches of %d vacancies", batches_count, batch_size)
+
+    await measure("orm", insert_orm, batches)
+    await measure("multirow_insert", insert_multirow, batches)
+    await measure("copy", insert_copy, batches)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batches", type=int, default=20, help="Количество пачек")
+    parser.add_argument("--batch-size", type=int, default=500, help="Количество вакансий в пачке")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.batches, args.batch_size, args.seed))
+
+
+if __name__ == "__main__":
+    main()
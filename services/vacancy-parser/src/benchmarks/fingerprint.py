@@ -0,0 +1,119 @@
+"""Сравнение поиска дубликатов вакансий через pg_trgm и через SimHash.
+
+Уже сохраненные вакансии переигрываются как новые: в каждом fingerprint часть слов
+заменяется, после чего дубликат ищется обоими способами. Полнота — доля вакансий,
+для которых найдена исходная вакансия.
+
+Запуск из каталога src:
+    python -m benchmarks.fingerprint --sample 1000 --mutation 0.1
+"""
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import random
+import time
+from typing import cast
+
+from common.database.engine import async_session_factory
+from common.logger import get_logger
+from database.models import Vacancy
+from repositories import VacancyRepository
+from sqlalchemy import func, select
+from utils import generate_content_hash, generate_simhash
+
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    found: int = 0
+    found_original: int = 0
+    durations: list[float] = field(default_factory=list)
+
+    def report(self, total: int) -> None:
+        durations = sorted(self.durations)
+        logger.info(
+            "%s: recall=%.3f found_any=%.3f batch_p50=%.1fms batch_max=%.1fms total=%.2fs",
+            self.name,
+            self.found_original / total,
+            self.found / total,
+            durations[len(durations) // 2] * 1000,
+            durations[-1] * 1000,
+            sum(durations),
+        )
+
+
+def mutate_fingerprint(fingerprint: str, mutation: float, rng: random.Random) -> str:
+    """Заменяет долю слов fingerprint случайными, имитируя перепост вакансии с правками."""
+    words = fingerprint.split()
+    for index in rng.sample(range(len(words)), k=int(len(words) * mutation)):
+        words[index] = f"mutated{rng.randrange(1_000_000)}"
+
+    return " ".join(sorted(words))
+
+
+async def run(sample: int, mutation: float, batch_size: int, seed: int) -> None:  # noqa: PLR0914
+    rng = random.Random(seed)  # noqa: S311
+
+    async with async_session_factory() as session:
+        # У очищенных вакансий отпечатка нет, сравнивать их не с чем
+        stmt = (
+            select(Vacancy.hash, Vacancy.fingerprint)
+            .where(Vacancy.fingerprint.is_not(None))
+            .order_by(func.random())
+            .limit(sample)
+        )
+        corpus = (await session.execute(stmt)).tuples().all()
+        if not corpus:
+            logger.warning("No vacancies to replay")
+            return
+
+        repo = VacancyRepository(session)
+        replayed = [(vacancy_hash, mutate_fingerprint(cast("str", fp), mutation, rng)) for vacancy_hash, fp in corpus]
+
+        trigram = BenchmarkResult("trigram")
+        simhash = BenchmarkResult("simhash")
+
+        for start in range(0, len(replayed), batch_size):
+            batch = replayed[start : start + batch_size]
+            fingerprints = [fp for _, fp in batch]
+            content_hashes = [generate_content_hash(fp) for fp in fingerprints]
+            simhashes = [generate_simhash(fp) for fp in fingerprints]
+
+            started_at = time.perf_counter()
+            trigram_duplicates = await repo.find_duplicate_vacancy_hashes_by_fingerprints(fingerprints)
+            trigram.durations.append(time.perf_counter() - started_at)
+
+            started_at = time.perf_counter()
+            simhash_duplicates = await repo.find_duplicate_vacancy_hashes_by_simhashes(content_hashes, simhashes)
+            simhash.durations.append(time.perf_counter() - started_at)
+
+            for (original_hash, fp), content_hash in zip(batch, content_hashes, strict=True):
+                trigram_hash = trigram_duplicates.get(fp)
+                simhash_hash = simhash_duplicates.get(content_hash)
+                trigram.found += trigram_hash is not None
+                trigram.found_original += trigram_hash == original_hash
+                simhash.found += simhash_hash is not None
+                simhash.found_original += simhash_hash == original_hash
+
+        logger.info("Replayed %d vacancies, mutation=%.2f, batch_size=%d", len(replayed), mutation, batch_size)
+        trigram.report(len(replayed))
+        simhash.report(len(replayed))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sample", type=int, default=1000, help="Количество вакансий для переигрывания")
+    parser.add_argument("--mutation", type=float, default=0.1, help="Доля заменяемых слов fingerprint")
+    parser.add_argument("--batch-size", type=int, default=20, help="Размер пачки для поиска дубликатов")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.sample, args.mutation, args.batch_size, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,38 @@
 from datetime import timedelta
 
 from celery.schedules import schedule
+from core.config import service_config
 
 
 __all__ = ["beat_schedule"]
 
 beat_schedule = {
-    "parse-vacancies-every-10-minutes": {
-        "task": "parse_vacancies",
+    **{
+        f"parse-telegram-vacancies-group-{group}-every-10-minutes": {
+            "task": "parse_telegram_vacancies",
+            "schedule": schedule(run_every=timedelta(minutes=10)),
+            "args": (group,),
+        }
+        for group in range(service_config.telegram_channel_groups)
+    },
+    "parse-head-hunter-vacancies-every-10-minutes": {
+        "task": "parse_head_hunter_vacancies",
         "schedule": schedule(run_every=timedelta(minutes=10)),
-    }
+    },
+    "parse-habr-vacancies-every-10-minutes": {
+        "task": "parse_habr_vacancies",
+        "schedule": schedule(run_every=timedelta(minutes=10)),
+    },
+    "reconcile-head-hunter-vacancies-every-6-hours": {
+        "task": "reconcile_head_hunter_vacancies",
+        "schedule": schedule(run_every=timedelta(hours=6)),
+    },
+    "purge-processed-vacancies-every-day": {
+        "task": "purge_processed_vacancies",
+        "schedule": schedule(run_every=timedelta(days=1)),
+    },
+    "rebuild-seen-hashes-filter-every-day": {
+        "task": "rebuild_seen_hashes_filter",
+        "schedule": schedule(run_every=timedelta(days=1)),
+    },
 }
@@ -23,6 +23,7 @@ class HabrVacancySchema(BaseModel):
     id: int
     datetime: datetime
     text: str
+    skills: list[str] = []
 
 
 class HabrVacanciesListResponse(BaseModel):
@@ -1,41 +1,55 @@
-from datetime import datetime
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
+from contextlib import asynccontextmanager
 
 from clients.telegram.schemas import (
-    TelegramChannelMessageSchema,
-    TelegramChannelMessagesResponse,
-    TelegramNewestMessagesRequest,
+    TelegramChannelMessagesRequest,
+    TelegramChannelMessagesStreamItem,
+    TelegramChannelsBatchRequest,
 )
 from common.gateway.enums import ServiceEnum
 from common.gateway.utils import build_service_url
 from common.logger import get_logger
 from common.shared.clients import BaseClient
+from httpx import Response, Timeout
 
 
 logger = get_logger(__name__)
 
 
 class TelegramClient(BaseClient):
-    url = build_service_url(ServiceEnum.SCRAPER_API, "/api/v1/telegram/messages")
-
-    async def get_newest_messages(
-        self, channel_username: str, channel_topic_id: int | None = None, date_gte: datetime | None = None
-    ) -> list[TelegramChannelMessageSchema]:
-        # FIXME
-        params = TelegramNewestMessagesRequest(
-            channel_username=channel_username,
-            channel_topic_id=channel_topic_id,
-            date_gte=date_gte,
-        )
-
-        response = await self.client.get(self.url, params=params.model_dump(exclude_none=True))
-        response.raise_for_status()
-
-        data = response.json()
-        model_response = TelegramChannelMessagesResponse.model_validate(data)
-
-        logger.debug("Got %s new messages for channel %s", len(model_response.messages), channel_username)
-
-        return model_response.messages
+    url = build_service_url(ServiceEnum.SCRAPER_API, "/api/v1/telegram/messages/batch")
+    # Между строками ответа проходит время обработки самого медленного из параллельных каналов
+    stream_timeout = Timeout(60, read=300)
+
+    @asynccontextmanager
+    async def stream_channels_messages(
+        self, channels: Sequence[TelegramChannelMessagesRequest], min_text_length: int = 0
+    ) -> AsyncGenerator[AsyncIterator[TelegramChannelMessagesStreamItem]]:
+        """Запрашивает сообщения пачки каналов и отдает результат каждого канала по мере готовности.
+        Соединение держится открытым, пока не закрыт контекстный менеджер.
+        """
+        request = TelegramChannelsBatchRequest(channels=list(channels), min_text_length=min_text_length)
+
+        async with self.client.stream(
+            "POST",
+            self.url,
+            content=request.model_dump_json(exclude_none=True),
+            headers={"content-type": "application/json"},
+            timeout=self.stream_timeout,
+        ) as response:
+            response.raise_for_status()
+            yield self._iter_stream_items(response)
+
+    @staticmethod
+    async def _iter_stream_items(response: Response) -> AsyncIterator[TelegramChannelMessagesStreamItem]:
+        async for line in response.aiter_lines():
+            if not line:
+                continue
+
+            item = TelegramChannelMessagesStreamItem.model_validate_json(line)
+            logger.debug("Got %s new messages for channel %s", len(item.messages), item.channel_username)
+
+            yield item
 
 
 telegram_client = TelegramClient()
@@ -3,10 +3,16 @@ from datetime import datetime
 from pydantic import BaseModel
 
 
-class TelegramNewestMessagesRequest(BaseModel):
+class TelegramChannelMessagesRequest(BaseModel):
     channel_username: str
     channel_topic_id: int | None
     date_gte: datetime | None
+    after_id: int | None
+
+
+class TelegramChannelsBatchRequest(BaseModel):
+    channels: list[TelegramChannelMessagesRequest]
+    min_text_length: int
 
 
 class TelegramChannelMessageSchema(BaseModel):
@@ -15,5 +21,9 @@ class TelegramChannelMessageSchema(BaseModel):
     text: str
 
 
-class TelegramChannelMessagesResponse(BaseModel):
+class TelegramChannelMessagesStreamItem(BaseModel):
+    channel_username: str
+    channel_topic_id: int | None
     messages: list[TelegramChannelMessageSchema]
+    newest_message_id: int | None = None
+    error: str | None = None
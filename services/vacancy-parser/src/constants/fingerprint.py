@@ -1,11 +1,28 @@
 __all__ = [
     "FINGERPRINT_SIMILARITY_THRESHOLD",
     "FINGERPRINT_STOPWORDS",
+    "SIMHASH_BANDS",
+    "SIMHASH_BAND_BITS",
+    "SIMHASH_BITS",
+    "SIMHASH_MAX_DISTANCE",
 ]
 
 # Процент схожести между двумя fingerprint вакансий
 FINGERPRINT_SIMILARITY_THRESHOLD = 0.75
 
+# Разрядность SimHash, помещается в BIGINT
+SIMHASH_BITS = 64
+
+# Количество полос, на которые разбивается SimHash для индексного поиска.
+# Если расстояние Хэмминга не больше SIMHASH_MAX_DISTANCE, то хотя бы одна полоса совпадет целиком.
+# Полоса в 16 бит случайно совпадает у 1/65536 таблицы: на сотнях тысяч вакансий это единицы кандидатов
+# на проверку расстояния, тогда как полоса в 8 бит совпадала бы у 1/256 таблицы
+SIMHASH_BANDS = 4
+SIMHASH_BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+
+# Максимальное расстояние Хэмминга между SimHash похожих вакансий
+SIMHASH_MAX_DISTANCE = SIMHASH_BANDS - 1
+
 # Слова, которые часто встречаются в описании вакансии
 FINGERPRINT_STOPWORDS: set[str] = {
     "и",
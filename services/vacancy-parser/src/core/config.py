@@ -1,8 +1,32 @@
+from common.database.enums import BulkInsertMethodEnum
+from core.enums import FingerprintModeEnum
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class ServiceConfig(BaseSettings):
     db_schema: str = "vacancy_parser"
+    fingerprint_mode: FingerprintModeEnum = FingerprintModeEnum.SIMHASH
+    # Способ массовой вставки вакансий. COPY быстрее на больших пачках, уже сохраненные вакансии
+    # при этом пропускаются через временную таблицу
+    bulk_insert_method: BulkInsertMethodEnum = BulkInsertMethodEnum.INSERT
+    # Насколько раньше курсора выдачи HH начинается окно поиска
+    head_hunter_listing_overlap: int = 3600  # 1 hour
+    # Количество групп каналов Telegram, каждая парсится отдельной задачей
+    telegram_channel_groups: int = 4
+    # Через сколько дней после обработки у вакансии удаляются сырые данные и отпечаток
+    data_retention_days: int = 7
+    fingerprint_retention_days: int = 30
+    # Очистка идет пачками с паузой между ними, чтобы не мешать парсингу и autovacuum
+    retention_batch_size: int = 500
+    retention_batch_pause: float = 1.0
+    # На сколько секунд вакансия закрепляется за воркером обработчика, если он ее не продлит
+    claim_lease_ttl: int = 600  # 10 min
+    # Доля ложноположительных ответов Bloom-фильтра хешей и число хешей, на которое он рассчитан.
+    # При переполнении фильтр расширяется, но медленнее, поэтому емкость лучше брать с запасом
+    seen_hashes_error_rate: float = Field(default=0.001, gt=0, lt=1)
+    seen_hashes_capacity: int = Field(default=1_000_000, ge=1)
+    seen_hashes_rebuild_batch_size: int = 10000
 
     model_config = SettingsConfigDict(env_prefix="VACANCY_PARSER_")
 
@@ -0,0 +1,25 @@
+from enum import StrEnum
+
+
+class FingerprintModeEnum(StrEnum):
+    SIMHASH = "simhash"  # Полосы SimHash + расстояние Хэмминга
+    TRIGRAM = "trigram"  # Схожесть fingerprint через pg_trgm
+
+
+class VacancyExportFieldEnum(StrEnum):
+    ID = "id"
+    SOURCE = "source"
+    HASH = "hash"
+    LINK = "link"
+    DATA = "data"
+    PUBLISHED_AT = "published_at"
+    EXTERNAL_ID = "external_id"  # Habr
+    VACANCY_ID = "vacancy_id"  # HeadHunter
+    CHANNEL_USERNAME = "channel_username"  # Telegram
+
+
+class ParserStageEnum(StrEnum):
+    LISTING = "listing"  # Получение списка вакансий и отсев уже известных
+    FETCHING = "fetching"  # Загрузка деталей вакансий, суммарно по всем воркерам
+    DEDUPLICATION = "deduplication"  # Поиск дубликатов по содержимому
+    SAVING = "saving"  # Вставка вакансий в БД
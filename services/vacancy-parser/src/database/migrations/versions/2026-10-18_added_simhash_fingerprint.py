@@ -0,0 +1,105 @@
+"""added simhash fingerprint
+
+Revision ID: baa2a564a2b1
+Revises: 710a97d1bf32
+Create Date: 2026-10-18 12:04:51.219834
+
+"""
+from collections import Counter
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'baa2a564a2b1'
+down_revision: Union[str, Sequence[str], None] = '710a97d1bf32'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_BATCH_SIZE = 1000
+SIMHASH_BITS = 64
+
+
+# Копии функций из utils на момент миграции, чтобы их дальнейшие изменения не меняли результат бэкфилла
+def _to_signed_int64(value: int) -> int:
+    return value - (1 << SIMHASH_BITS) if value >= 1 << (SIMHASH_BITS - 1) else value
+
+
+def _hash_int64(value: str) -> int:
+    digest = hashlib.blake2b(value.encode("utf-8"), digest_size=SIMHASH_BITS // 8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def generate_content_hash(fingerprint: str) -> int:
+    return _to_signed_int64(_hash_int64(fingerprint))
+
+
+def generate_simhash(fingerprint: str) -> int:
+    weights = [0] * SIMHASH_BITS
+
+    for word, count in Counter(fingerprint.split()).items():
+        word_hash = _hash_int64(word)
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if word_hash >> bit & 1 else -count
+
+    simhash = sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+    return _to_signed_int64(simhash)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('vacancies', sa.Column('content_hash', sa.BigInteger(), nullable=True), schema='vacancy_parser')
+    op.add_column('vacancies', sa.Column('simhash', sa.BigInteger(), nullable=True), schema='vacancy_parser')
+
+    # SimHash считается по словам fingerprint, поэтому его можно восстановить для уже сохраненных вакансий
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.text(
+                "SELECT id, fingerprint FROM vacancy_parser.vacancies WHERE id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+
+        connection.execute(
+            sa.text("UPDATE vacancy_parser.vacancies SET content_hash = :content_hash, simhash = :simhash WHERE id = :id"),
+            [
+                {
+                    "id": row.id,
+                    "content_hash": generate_content_hash(row.fingerprint),
+                    "simhash": generate_simhash(row.fingerprint),
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+    op.alter_column('vacancies', 'content_hash', nullable=False, schema='vacancy_parser')
+    op.alter_column('vacancies', 'simhash', nullable=False, schema='vacancy_parser')
+    op.create_index(op.f('ix_vacancy_parser_vacancies_content_hash'), 'vacancies', ['content_hash'], unique=True, schema='vacancy_parser')
+    op.create_index('idx_vacancies_simhash_band_0', 'vacancies', [sa.text('((simhash >> 48) & 65535)')], unique=False, schema='vacancy_parser')
+    op.create_index('idx_vacancies_simhash_band_1', 'vacancies', [sa.text('((simhash >> 32) & 65535)')], unique=False, schema='vacancy_parser')
+    op.create_index('idx_vacancies_simhash_band_2', 'vacancies', [sa.text('((simhash >> 16) & 65535)')], unique=False, schema='vacancy_parser')
+    op.create_index('idx_vacancies_simhash_band_3', 'vacancies', [sa.text('((simhash >> 0) & 65535)')], unique=False, schema='vacancy_parser')
+    # Уникальность содержимого теперь обеспечивает content_hash
+    op.drop_index(op.f('ix_vacancy_parser_vacancies_fingerprint'), table_name='vacancies', schema='vacancy_parser')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_vacancy_parser_vacancies_fingerprint'), 'vacancies', ['fingerprint'], unique=True, schema='vacancy_parser')
+    op.drop_index('idx_vacancies_simhash_band_3', table_name='vacancies', schema='vacancy_parser')
+    op.drop_index('idx_vacancies_simhash_band_2', table_name='vacancies', schema='vacancy_parser')
+    op.drop_index('idx_vacancies_simhash_band_1', table_name='vacancies', schema='vacancy_parser')
+    op.drop_index('idx_vacancies_simhash_band_0', table_name='vacancies', schema='vacancy_parser')
+    op.drop_index(op.f('ix_vacancy_parser_vacancies_content_hash'), table_name='vacancies', schema='vacancy_parser')
+    op.drop_column('vacancies', 'simhash', schema='vacancy_parser')
+    op.drop_column('vacancies', 'content_hash', schema='vacancy_parser')
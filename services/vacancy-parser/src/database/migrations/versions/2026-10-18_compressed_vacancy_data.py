@@ -0,0 +1,109 @@
+"""compressed vacancy data
+
+Revision ID: cb40c7a2b090
+Revises: c61fcd8227f9
+Create Date: 2026-10-18 19:42:08.317251
+
+"""
+from typing import Any, Callable, Sequence, Union
+
+from alembic import op
+from common.logger import get_logger
+import sqlalchemy as sa
+import zstandard
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cb40c7a2b090'
+down_revision: Union[str, Sequence[str], None] = 'c61fcd8227f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+logger = get_logger(__name__)
+
+
+BACKFILL_BATCH_SIZE = 1000
+ZSTD_LEVEL = 3
+
+
+def _report_size(stage: str) -> None:
+    connection = op.get_bind()
+    row = connection.execute(
+        sa.text(
+            "SELECT pg_total_relation_size('vacancy_parser.vacancies') AS table_size,"
+            " coalesce(sum(pg_column_size(data)), 0) AS data_size,"
+            " count(*) AS rows_count"
+            " FROM vacancy_parser.vacancies"
+        )
+    ).one()
+    # Место под старые версии строк освобождается только после VACUUM FULL
+    logger.info(
+        "Vacancies %s: table %s, data column %s, %d rows",
+        stage,
+        _format_size(row.table_size),
+        _format_size(row.data_size),
+        row.rows_count,
+    )
+
+
+def _format_size(size: int) -> str:
+    return f"{size / 1024 / 1024:.1f} MB"
+
+
+def _convert_data(new_type: sa.types.TypeEngine[Any], convert: Callable[[Any], Any]) -> None:
+    """Переносит data в колонку нового типа и заменяет ей старую колонку.
+    Основной перенос идет вне транзакции миграции, каждая пачка коммитится отдельно, поэтому таблица
+    не блокируется на все время переноса. Строки, появившиеся за это время, переносятся уже под
+    блокировкой таблицы, непосредственно перед заменой колонки.
+    """
+    op.add_column('vacancies', sa.Column('data_converted', new_type, nullable=True), schema='vacancy_parser')
+
+    with op.get_context().autocommit_block():
+        _copy_batches(new_type, convert)
+
+    op.execute("LOCK TABLE vacancy_parser.vacancies IN ACCESS EXCLUSIVE MODE")
+    _copy_batches(new_type, convert)
+
+    op.drop_column('vacancies', 'data', schema='vacancy_parser')
+    op.alter_column('vacancies', 'data_converted', new_column_name='data', nullable=False, schema='vacancy_parser')
+
+
+def _copy_batches(new_type: sa.types.TypeEngine[Any], convert: Callable[[Any], Any]) -> None:
+    """Заполняет data_converted у еще не перенесенных строк пачками по id."""
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.text(
+                "SELECT id, data FROM vacancy_parser.vacancies"
+                " WHERE id > :last_id AND data_converted IS NULL ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+
+        connection.execute(
+            sa.text("UPDATE vacancy_parser.vacancies SET data_converted = :data WHERE id = :id").bindparams(
+                sa.bindparam('data', type_=new_type)
+            ),
+            [{"id": row.id, "data": convert(row.data)} for row in rows],
+        )
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _report_size("before compression")
+
+    _convert_data(sa.LargeBinary(), lambda data: zstandard.compress(data.encode("utf-8"), ZSTD_LEVEL))
+    # Данные уже сжаты, повторное сжатие pglz при выносе в TOAST ничего не даст
+    op.execute("ALTER TABLE vacancy_parser.vacancies ALTER COLUMN data SET STORAGE EXTERNAL")
+
+    _report_size("after compression")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _convert_data(sa.Text(), lambda data: zstandard.decompress(data).decode("utf-8"))
@@ -5,13 +5,19 @@ from database.models.vacancy import Vacancy
 
 from database.models.habr import HabrVacancy
 from database.models.head_hunter import HeadHunterVacancy
+from database.models.parser_run import ParserRun
+from database.models.source_cursor import SourceCursor
 from database.models.telegram import TelegramVacancy
+from database.models.telegram_channel_cursor import TelegramChannelCursor
 
 
 __all__ = [
     "Base",
     "HabrVacancy",
     "HeadHunterVacancy",
+    "ParserRun",
+    "SourceCursor",
+    "TelegramChannelCursor",
     "TelegramVacancy",
     "Vacancy",
 ]
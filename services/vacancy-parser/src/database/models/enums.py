@@ -16,3 +16,8 @@ class SourceEnum(BaseStrEnum):
     TELEGRAM = "telegram"
     HEAD_HUNTER = "head_hunter"
     HABR = "habr"
+
+
+class ParserRunStatusEnum(BaseStrEnum):
+    SUCCESS = "success"
+    FAILED = "failed"
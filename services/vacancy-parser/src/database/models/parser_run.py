@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from database.models import Base
+from database.models.enums import ParserRunStatusEnum, SourceEnum
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, Text, desc
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+__all__ = ["ParserRun"]
+
+
+class ParserRun(Base):
+    """Запуск парсера одного источника (или его части) со счетчиками вакансий и длительностью этапов."""
+
+    __tablename__ = "parser_runs"
+
+    id: Mapped[int] = mapped_column(primary_key=True, doc="ID запуска")
+    source: Mapped[SourceEnum] = mapped_column(String(16), doc="Источник вакансий")
+    scope: Mapped[str | None] = mapped_column(
+        String(32), doc="Часть источника, которую обходил запуск, например группа каналов Telegram"
+    )
+    status: Mapped[ParserRunStatusEnum] = mapped_column(String(16), doc="Результат запуска")
+    error: Mapped[str | None] = mapped_column(Text, doc="Ошибка, прервавшая запуск")
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), doc="Дата начала запуска")
+    finished_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), doc="Дата окончания запуска")
+
+    listed: Mapped[int] = mapped_column(Integer, doc="Вакансий в выдаче источника")
+    known: Mapped[int] = mapped_column(Integer, doc="Вакансий, уже сохраненных ранее")
+    fetched: Mapped[int] = mapped_column(Integer, doc="Загружено деталей вакансий")
+    failed: Mapped[int] = mapped_column(Integer, doc="Ошибок загрузки")
+    duplicates: Mapped[int] = mapped_column(Integer, doc="Отсеяно дубликатов по содержимому")
+    inserted: Mapped[int] = mapped_column(Integer, doc="Сохранено новых вакансий")
+    bytes_downloaded: Mapped[int] = mapped_column(BigInteger, doc="Скачано байт")
+
+    duration_ms: Mapped[int] = mapped_column(Integer, doc="Длительность запуска, мс")
+    listing_ms: Mapped[int] = mapped_column(Integer, doc="Длительность получения списка вакансий, мс")
+    fetching_ms: Mapped[int] = mapped_column(Integer, doc="Суммарное время загрузки деталей вакансий, мс")
+    deduplication_ms: Mapped[int] = mapped_column(Integer, doc="Длительность поиска дубликатов, мс")
+    saving_ms: Mapped[int] = mapped_column(Integer, doc="Длительность сохранения вакансий, мс")
+
+    __table_args__ = (Index("idx_parser_runs_source_started_at", "source", desc("started_at")),)
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from database.models import Base
+from database.models.enums import SourceEnum
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+__all__ = ["SourceCursor"]
+
+
+class SourceCursor(Base):
+    """Дата публикации, до которой выдача источника уже просмотрена парсером."""
+
+    __tablename__ = "source_cursors"
+
+    id: Mapped[int] = mapped_column(primary_key=True, doc="ID курсора")
+    source: Mapped[SourceEnum] = mapped_column(String(16), unique=True, doc="Источник вакансий")
+    last_published_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), doc="Наибольшая дата публикации из последней успешной выдачи"
+    )
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), doc="Дата последнего сдвига курсора")
@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from database.models import Base
+from sqlalchemy import DateTime, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+__all__ = ["TelegramChannelCursor"]
+
+
+class TelegramChannelCursor(Base):
+    """Позиция, до которой канал (или его топик) уже просмотрен парсером."""
+
+    __tablename__ = "telegram_channel_cursors"
+
+    id: Mapped[int] = mapped_column(primary_key=True, doc="ID курсора")
+    channel_username: Mapped[str] = mapped_column(String(32), doc="Имя пользователя Telegram канала")
+    channel_topic_id: Mapped[int | None] = mapped_column(Integer, doc="ID топика Telegram канала")
+    last_message_id: Mapped[int | None] = mapped_column(Integer, doc="ID последнего просмотренного сообщения")
+    last_polled_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), doc="Дата последнего опроса канала")
+
+    __table_args__ = (
+        Index(
+            "idx_telegram_channel_cursors_channel",
+            "channel_username",
+            "channel_topic_id",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
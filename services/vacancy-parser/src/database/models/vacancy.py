@@ -1,10 +1,23 @@
 from datetime import datetime
 
 from common.shared.schemas.http import HttpsUrl
+from constants.fingerprint import SIMHASH_BAND_BITS, SIMHASH_BANDS, SIMHASH_BITS
 from database.models import Base
 from database.models.enums import SourceEnum
-from sqlalchemy import DateTime, Index, String, Text, desc
-from sqlalchemy.orm import Mapped, mapped_column
+from database.types import ZstdText
+from sqlalchemy import BigInteger, ColumnElement, DateTime, Index, String, Text, desc, literal_column
+from sqlalchemy.orm import InstrumentedAttribute, Mapped, mapped_column
+
+
+def simhash_band(simhash: ColumnElement[int] | InstrumentedAttribute[int], band: int) -> ColumnElement[int]:
+    """SQL-выражение полосы SimHash. Сдвиг и маска подставляются литералами,
+    чтобы планировщик мог использовать индексы `idx_vacancies_simhash_band_*`.
+    """
+    shift = SIMHASH_BITS - SIMHASH_BAND_BITS * (band + 1)
+    mask = (1 << SIMHASH_BAND_BITS) - 1
+
+    shifted = simhash.op(">>", return_type=BigInteger)(literal_column(str(shift)))
+    return shifted.op("&", return_type=BigInteger)(literal_column(str(mask)))
 
 
 class Vacancy(Base):
@@ -13,11 +26,17 @@ class Vacancy(Base):
     id: Mapped[int] = mapped_column(primary_key=True, doc="ID вакансии")
     source: Mapped[SourceEnum] = mapped_column(String(16), index=True, doc="Источник вакансии")
     hash: Mapped[str] = mapped_column(String(64), unique=True, index=True, doc="Хеш вакансии")
-    fingerprint: Mapped[str] = mapped_column(Text, unique=True, index=True, doc="Отпечаток вакансии")
+    fingerprint: Mapped[str | None] = mapped_column(Text, doc="Отпечаток вакансии")
+    content_hash: Mapped[int] = mapped_column(BigInteger, unique=True, index=True, doc="Точный хеш содержимого")
+    simhash: Mapped[int] = mapped_column(BigInteger, doc="SimHash содержимого вакансии")
     link: Mapped[HttpsUrl] = mapped_column(String(256), unique=True, doc="Ссылка на вакансию")
-    data: Mapped[str] = mapped_column(Text, doc="Сырая информация о вакансии")
+    data: Mapped[str | None] = mapped_column(ZstdText, doc="Сырая информация о вакансии, сжатая zstd")
     published_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True, doc="Дата публикации вакансии")
     processed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), doc="Дата обработки вакансии")
+    claimed_by: Mapped[str | None] = mapped_column(String(64), doc="Воркер, взявший вакансию в обработку")
+    lease_until: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), doc="До какого момента вакансия закреплена за воркером"
+    )
 
     __mapper_args__ = {  # noqa: RUF012
         "polymorphic_on": source,
@@ -28,10 +47,21 @@ class Vacancy(Base):
         Index("idx_vacancies_published_at_desc", desc("published_at")),
         Index("idx_vacancies_hash_not_processed", "hash", postgresql_where="processed_at IS NULL"),
         Index("idx_vacancies_not_processed", "processed_at", postgresql_where="processed_at IS NULL"),
+        # Ключ курсора выгрузки необработанных вакансий
+        Index(
+            "idx_vacancies_not_processed_published_at_id",
+            desc("published_at"),
+            desc("id"),
+            postgresql_where="processed_at IS NULL",
+        ),
         Index(
             "idx_vacancies_fingerprint_gist",
             "fingerprint",
             postgresql_using="gist",
             postgresql_ops={"fingerprint": "gist_trgm_ops"},
         ),
+        *(
+            Index(f"idx_vacancies_simhash_band_{band}", simhash_band(literal_column("simhash"), band))
+            for band in range(SIMHASH_BANDS)
+        ),
     )
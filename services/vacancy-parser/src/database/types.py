@@ -0,0 +1,33 @@
+from typing import Any
+
+from sqlalchemy import Dialect, LargeBinary, TypeDecorator
+import zstandard
+
+
+__all__ = ["ZstdText"]
+
+
+class ZstdText(TypeDecorator[str]):
+    """Текст, который хранится в БД сжатым zstd (bytea).
+    Сжатие и распаковка выполняются при передаче значения в БД и чтении из нее,
+    поэтому для моделей, схем и репозиториев колонка остается обычной строкой.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, level: int = 3, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.level = level
+
+    def process_bind_param(self, value: str | None, dialect: Dialect) -> bytes | None:  # noqa: ARG002
+        if value is None:
+            return None
+
+        return zstandard.compress(value.encode("utf-8"), self.level)
+
+    def process_result_value(self, value: bytes | None, dialect: Dialect) -> str | None:  # noqa: ARG002, PLR6301
+        if value is None:
+            return None
+
+        return zstandard.decompress(value).decode("utf-8")
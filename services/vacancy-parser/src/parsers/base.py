@@ -1,8 +1,19 @@
 from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from datetime import UTC, datetime
+import time
 
 from common.logger import get_logger
+from common.shared.clients.http import count_downloaded_bytes
+from common.shared.events import NewVacanciesEvent, new_vacancies_stream
+from core.enums import ParserStageEnum
+from database.models.enums import ParserRunStatusEnum, SourceEnum
+from schemas.parser_run import ParserRunCreate, ParserRunStats
 from unitofwork import UnitOfWork
 
+from services import ParserRunService
+
 
 __all__ = ["BaseParser"]
 
@@ -11,22 +22,137 @@ logger = get_logger(__name__)
 
 
 class BaseParser[VacancyServiceType, VacancyCreateType](ABC):
+    source: SourceEnum
     # Размер батча для загрузки вакансий
     BATCH_SIZE = 20
+    # Количество одновременных запросов за деталями вакансий
+    FETCH_CONCURRENCY = 10
+    # Максимальное количество загруженных, но еще не обработанных вакансий
+    QUEUE_SIZE = BATCH_SIZE * 2
 
-    def __init__(self, uow: UnitOfWork, service: VacancyServiceType) -> None:
+    def __init__(self, uow: UnitOfWork, service: VacancyServiceType, *, scope: str | None = None) -> None:
         self.uow = uow
         self.service = service
+        # Часть источника, которую обходит запуск, если источник парсится несколькими задачами
+        self.scope = scope
         self._vacancies_batch: list[VacancyCreateType] = []
         self._processed_fingerprints: set[str] = set()
+        # Хеши вакансий, реально вставленных за время работы парсера
+        self.inserted_hashes: set[str] = set()
+        self.stats = ParserRunStats()
 
     @abstractmethod
     async def parse(self) -> None:
         """Основной метод парсинга каналов."""
 
+    async def run(self) -> None:
+        """Парсит источник, сохраняет остаток батча и записывает запуск в журнал `parser_runs`.
+        Запуск записывается и при ошибке, после чего ошибка пробрасывается дальше.
+        """
+        started_at = datetime.now(tz=UTC)
+        started = time.perf_counter()
+        status, error = ParserRunStatusEnum.SUCCESS, None
+
+        with count_downloaded_bytes() as downloaded:
+            try:
+                await self.parse()
+                await self.save_vacancies()
+                await self.uow.commit()
+            except BaseException as e:
+                status, error = ParserRunStatusEnum.FAILED, repr(e)
+                raise
+            finally:
+                run = ParserRunCreate(
+                    source=self.source,
+                    scope=self.scope,
+                    status=status,
+                    error=error,
+                    started_at=started_at,
+                    finished_at=datetime.now(tz=UTC),
+                    listed=self.stats.listed,
+                    known=self.stats.known,
+                    fetched=self.stats.fetched,
+                    failed=self.stats.failed,
+                    duplicates=self.stats.duplicates,
+                    inserted=self.stats.inserted,
+                    bytes_downloaded=downloaded.bytes,
+                    duration_ms=round((time.perf_counter() - started) * 1000),
+                    listing_ms=self.stats.duration_ms(ParserStageEnum.LISTING),
+                    fetching_ms=self.stats.duration_ms(ParserStageEnum.FETCHING),
+                    deduplication_ms=self.stats.duration_ms(ParserStageEnum.DEDUPLICATION),
+                    saving_ms=self.stats.duration_ms(ParserStageEnum.SAVING),
+                )
+                await self._save_run(run)
+
+    async def _save_run(self, run: ParserRunCreate) -> None:  # noqa: PLR6301
+        """Пишет запуск отдельной транзакцией: сессия парсера после ошибки может быть непригодна."""
+        try:
+            async with UnitOfWork() as uow:
+                await ParserRunService(uow).add_run(run)
+        except Exception as e:
+            logger.exception("Failed to save %s parser run", run.source, exc_info=e)
+            return
+
+        logger.info(
+            "Parser %s run %s: listed %d, known %d, fetched %d, failed %d, duplicates %d, inserted %d, %d B, %d ms",
+            run.source,
+            run.status,
+            run.listed,
+            run.known,
+            run.fetched,
+            run.failed,
+            run.duplicates,
+            run.inserted,
+            run.bytes_downloaded,
+            run.duration_ms,
+        )
+
+    async def process_stream[IdType, DetailType](
+        self,
+        ids: Iterable[IdType],
+        fetch: Callable[[IdType], Awaitable[DetailType | None]],
+        process: Callable[[DetailType], Awaitable[None]],
+    ) -> None:
+        """Загружает детали вакансий и обрабатывает их по мере поступления.
+        Загрузка ведется FETCH_CONCURRENCY воркерами через ограниченную очередь: если обработка
+        не успевает, воркеры ждут освобождения места, поэтому в памяти держится не больше
+        QUEUE_SIZE вакансий, а первые батчи сохраняются, пока остальные еще загружаются.
+        """
+        queue: asyncio.Queue[DetailType | None] = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        ids_iterator = iter(ids)
+
+        async def produce() -> None:
+            for item_id in ids_iterator:
+                try:
+                    with self.stats.measure(ParserStageEnum.FETCHING):
+                        detail = await fetch(item_id)
+                except Exception as e:
+                    self.stats.failed += 1
+                    logger.exception("Error fetching vacancy %s", item_id, exc_info=e)
+                    continue
+
+                if detail is not None:
+                    self.stats.fetched += 1
+                    await queue.put(detail)
+
+        async def close_queue(producers: list[asyncio.Task[None]]) -> None:
+            await asyncio.gather(*producers)
+            await queue.put(None)
+
+        producers = [asyncio.create_task(produce()) for _ in range(self.FETCH_CONCURRENCY)]
+        closer = asyncio.create_task(close_queue(producers))
+
+        try:
+            while (detail := await queue.get()) is not None:
+                await process(detail)
+        finally:
+            for task in (*producers, closer):
+                task.cancel()
+
     async def add_vacancy(self, new_vacancy: VacancyCreateType) -> None:
         if new_vacancy.fingerprint in self._processed_fingerprints:  # type: ignore[attr-defined]
             logger.debug("Fingerprint already processed")
+            self.stats.duplicates += 1
             return
         self._processed_fingerprints.add(new_vacancy.fingerprint)  # type: ignore[attr-defined]
 
@@ -40,6 +166,64 @@ class BaseParser[VacancyServiceType, VacancyCreateType](ABC):
         if not self._vacancies_batch:
             return
 
-        await self.service.add_vacancies_bulk(self._vacancies_batch)  # type: ignore[attr-defined]
-        logger.info("Commited batch of %d vacancies for parser %s", len(self._vacancies_batch), self.__class__.__name__)
+        with self.stats.measure(ParserStageEnum.DEDUPLICATION):
+            vacancies = await self.exclude_duplicates(self._vacancies_batch)
+        self.stats.duplicates += len(self._vacancies_batch) - len(vacancies)
         self._vacancies_batch = []
+
+        if not vacancies:
+            return
+
+        with self.stats.measure(ParserStageEnum.SAVING):
+            inserted_hashes = await self.service.add_vacancies_bulk(vacancies)  # type: ignore[attr-defined]
+        self.inserted_hashes.update(inserted_hashes)
+        self.stats.inserted += len(inserted_hashes)
+        # Вакансии с уже существующим хешем пропускаются при вставке
+        self.stats.known += len(vacancies) - len(inserted_hashes)
+        logger.info(
+            "Commited batch of %d vacancies (%d already existed) for parser %s",
+            len(inserted_hashes),
+            len(vacancies) - len(inserted_hashes),
+            self.__class__.__name__,
+        )
+
+        if inserted_hashes:
+            await self._publish_new_vacancies(inserted_hashes, vacancies[0].source)  # type: ignore[attr-defined]
+
+    async def _publish_new_vacancies(self, hashes: list[str], source: str) -> None:  # noqa: PLR6301
+        """Сообщает обработчику о сохраненной пачке, чтобы он взял ее в работу сразу, а не по расписанию.
+        Пачка уже закоммичена, поэтому если событие потерялось, ее подберет периодический обход обработчика.
+        """
+        event = NewVacanciesEvent(hashes=hashes, source=source, created_at=datetime.now(tz=UTC))
+        try:
+            await new_vacancies_stream.publish(event)
+        except Exception as e:
+            logger.exception("Failed to publish %d new vacancies", len(hashes), exc_info=e)
+
+    async def exclude_duplicates(self, vacancies: Sequence[VacancyCreateType]) -> list[VacancyCreateType]:
+        """Отсеивает вакансии, у которых в БД уже есть дубликат по содержимому.
+        Дубликаты ищутся одним запросом на всю пачку, а дата публикации найденных
+        дубликатов обновляется одним UPDATE.
+        """
+        duplicates = await self.service.find_duplicate_vacancies(vacancies)  # type: ignore[attr-defined]
+        if not duplicates:
+            return list(vacancies)
+
+        published_at_by_hash: dict[str, datetime] = {}
+        new_vacancies: list[VacancyCreateType] = []
+        for vacancy in vacancies:
+            duplicate_hash = duplicates.get(vacancy.fingerprint)  # type: ignore[attr-defined]
+            if duplicate_hash is None:
+                new_vacancies.append(vacancy)
+                continue
+
+            logger.debug("Found duplicate vacancy. New vacancy link: %s", vacancy.link)  # type: ignore[attr-defined]
+            published_at = vacancy.published_at  # type: ignore[attr-defined]
+            previous_published_at = published_at_by_hash.get(duplicate_hash)
+            if previous_published_at is None or published_at > previous_published_at:
+                published_at_by_hash[duplicate_hash] = published_at
+
+        await self.service.update_vacancies_published_at(published_at_by_hash)  # type: ignore[attr-defined]
+        logger.debug("Found %d duplicates in batch of %d vacancies", len(published_at_by_hash), len(vacancies))
+
+        return new_vacancies
@@ -1,9 +1,9 @@
-import asyncio
 from typing import TYPE_CHECKING
 
 from clients import habr_client
 from common.logger import get_logger
 from common.shared.schemas.http import HttpsUrl
+from core.enums import ParserStageEnum
 from database.models.enums import SourceEnum
 from parsers.base import BaseParser
 from schemas.vacancy import HabrVacancyCreate
@@ -22,49 +22,35 @@ logger = get_logger(__name__)
 
 
 class HabrParser(BaseParser["HabrVacancyService", "HabrVacancyCreate"]):
+    source = SourceEnum.HABR
     service: "HabrVacancyService"
 
     async def parse(self) -> None:
         logger.info("Starting Habr parser")
 
-        last_published_at = await self.service.get_last_vacancy_published_at()
-        newest_vacancy_ids = await habr_client.get_newest_vacancies_ids(last_published_at)
-        logger.debug("Found %s actual vacancies", len(newest_vacancy_ids))
-        vacancy_hashes = [generate_vacancy_hash(v_id, SourceEnum.HABR) for v_id in newest_vacancy_ids]
-        existing_hashes = await self.service.get_existing_hashes(vacancy_hashes)
+        with self.stats.measure(ParserStageEnum.LISTING):
+            last_published_at = await self.service.get_last_vacancy_published_at()
+            newest_vacancy_ids = await habr_client.get_newest_vacancies_ids(last_published_at)
+            logger.debug("Found %s actual vacancies", len(newest_vacancy_ids))
+            vacancy_hashes = [generate_vacancy_hash(v_id, SourceEnum.HABR) for v_id in newest_vacancy_ids]
+            existing_hashes = await self.service.get_existing_hashes(vacancy_hashes)
         new_vacancies_ids = [
             v_id for v_id in newest_vacancy_ids if generate_vacancy_hash(v_id, SourceEnum.HABR) not in existing_hashes
         ]
+        self.stats.listed += len(newest_vacancy_ids)
+        self.stats.known += len(newest_vacancy_ids) - len(new_vacancies_ids)
 
         logger.debug("Found %s new vacancies", len(new_vacancies_ids))
 
-        tasks = [habr_client.get_vacancy_by_id(vacancy_id) for vacancy_id in new_vacancies_ids]
-        vacancy_details: list[HabrVacancySchema | BaseException | None] = await asyncio.gather(
-            *tasks, return_exceptions=True
-        )
-
-        for vacancy_detail in vacancy_details:
-            if isinstance(vacancy_detail, BaseException):
-                logger.error("Error fetching vacancy", exc_info=vacancy_detail)
-                continue
-            if not vacancy_detail:
-                continue
+        await self.process_stream(new_vacancies_ids, habr_client.get_vacancy_by_id, self._process_vacancy)
 
-            fingerprint = generate_fingerprint(vacancy_detail.text)
-            duplicate_hash = await self.service.find_duplicate_vacancy_by_fingerprint(fingerprint)
-            if duplicate_hash:
-                logger.debug(
-                    "Found duplicate vacancy. New vacancy id: %s",
-                    vacancy_detail.id,
-                )
-                await self.service.update_vacancy_published_at(duplicate_hash, vacancy_detail.datetime)
-                continue
-
-            vacancy_create = HabrVacancyCreate(
-                fingerprint=fingerprint,
-                link=HttpsUrl(f"https://career.habr.com/vacancies/{vacancy_detail.id}"),
-                external_id=vacancy_detail.id,
-                published_at=vacancy_detail.datetime,
-                data=vacancy_detail.text,
-            )
-            await self.add_vacancy(vacancy_create)
+    async def _process_vacancy(self, vacancy_detail: "HabrVacancySchema") -> None:
+        fingerprint = generate_fingerprint(vacancy_detail.text)
+        vacancy_create = HabrVacancyCreate(
+            fingerprint=fingerprint,
+            link=HttpsUrl(f"https://career.habr.com/vacancies/{vacancy_detail.id}"),
+            external_id=vacancy_detail.id,
+            published_at=vacancy_detail.datetime,
+            data=vacancy_detail.text,
+        )
+        await self.add_vacancy(vacancy_create)
@@ -1,10 +1,12 @@
-import asyncio
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from clients.profession import profession_client
 from common.logger import get_logger
 from common.shared.clients.head_hunter import head_hunter_client
 from common.shared.schemas.http import HttpsUrl
+from core.config import service_config
+from core.enums import ParserStageEnum
 from database.models.enums import SourceEnum
 from parsers.base import BaseParser
 from schemas.vacancy import HeadHunterVacancyCreate
@@ -25,61 +27,64 @@ logger = get_logger(__name__)
 
 
 class HeadHunterParser(BaseParser["HeadHunterVacancyService", "HeadHunterVacancyCreate"]):
-    def __init__(self, uow: UnitOfWork, service: "HeadHunterVacancyService") -> None:
+    source = SourceEnum.HEAD_HUNTER
+    # Совпадает с ограничением запросов деталей вакансий в head_hunter_client
+    FETCH_CONCURRENCY = 20
+
+    def __init__(self, uow: UnitOfWork, service: "HeadHunterVacancyService", *, full_window: bool = False) -> None:
         super().__init__(uow, service)
         self.service = service
+        # Полное окно поиска вместо вакансий, опубликованных после курсора выдачи HH
+        self.full_window = full_window
 
     async def parse(self) -> None:
-        logger.info("Starting HeadHunter parser")
-
-        professions = (p.name for p in await profession_client.get_all())
-        newest_vacancy_ids = await head_hunter_client.get_newest_vacancies_ids(professions)
-        vacancy_hashes = [generate_vacancy_hash(v_id, SourceEnum.HEAD_HUNTER) for v_id in newest_vacancy_ids]
-        existing_hashes = await self.service.get_existing_hashes(vacancy_hashes)
+        logger.info("Starting HeadHunter parser (full window: %s)", self.full_window)
+
+        with self.stats.measure(ParserStageEnum.LISTING):
+            date_from = None
+            if not self.full_window:
+                last_published_at = await self.service.get_listing_cursor()
+                if last_published_at is not None:
+                    # Перекрытие подхватывает вакансии, которые появились в выдаче HH с задержкой
+                    date_from = last_published_at - timedelta(seconds=service_config.head_hunter_listing_overlap)
+
+            professions = (p.name for p in await profession_client.get_all())
+            newest_vacancies = await head_hunter_client.get_newest_vacancies(professions, date_from)
+            newest_vacancy_ids = newest_vacancies.keys()
+            vacancy_hashes = [generate_vacancy_hash(v_id, SourceEnum.HEAD_HUNTER) for v_id in newest_vacancy_ids]
+            existing_hashes = await self.service.get_existing_hashes(vacancy_hashes)
         new_vacancies_ids = {
             v_id
             for v_id in newest_vacancy_ids
             if generate_vacancy_hash(v_id, SourceEnum.HEAD_HUNTER) not in existing_hashes
         }
+        self.stats.listed += len(newest_vacancy_ids)
+        self.stats.known += len(newest_vacancy_ids) - len(new_vacancies_ids)
 
         logger.debug("Found %s new vacancies", len(new_vacancies_ids))
 
-        tasks = [head_hunter_client.get_vacancy_by_id(vacancy_id) for vacancy_id in new_vacancies_ids]
-        vacancy_details: list[HeadHunterVacancyDetailResponse | BaseException | None] = await asyncio.gather(
-            *tasks, return_exceptions=True
+        await self.process_stream(new_vacancies_ids, head_hunter_client.get_vacancy_by_id, self._process_vacancy)
+
+        # Курсор коммитится вместе с последним батчем в run, поэтому упавший запуск его не сдвигает
+        if newest_vacancies:
+            await self.service.advance_listing_cursor(max(newest_vacancies.values()))
+
+    async def _process_vacancy(self, vacancy_detail: "HeadHunterVacancyDetailResponse") -> None:
+        vacancy_description = clear_html(vacancy_detail.description)
+
+        fingerprint = generate_fingerprint(vacancy_description)
+        vacancy = HeadHunterVacancyCreate(
+            fingerprint=fingerprint,
+            vacancy_id=vacancy_detail.id,
+            link=HttpsUrl(vacancy_detail.alternate_url),
+            employer=vacancy_detail.employer.name,
+            name=vacancy_detail.name,
+            description=vacancy_description,
+            salary=vacancy_detail.salary.humanize() if vacancy_detail.salary else None,
+            experience=vacancy_detail.experience.name,
+            schedule=vacancy_detail.schedule.name if vacancy_detail.schedule else None,
+            work_formats=[wf.name for wf in vacancy_detail.work_format],
+            key_skills=[ks.name for ks in vacancy_detail.key_skills],
+            published_at=vacancy_detail.published_at,
         )
-
-        for vacancy_detail in vacancy_details:
-            if isinstance(vacancy_detail, BaseException):
-                logger.error("Error fetching vacancy", exc_info=vacancy_detail)
-                continue
-            if not vacancy_detail:
-                continue
-
-            vacancy_description = clear_html(vacancy_detail.description)
-
-            fingerprint = generate_fingerprint(vacancy_description)
-            duplicate_hash = await self.service.find_duplicate_vacancy_by_fingerprint(fingerprint)
-            if duplicate_hash:
-                logger.debug(
-                    "Found duplicate vacancy. New vacancy link: %s",
-                    vacancy_detail.alternate_url,
-                )
-                await self.service.update_vacancy_published_at(duplicate_hash, vacancy_detail.published_at)
-                continue
-
-            vacancy = HeadHunterVacancyCreate(
-                fingerprint=fingerprint,
-                vacancy_id=vacancy_detail.id,
-                link=HttpsUrl(vacancy_detail.alternate_url),
-                employer=vacancy_detail.employer.name,
-                name=vacancy_detail.name,
-                description=clear_html(vacancy_detail.description),
-                salary=vacancy_detail.salary.humanize() if vacancy_detail.salary else None,
-                experience=vacancy_detail.experience.name,
-                schedule=vacancy_detail.schedule.name if vacancy_detail.schedule else None,
-                work_formats=[wf.name for wf in vacancy_detail.work_format],
-                key_skills=[ks.name for ks in vacancy_detail.key_skills],
-                published_at=vacancy_detail.published_at,
-            )
-            await self.add_vacancy(vacancy)
+        await self.add_vacancy(vacancy)
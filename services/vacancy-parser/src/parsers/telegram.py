@@ -1,8 +1,12 @@
+import asyncio
 from collections.abc import Iterable
 
 from clients import telegram_client
+from clients.telegram.schemas import TelegramChannelMessagesRequest, TelegramChannelMessagesStreamItem
 from common.logger import get_logger
 from common.shared.schemas.http import HttpsUrl
+from core.enums import ParserStageEnum
+from database.models.enums import SourceEnum
 from parsers.base import BaseParser
 from parsers.schemas import TelegramChannelUrl
 from schemas.vacancy import TelegramVacancyCreate
@@ -19,55 +23,112 @@ logger = get_logger(__name__)
 
 
 class TelegramParser(BaseParser["TelegramVacancyService", "TelegramVacancyCreate"]):
+    source = SourceEnum.TELEGRAM
     MIN_VACANCY_TEXT_LENGTH = 600
 
     def __init__(
-        self, uow: UnitOfWork, service: TelegramVacancyService, channel_links: Iterable[TelegramChannelUrl]
+        self,
+        uow: UnitOfWork,
+        service: TelegramVacancyService,
+        channel_links: Iterable[TelegramChannelUrl],
+        *,
+        scope: str | None = None,
     ) -> None:
-        super().__init__(uow, service)
+        super().__init__(uow, service, scope=scope)
         self.channel_links = channel_links
+        # Курсоры обработанных каналов, ожидающие сохранения вместе с батчем вакансий
+        self._pending_cursors: dict[tuple[str, int | None], int | None] = {}
 
     async def parse(self) -> None:
         logger.info("Starting Telegram parser")
 
-        for channel_link in self.channel_links:
-            try:
-                await self._process_channel(channel_link)
-            except Exception as e:
-                logger.exception("Error processing channel '%s'", channel_link, exc_info=e)
+        channels = {(link.channel_username, link.channel_topic_id): link for link in self.channel_links}
+        if not channels:
+            return
 
-    async def _process_channel(self, channel_link: TelegramChannelUrl) -> None:
-        logger.debug("Start parsing channel '%s'", channel_link)
+        with self.stats.measure(ParserStageEnum.LISTING):
+            requests = await self._build_channel_requests(channels)
+
+        # Поток читается отдельной задачей, чтобы ответы следующих каналов принимались,
+        # пока вакансии предыдущих пишутся в БД. Запись идет последовательно через один UoW
+        queue: asyncio.Queue[TelegramChannelMessagesStreamItem | None] = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        reader = asyncio.create_task(self._read_channels_stream(requests, queue))
+
+        try:
+            while (item := await queue.get()) is not None:
+                channel_link = channels[item.channel_username, item.channel_topic_id]
+                if item.error is not None:
+                    self.stats.failed += 1
+                    logger.error("Error processing channel '%s': %s", channel_link, item.error)
+                    continue
+
+                try:
+                    await self._process_channel(channel_link, item)
+                except Exception as e:
+                    self.stats.failed += 1
+                    logger.exception("Error processing channel '%s'", channel_link, exc_info=e)
+        finally:
+            reader.cancel()
+
+        # Каналы, полученные до обрыва потока, уже в батче и будут сохранены
+        if not reader.cancelled() and (error := reader.exception()) is not None:
+            logger.error("Telegram channels stream failed", exc_info=error)
+
+    async def _read_channels_stream(
+        self,
+        requests: list[TelegramChannelMessagesRequest],
+        queue: asyncio.Queue[TelegramChannelMessagesStreamItem | None],
+    ) -> None:
+        try:
+            # Каналы обрабатываются scraper-api параллельно, результат каждого приходит по мере готовности
+            async with telegram_client.stream_channels_messages(requests, self.MIN_VACANCY_TEXT_LENGTH) as items:
+                async for item in items:
+                    await queue.put(item)
+        finally:
+            await queue.put(None)
+
+    async def _build_channel_requests(
+        self, channels: dict[tuple[str, int | None], TelegramChannelUrl]
+    ) -> list[TelegramChannelMessagesRequest]:
+        """Собирает запросы с курсорами всех каналов двумя запросами к БД."""
+        channel_usernames = {channel_username for channel_username, _ in channels}
+        last_message_ids = await self.service.get_channels_last_message_ids(channel_usernames)
+        last_published_at = await self.service.get_last_vacancies_published_at(channel_usernames)
+
+        requests: list[TelegramChannelMessagesRequest] = []
+        for (channel_username, channel_topic_id), channel_link in channels.items():
+            request = TelegramChannelMessagesRequest(
+                channel_username=channel_username,
+                channel_topic_id=channel_topic_id,
+                date_gte=last_published_at.get(channel_username),
+                after_id=last_message_ids.get((channel_username, channel_topic_id)),
+            )
+            logger.debug(
+                "Cursor for channel '%s': last message id %s, last published at %s",
+                channel_link,
+                request.after_id,
+                request.date_gte,
+            )
+            requests.append(request)
 
-        last_published_at = await self.service.get_last_vacancy_published_at(channel_link.channel_username)
-        logger.debug("Last message published at for channel '%s' is %s", channel_link, last_published_at)
+        return requests
 
-        newest_messages = await telegram_client.get_newest_messages(
-            channel_link.channel_username, channel_link.channel_topic_id, last_published_at
-        )
+    async def _process_channel(
+        self, channel_link: TelegramChannelUrl, response: TelegramChannelMessagesStreamItem
+    ) -> None:
+        logger.debug("Start processing channel '%s'", channel_link)
 
-        if not newest_messages:
-            logger.debug("No new messages for channel '%s'", channel_link)
-            return
+        # Сообщения приходят вместе с ответом канала, поэтому они одновременно и в выдаче, и загружены
+        self.stats.listed += len(response.messages)
+        self.stats.fetched += len(response.messages)
 
         vacancies: list[TelegramVacancyCreate] = []
-        for message in newest_messages:
-            if len(message.text) < self.MIN_VACANCY_TEXT_LENGTH:
-                continue
+        # Короткие сообщения отсеиваются на стороне scraper-api
+        for message in response.messages:
             if "#резюме" in message.text.lower():
                 continue
 
             fingerprint = generate_fingerprint(message.text)
-            duplicate_hash = await self.service.find_duplicate_vacancy_by_fingerprint(fingerprint)
-            if duplicate_hash:
-                logger.debug(
-                    "Found duplicate vacancy. New vacancy link: %s/%s",
-                    channel_link,
-                    message.id,
-                )
-                await self.service.update_vacancy_published_at(duplicate_hash, message.datetime)
-                continue
-
             vacancy_create = TelegramVacancyCreate(
                 fingerprint=fingerprint,
                 link=HttpsUrl(f"{channel_link}/{message.id}"),
@@ -77,12 +138,22 @@ class TelegramParser(BaseParser["TelegramVacancyService", "TelegramVacancyCreate
             )
             vacancies.append(vacancy_create)
 
-        existing_hashes = await self.service.get_existing_hashes([v.hash for v in vacancies])
-        new_vacancies = [v for v in vacancies if v.hash not in existing_hashes]
-
-        if not vacancies or not new_vacancies:
+        if not vacancies:
             logger.debug("No new vacancies for channel '%s'", channel_link)
-            return
 
-        for new_vacancy in new_vacancies:
-            await self.add_vacancy(new_vacancy)
+        # Уже сохраненные сообщения отсеются при вставке через ON CONFLICT (hash) DO NOTHING
+        for vacancy in vacancies:
+            await self.add_vacancy(vacancy)
+
+        # Курсор сохраняется только после того, как все вакансии канала попали в батч
+        channel_key = (channel_link.channel_username, channel_link.channel_topic_id)
+        self._pending_cursors[channel_key] = response.newest_message_id
+
+    async def save_vacancies(self) -> None:
+        """Сохраняет батч вакансий вместе с курсорами каналов, чьи вакансии в него попали."""
+        cursors, self._pending_cursors = self._pending_cursors, {}
+        for (channel_username, channel_topic_id), last_message_id in cursors.items():
+            await self.service.update_channel_cursor(channel_username, channel_topic_id, last_message_id)
+
+        await super().save_vacancies()
+        await self.uow.commit()
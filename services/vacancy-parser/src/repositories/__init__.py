@@ -4,12 +4,18 @@ from repositories.vacancy import VacancyRepository
 # isort: on
 
 from repositories.head_hunter import HeadHunterVacancyRepository
+from repositories.parser_run import ParserRunRepository
+from repositories.source_cursor import SourceCursorRepository
 from repositories.telegram import TelegramVacancyRepository
+from repositories.telegram_channel_cursor import TelegramChannelCursorRepository
 
 
 __all__ = [
     "BaseVacancyRepository",
     "HeadHunterVacancyRepository",
+    "ParserRunRepository",
+    "SourceCursorRepository",
+    "TelegramChannelCursorRepository",
     "TelegramVacancyRepository",
     "VacancyRepository",
 ]
@@ -1,11 +1,31 @@
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import UTC, datetime
 
+from common.database.bulk import bulk_insert_joined
 from common.logger import get_logger
 from common.shared.repositories import BaseRepository
-from constants.fingerprint import FINGERPRINT_SIMILARITY_THRESHOLD
+from constants.fingerprint import FINGERPRINT_SIMILARITY_THRESHOLD, SIMHASH_BANDS, SIMHASH_MAX_DISTANCE
+from core import service_config
 from database.models import Vacancy
-from sqlalchemy import func, select, update
+from database.models.vacancy import simhash_band
+from schemas.vacancy import BaseVacancyCreate
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    String,
+    Text,
+    and_,
+    cast,
+    column,
+    func,
+    literal,
+    or_,
+    select,
+    true,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, BIT
 
 
 logger = get_logger(__name__)
@@ -34,33 +54,115 @@ class BaseVacancyRepository[VacancyType: Vacancy](BaseRepository):
 
         return set(result.scalars().all())
 
-    async def find_duplicate_vacancy_hash_by_fingerprint(self, fingerprint: str) -> str | None:
-        """Найти дубликат вакансии по содержимому."""
-        stmt = (
+    async def find_duplicate_vacancy_hashes_by_fingerprints(self, fingerprints: Sequence[str]) -> dict[str, str]:
+        """Находит дубликаты вакансий по схожести fingerprint (pg_trgm) для целой пачки одним запросом.
+        Возвращает словарь {fingerprint: хеш найденного дубликата}.
+        """
+        if not fingerprints:
+            return {}
+
+        fingerprints_table = (
+            func.unnest(literal(list(fingerprints), ARRAY(Text)))
+            .table_valued("fingerprint")
+            .render_derived(name="candidates")
+        )
+        duplicate = (
             select(self.model.hash)
-            .where(self.model.fingerprint.op("%")(fingerprint))
-            .where(func.similarity(self.model.fingerprint, fingerprint) > FINGERPRINT_SIMILARITY_THRESHOLD)
+            .where(self.model.fingerprint.op("%")(fingerprints_table.c.fingerprint))
+            .where(
+                func.similarity(self.model.fingerprint, fingerprints_table.c.fingerprint)
+                > FINGERPRINT_SIMILARITY_THRESHOLD
+            )
             .limit(1)
+            .lateral("duplicate")
+        )
+        stmt = select(fingerprints_table.c.fingerprint, duplicate.c.hash).select_from(
+            fingerprints_table.join(duplicate, true())
         )
         result = await self._session.execute(stmt)
 
-        return result.scalar_one_or_none()
+        return dict(result.tuples().all())
 
-    async def add_bulk(self, vacancies: Sequence[VacancyType]) -> None:
-        """Добавляет сразу несколько вакансий.
-        Возвращает количество реально вставленных строк.
+    async def find_duplicate_vacancy_hashes_by_simhashes(
+        self, content_hashes: Sequence[int], simhashes: Sequence[int]
+    ) -> dict[int, str]:
+        """Находит дубликаты вакансий по точному хешу содержимого или по близкому SimHash
+        для целой пачки одним запросом. Кандидаты отбираются по совпадению хотя бы одной полосы SimHash,
+        затем проверяется расстояние Хэмминга.
+        Возвращает словарь {content_hash: хеш найденного дубликата}.
         """
-        self._session.add_all(vacancies)
+        if not content_hashes:
+            return {}
+
+        candidates = (
+            func.unnest(
+                literal(list(content_hashes), ARRAY(BigInteger)),
+                literal(list(simhashes), ARRAY(BigInteger)),
+            )
+            .table_valued("content_hash", "simhash")
+            .render_derived(name="candidates")
+        )
+        bands_match = or_(
+            *(
+                simhash_band(self.model.simhash, band) == simhash_band(candidates.c.simhash, band)
+                for band in range(SIMHASH_BANDS)
+            )
+        )
+        distance = func.bit_count(cast(self.model.simhash.op("#")(candidates.c.simhash), BIT(64)))
+        duplicate = (
+            select(self.model.hash)
+            .where(
+                or_(
+                    self.model.content_hash == candidates.c.content_hash,
+                    and_(bands_match, distance <= SIMHASH_MAX_DISTANCE),
+                )
+            )
+            .limit(1)
+            .lateral("duplicate")
+        )
+        stmt = select(candidates.c.content_hash, duplicate.c.hash).select_from(candidates.join(duplicate, true()))
+        result = await self._session.execute(stmt)
+
+        return dict(result.tuples().all())
+
+    async def add_bulk(self, vacancies: Sequence[BaseVacancyCreate], *, skip_existing: bool = False) -> list[str]:
+        """Добавляет сразу несколько вакансий в базовую и дочернюю таблицы, минуя ORM.
+        С `skip_existing` вставка идемпотентна: вакансии, совпадающие с уже сохраненными по любому уникальному
+        полю (хешу, хешу содержимого или ссылке), пропускаются через ON CONFLICT DO NOTHING,
+        без предварительной проверки и без гонки с другими воркерами.
+        Возвращает хеши реально вставленных вакансий.
+        """
+        ids = await bulk_insert_joined(
+            self._session,
+            self.model,
+            vacancies,
+            method=service_config.bulk_insert_method,
+            unique_column="hash" if skip_existing else None,
+        )
 
-    async def update_published_at(self, vacancy_hash: str, published_at: datetime) -> bool:
-        """Обновляет дату публикации вакансии напрямую через UPDATE."""
+        return [vacancy.hash for vacancy, vacancy_id in zip(vacancies, ids, strict=True) if vacancy_id is not None]
+
+    async def update_published_at_bulk(self, published_at_by_hash: Mapping[str, datetime]) -> int:
+        """Обновляет даты публикации сразу нескольких вакансий одним UPDATE ... FROM (VALUES ...).
+        Возвращает количество обновленных строк.
+        """
+        if not published_at_by_hash:
+            return 0
+
+        new_values = values(
+            column("hash", String),
+            column("published_at", DateTime(timezone=True)),
+            name="new_values",
+        ).data(list(published_at_by_hash.items()))
         stmt = (
-            update(Vacancy).where(Vacancy.hash == vacancy_hash).values(published_at=published_at).returning(Vacancy.id)
+            update(Vacancy)
+            .where(Vacancy.hash == new_values.c.hash)
+            .values(published_at=new_values.c.published_at)
+            .returning(Vacancy.id)
         )
         result = await self._session.execute(stmt)
-        updated = result.scalar_one_or_none()
 
-        return updated is not None
+        return len(result.scalars().all())
 
     async def mark_as_processed_bulk(self, vacancy_hashes: list[str]) -> None:
         """Помечает сразу несколько вакансий как обработанные.
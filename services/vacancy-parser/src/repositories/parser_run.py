@@ -0,0 +1,72 @@
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from common.shared.repositories import BaseRepository
+from database.models import ParserRun
+from database.models.enums import ParserRunStatusEnum, SourceEnum
+from schemas.parser_run import ParserRunCreate
+from sqlalchemy import Row, func, insert, select
+
+
+__all__ = ["ParserRunRepository"]
+
+
+# Счетчики и длительности, которые суммируются в сводке по источнику
+_SUMMED_COLUMNS = (
+    ParserRun.listed,
+    ParserRun.known,
+    ParserRun.fetched,
+    ParserRun.failed,
+    ParserRun.duplicates,
+    ParserRun.inserted,
+    ParserRun.bytes_downloaded,
+    ParserRun.duration_ms,
+    ParserRun.listing_ms,
+    ParserRun.fetching_ms,
+    ParserRun.deduplication_ms,
+    ParserRun.saving_ms,
+)
+
+
+class ParserRunRepository(BaseRepository):
+    """Репозиторий журнала запусков парсеров."""
+
+    model = ParserRun
+
+    async def add(self, run: ParserRunCreate) -> None:
+        stmt = insert(self.model).values(run.model_dump())
+        await self._session.execute(stmt)
+
+    async def get_recent(
+        self, limit: int, source: SourceEnum | None = None, scope: str | None = None
+    ) -> Sequence[ParserRun]:
+        """Возвращает последние запуски, при `source` и `scope` только запуски этого источника и его части."""
+        stmt = select(self.model).order_by(self.model.started_at.desc()).limit(limit)
+        if source is not None:
+            stmt = stmt.where(self.model.source == source)
+        if scope is not None:
+            stmt = stmt.where(self.model.scope == scope)
+        result = await self._session.execute(stmt)
+
+        return result.scalars().all()
+
+    async def get_stats(self, since: datetime) -> Sequence[Row[Any]]:
+        """Сводка запусков по источникам и их частям, начатых после `since`."""
+        stmt = (
+            select(
+                self.model.source,
+                self.model.scope,
+                func.count().label("runs"),
+                func.count().filter(self.model.status == ParserRunStatusEnum.FAILED).label("failed_runs"),
+                *(func.sum(column).label(column.key) for column in _SUMMED_COLUMNS),
+                func.percentile_cont(0.5).within_group(self.model.duration_ms).label("duration_p50_ms"),
+                func.percentile_cont(0.95).within_group(self.model.duration_ms).label("duration_p95_ms"),
+            )
+            .where(self.model.started_at >= since)
+            .group_by(self.model.source, self.model.scope)
+            .order_by(self.model.source, self.model.scope)
+        )
+        result = await self._session.execute(stmt)
+
+        return result.all()
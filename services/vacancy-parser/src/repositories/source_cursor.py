@@ -0,0 +1,39 @@
+from datetime import UTC, datetime
+
+from common.shared.repositories import BaseRepository
+from database.models import SourceCursor
+from database.models.enums import SourceEnum
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+
+
+__all__ = ["SourceCursorRepository"]
+
+
+class SourceCursorRepository(BaseRepository):
+    """Репозиторий курсоров выдачи источников."""
+
+    model = SourceCursor
+
+    async def get_last_published_at(self, source: SourceEnum) -> datetime | None:
+        """Возвращает дату публикации, до которой выдача источника уже просмотрена."""
+        stmt = select(self.model.last_published_at).where(self.model.source == source)
+        result = await self._session.execute(stmt)
+
+        return result.scalar_one_or_none()
+
+    async def advance(self, source: SourceEnum, last_published_at: datetime) -> None:
+        """Сдвигает курсор источника вперед. Назад курсор не двигается."""
+        stmt = insert(self.model).values(
+            source=source,
+            last_published_at=last_published_at,
+            updated_at=datetime.now(tz=UTC),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.model.source],
+            set_={
+                "last_published_at": func.greatest(self.model.last_published_at, stmt.excluded.last_published_at),
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await self._session.execute(stmt)
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from datetime import datetime
 
 from database.models import TelegramVacancy
@@ -11,9 +12,13 @@ __all__ = ["TelegramVacancyRepository"]
 class TelegramVacancyRepository(BaseVacancyRepository[TelegramVacancy]):
     model = TelegramVacancy
 
-    async def get_last_published_at(self, channel_username: str) -> datetime | None:
-        """Получить последний message_id для заданного Telegram канала."""
-        stmt = select(func.max(self.model.published_at)).where(self.model.channel_username == channel_username)
+    async def get_last_published_at(self, channel_usernames: Iterable[str]) -> dict[str, datetime]:
+        """Возвращает дату последней вакансии для каждого из каналов. Каналы без вакансий не попадают в результат."""
+        stmt = (
+            select(self.model.channel_username, func.max(self.model.published_at))
+            .where(self.model.channel_username.in_(list(channel_usernames)))
+            .group_by(self.model.channel_username)
+        )
         result = await self._session.execute(stmt)
 
-        return result.scalar_one_or_none()
+        return dict(result.tuples().all())
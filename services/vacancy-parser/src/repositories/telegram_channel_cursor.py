@@ -0,0 +1,42 @@
+from collections.abc import Iterable
+from datetime import UTC, datetime
+
+from common.shared.repositories import BaseRepository
+from database.models import TelegramChannelCursor
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+
+
+__all__ = ["TelegramChannelCursorRepository"]
+
+
+class TelegramChannelCursorRepository(BaseRepository):
+    """Репозиторий курсоров Telegram каналов."""
+
+    model = TelegramChannelCursor
+
+    async def get_last_message_ids(self, channel_usernames: Iterable[str]) -> dict[tuple[str, int | None], int | None]:
+        """Возвращает ID последних просмотренных сообщений всех курсоров (в том числе топиков) указанных каналов."""
+        stmt = select(self.model.channel_username, self.model.channel_topic_id, self.model.last_message_id).where(
+            self.model.channel_username.in_(list(channel_usernames))
+        )
+        result = await self._session.execute(stmt)
+
+        return {(username, topic_id): message_id for username, topic_id, message_id in result.tuples().all()}
+
+    async def upsert(self, channel_username: str, channel_topic_id: int | None, last_message_id: int | None) -> None:
+        """Сохраняет время опроса канала и сдвигает курсор вперед. Назад курсор не двигается."""
+        stmt = insert(self.model).values(
+            channel_username=channel_username,
+            channel_topic_id=channel_topic_id,
+            last_message_id=last_message_id,
+            last_polled_at=datetime.now(tz=UTC),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.model.channel_username, self.model.channel_topic_id],
+            set_={
+                "last_message_id": func.greatest(self.model.last_message_id, stmt.excluded.last_message_id),
+                "last_polled_at": stmt.excluded.last_polled_at,
+            },
+        )
+        await self._session.execute(stmt)
@@ -1,11 +1,179 @@
-from database.models import Vacancy
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime, timedelta
+from typing import Any
+
+from core.enums import VacancyExportFieldEnum
+from database.models import HabrVacancy, HeadHunterVacancy, TelegramVacancy, Vacancy
 from repositories import BaseVacancyRepository
+from sqlalchemy import Row, func, literal, or_, select, tuple_, update
+from sqlalchemy.orm import InstrumentedAttribute, with_polymorphic
 
 
 __all__ = ["VacancyRepository"]
 
 
+# Поля выгрузки, которые хранятся в дочерних таблицах
+EXPORT_SUBCLASS_FIELDS: dict[type[Vacancy], frozenset[VacancyExportFieldEnum]] = {
+    HabrVacancy: frozenset({VacancyExportFieldEnum.EXTERNAL_ID}),
+    HeadHunterVacancy: frozenset({VacancyExportFieldEnum.VACANCY_ID}),
+    TelegramVacancy: frozenset({VacancyExportFieldEnum.CHANNEL_USERNAME}),
+}
+# Сколько строк за раз забирается из серверного курсора
+EXPORT_YIELD_PER = 500
+
+
 class VacancyRepository(BaseVacancyRepository[Vacancy]):
     """Репозиторий для работы с моделями вакансий."""
 
     model = Vacancy
+
+    async def stream_unprocessed(
+        self,
+        fields: Sequence[VacancyExportFieldEnum],
+        limit: int,
+        before: tuple[datetime, int] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Построчно отдает необработанные вакансии от новых к старым, начиная после курсора
+        `(published_at, id) < before`. Выбираются только колонки из `fields`, без создания ORM-объектов.
+        Дочерние таблицы присоединяются одним запросом и только те, чьи поля запрошены.
+        """
+        subclasses = [cls for cls, cls_fields in EXPORT_SUBCLASS_FIELDS.items() if cls_fields.intersection(fields)]
+        vacancy = with_polymorphic(Vacancy, subclasses, flat=True)
+
+        columns = []
+        for field in fields:
+            owner = next((cls for cls in subclasses if field in EXPORT_SUBCLASS_FIELDS[cls]), None)
+            entity = getattr(vacancy, owner.__name__) if owner else vacancy
+            columns.append(getattr(entity, field).label(field))
+
+        stmt = (
+            select(*columns)
+            .where(vacancy.processed_at.is_(None))
+            .order_by(vacancy.published_at.desc(), vacancy.id.desc())
+            .limit(limit)
+            .execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+        if before is not None:
+            stmt = stmt.where(
+                tuple_(vacancy.published_at, vacancy.id)
+                < tuple_(literal(before[0], vacancy.published_at.type), literal(before[1], vacancy.id.type))
+            )
+
+        result = await self._session.stream(stmt)
+        async for row in result.mappings():
+            yield dict(row)
+
+    async def get_hashes_after(self, after_id: int, limit: int) -> Sequence[Row[tuple[int, str]]]:
+        """Возвращает пачку `(id, hash)` вакансий с id больше `after_id` в порядке возрастания id."""
+        stmt = select(Vacancy.id, Vacancy.hash).where(Vacancy.id > after_id).order_by(Vacancy.id).limit(limit)
+        result = await self._session.execute(stmt)
+
+        return result.all()
+
+    async def claim_unprocessed(
+        self,
+        worker_id: str,
+        limit: int,
+        lease: timedelta,
+        hashes: Sequence[str] | None = None,
+    ) -> Sequence[Row[Any]]:
+        """Закрепляет за воркером пачку необработанных вакансий, свободных или с истекшей арендой.
+        С `hashes` выбираются только вакансии с этими хешами.
+        Строки, заблокированные параллельным захватом, пропускаются (FOR UPDATE SKIP LOCKED),
+        поэтому одна вакансия не попадет двум воркерам. Срок аренды считается по часам БД.
+        """
+        batch_query = select(Vacancy.id).where(
+            Vacancy.processed_at.is_(None), or_(Vacancy.lease_until.is_(None), Vacancy.lease_until < func.now())
+        )
+        if hashes is not None:
+            batch_query = batch_query.where(Vacancy.hash.in_(hashes))
+        batch = (
+            batch_query.order_by(Vacancy.published_at.desc(), Vacancy.id.desc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("batch")
+        )
+        stmt = (
+            update(Vacancy)
+            .where(Vacancy.id == batch.c.id)
+            .values(claimed_by=worker_id, lease_until=func.now() + lease)
+            .returning(
+                Vacancy.id,
+                Vacancy.source,
+                Vacancy.hash,
+                Vacancy.fingerprint,
+                Vacancy.link,
+                Vacancy.data,
+                Vacancy.published_at,
+                Vacancy.processed_at,
+            )
+        )
+        result = await self._session.execute(stmt)
+
+        return result.all()
+
+    async def renew_leases(self, worker_id: str, hashes: Sequence[str], lease: timedelta) -> list[str]:
+        """Продлевает аренду вакансий, которые все еще закреплены за воркером.
+        Возвращает хеши продленных вакансий.
+        """
+        if not hashes:
+            return []
+
+        stmt = (
+            update(Vacancy)
+            .where(Vacancy.hash.in_(hashes), Vacancy.claimed_by == worker_id, Vacancy.processed_at.is_(None))
+            .values(lease_until=func.now() + lease)
+            .returning(Vacancy.hash)
+        )
+        result = await self._session.execute(stmt)
+
+        return list(result.scalars().all())
+
+    async def ack_claimed(self, worker_id: str, hashes: Sequence[str]) -> list[str]:
+        """Помечает закрепленные за воркером вакансии обработанными и снимает аренду.
+        Возвращает хеши подтвержденных вакансий.
+        """
+        if not hashes:
+            return []
+
+        stmt = (
+            update(Vacancy)
+            .where(Vacancy.hash.in_(hashes), Vacancy.claimed_by == worker_id, Vacancy.processed_at.is_(None))
+            .values(processed_at=func.now(), lease_until=None)
+            .returning(Vacancy.hash)
+        )
+        result = await self._session.execute(stmt)
+
+        return list(result.scalars().all())
+
+    async def clear_processed_data(self, processed_before: datetime, after_id: int, limit: int) -> list[int]:
+        """Удаляет сырые данные у пачки вакансий, обработанных раньше `processed_before`."""
+        return await self._clear_processed_column(Vacancy.data, processed_before, after_id, limit)
+
+    async def clear_processed_fingerprints(self, processed_before: datetime, after_id: int, limit: int) -> list[int]:
+        """Удаляет отпечатки у пачки вакансий, обработанных раньше `processed_before`.
+        Такие вакансии больше не участвуют в поиске дубликатов по pg_trgm.
+        """
+        return await self._clear_processed_column(Vacancy.fingerprint, processed_before, after_id, limit)
+
+    async def _clear_processed_column(
+        self,
+        column: InstrumentedAttribute[str | None],
+        processed_before: datetime,
+        after_id: int,
+        limit: int,
+    ) -> list[int]:
+        """Обнуляет колонку у следующей пачки вакансий с id больше `after_id`.
+        Возвращает id обновленных вакансий в порядке возрастания.
+        """
+        batch_ids = (
+            select(Vacancy.id)
+            .where(Vacancy.id > after_id, Vacancy.processed_at < processed_before, column.is_not(None))
+            .order_by(Vacancy.id)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        stmt = update(Vacancy).where(Vacancy.id.in_(batch_ids)).values({column: None}).returning(Vacancy.id)
+        result = await self._session.execute(stmt)
+
+        return sorted(result.scalars().all())
@@ -0,0 +1,133 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+from datetime import datetime
+from functools import cached_property
+import time
+
+from common.shared.schemas.model import ModelFields
+from core.enums import ParserStageEnum
+from database.models import ParserRun
+from database.models.enums import ParserRunStatusEnum, SourceEnum
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+
+
+__all__ = [
+    "ParserRunCreate",
+    "ParserRunRead",
+    "ParserRunStats",
+    "ParserSourceStats",
+]
+
+
+class ParserRunFields(ModelFields):
+    __model__ = ParserRun
+
+    id: int
+    source: SourceEnum
+    scope: str | None
+    status: ParserRunStatusEnum
+    error: str | None
+    started_at: datetime
+    finished_at: datetime
+    listed: int
+    known: int
+    fetched: int
+    failed: int
+    duplicates: int
+    inserted: int
+    bytes_downloaded: int
+    duration_ms: int
+    listing_ms: int
+    fetching_ms: int
+    deduplication_ms: int
+    saving_ms: int
+
+
+class ParserRunStats:
+    """Счетчики и длительности этапов одного запуска парсера, накапливаемые по ходу работы."""
+
+    def __init__(self) -> None:
+        self.listed = 0
+        self.known = 0
+        self.fetched = 0
+        self.failed = 0
+        self.duplicates = 0
+        self.inserted = 0
+        self.durations: dict[ParserStageEnum, float] = dict.fromkeys(ParserStageEnum, 0.0)
+
+    @contextmanager
+    def measure(self, stage: ParserStageEnum) -> Generator[None]:
+        """Добавляет время выполнения блока к длительности этапа.
+        Этапы, идущие конкурентно (загрузка деталей), суммируются по всем задачам.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[stage] += time.perf_counter() - started
+
+    def duration_ms(self, stage: ParserStageEnum) -> int:
+        return round(self.durations[stage] * 1000)
+
+
+class ParserRunCreate(BaseModel):
+    source: SourceEnum = ParserRunFields.source
+    scope: str | None = ParserRunFields.scope
+    status: ParserRunStatusEnum = ParserRunFields.status
+    error: str | None = ParserRunFields.error
+    started_at: datetime = ParserRunFields.started_at
+    finished_at: datetime = ParserRunFields.finished_at
+    listed: int = ParserRunFields.listed
+    known: int = ParserRunFields.known
+    fetched: int = ParserRunFields.fetched
+    failed: int = ParserRunFields.failed
+    duplicates: int = ParserRunFields.duplicates
+    inserted: int = ParserRunFields.inserted
+    bytes_downloaded: int = ParserRunFields.bytes_downloaded
+    duration_ms: int = ParserRunFields.duration_ms
+    listing_ms: int = ParserRunFields.listing_ms
+    fetching_ms: int = ParserRunFields.fetching_ms
+    deduplication_ms: int = ParserRunFields.deduplication_ms
+    saving_ms: int = ParserRunFields.saving_ms
+
+
+class ParserRunRead(ParserRunCreate):
+    id: int = ParserRunFields.id
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ParserSourceStats(BaseModel):
+    """Сводка запусков парсера одного источника (или его части) за период."""
+
+    source: SourceEnum
+    scope: str | None = Field(description="Часть источника, например группа каналов Telegram")
+    runs: int = Field(description="Количество запусков")
+    failed_runs: int = Field(description="Количество запусков, завершившихся ошибкой")
+    listed: int = Field(description="Вакансий в выдаче источника")
+    known: int = Field(description="Вакансий, уже сохраненных ранее")
+    fetched: int = Field(description="Загружено деталей вакансий")
+    failed: int = Field(description="Ошибок загрузки")
+    duplicates: int = Field(description="Отсеяно дубликатов по содержимому")
+    inserted: int = Field(description="Сохранено новых вакансий")
+    bytes_downloaded: int = Field(description="Скачано байт")
+    duration_ms: int = Field(description="Суммарная длительность запусков, мс")
+    duration_p50_ms: float = Field(description="Медиана длительности запуска, мс")
+    duration_p95_ms: float = Field(description="95-й перцентиль длительности запуска, мс")
+    listing_ms: int = Field(description="Суммарная длительность получения списков вакансий, мс")
+    fetching_ms: int = Field(description="Суммарное время загрузки деталей вакансий, мс")
+    deduplication_ms: int = Field(description="Суммарная длительность поиска дубликатов, мс")
+    saving_ms: int = Field(description="Суммарная длительность сохранения вакансий, мс")
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @computed_field(description="Среднее время загрузки деталей одной вакансии, мс")  # type: ignore[prop-decorator]
+    @cached_property
+    def fetch_latency_ms(self) -> float | None:
+        attempts = self.fetched + self.failed
+        return self.fetching_ms / attempts if attempts else None
+
+    @computed_field(description="Сохранено новых вакансий в минуту работы парсера")  # type: ignore[prop-decorator]
+    @cached_property
+    def inserted_per_minute(self) -> float | None:
+        return self.inserted / self.duration_ms * 60_000 if self.duration_ms else None
@@ -1,6 +1,9 @@
+from functools import cached_property
+
 from common.shared.schemas.http import HttpsUrl
 from database.models.enums import SourceEnum
 from pydantic import BaseModel, computed_field, field_serializer
+from utils import generate_content_hash, generate_simhash
 
 
 class BaseVacancyRead(BaseModel):
@@ -8,11 +11,23 @@ class BaseVacancyRead(BaseModel):
 
 
 class BaseVacancyCreate(BaseModel):
+    fingerprint: str
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def hash(self) -> str:
         raise NotImplementedError("Define hash in child class")
 
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def content_hash(self) -> int:
+        return generate_content_hash(self.fingerprint)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def simhash(self) -> int:
+        return generate_simhash(self.fingerprint)
+
     @field_serializer("link", check_fields=False)
     def serialize_link(self, link: HttpsUrl) -> str:  # noqa: PLR6301
         return str(link)
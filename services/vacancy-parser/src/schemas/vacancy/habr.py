@@ -1,9 +1,10 @@
 from datetime import datetime
 
 from common.shared.schemas.http import HttpsUrl
+from common.shared.schemas.model.utils import col
 from database.models import HabrVacancy
 from database.models.enums import SourceEnum
-from pydantic import ConfigDict, computed_field
+from pydantic import ConfigDict, Field, computed_field
 from schemas.vacancy import BaseVacancyCreate, BaseVacancyRead, VacancyFields
 from utils import generate_vacancy_hash
 
@@ -15,8 +16,9 @@ class HabrVacancyFields(VacancyFields):
 
 
 class HabrVacancyCreate(BaseVacancyCreate):
-    data: str = HabrVacancyFields.data
-    fingerprint: str = HabrVacancyFields.fingerprint
+    # В БД data и fingerprint очищаются у старых обработанных вакансий, но новая вакансия без них не создается
+    data: str = Field(**col(HabrVacancy.data))
+    fingerprint: str = Field(**col(HabrVacancy.fingerprint))
     link: HttpsUrl = HabrVacancyFields.link
     published_at: datetime = HabrVacancyFields.published_at
     external_id: int = HabrVacancyFields.external_id
@@ -36,7 +38,7 @@ class HabrVacancyRead(BaseVacancyRead):
     id: int = HabrVacancyFields.id
     hash: str = HabrVacancyFields.hash
     source: SourceEnum = HabrVacancyFields.source
-    fingerprint: str = HabrVacancyFields.fingerprint
+    fingerprint: str | None = HabrVacancyFields.fingerprint
     link: HttpsUrl = HabrVacancyFields.link
     published_at: datetime = HabrVacancyFields.published_at
     external_id: int = HabrVacancyFields.external_id
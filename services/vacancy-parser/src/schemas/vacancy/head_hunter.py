@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from common.shared.schemas.http import HttpsUrl
+from common.shared.schemas.model.utils import col
 from database.models import HeadHunterVacancy
 from database.models.enums import SourceEnum
 from pydantic import ConfigDict, Field, computed_field
@@ -16,7 +17,8 @@ class HeadHunterVacancyFields(VacancyFields):
 
 
 class HeadHunterVacancyCreate(BaseVacancyCreate):
-    fingerprint: str = HeadHunterVacancyFields.fingerprint
+    # В БД fingerprint очищается у старых обработанных вакансий, но новая вакансия без него не создается
+    fingerprint: str = Field(**col(HeadHunterVacancy.fingerprint))
     link: HttpsUrl = HeadHunterVacancyFields.link
     published_at: datetime = HeadHunterVacancyFields.published_at
     vacancy_id: int = HeadHunterVacancyFields.vacancy_id
@@ -64,9 +66,9 @@ class HeadHunterVacancyCreate(BaseVacancyCreate):
 class HeadHunterVacancyRead(BaseVacancyRead):
     id: int = HeadHunterVacancyFields.id
     hash: str = HeadHunterVacancyFields.hash
-    data: str = HeadHunterVacancyFields.data
+    data: str | None = HeadHunterVacancyFields.data
     source: SourceEnum = HeadHunterVacancyFields.source
-    fingerprint: str = HeadHunterVacancyFields.fingerprint
+    fingerprint: str | None = HeadHunterVacancyFields.fingerprint
     link: HttpsUrl = HeadHunterVacancyFields.link
     published_at: datetime = HeadHunterVacancyFields.published_at
     vacancy_id: int = HeadHunterVacancyFields.vacancy_id
@@ -1,9 +1,10 @@
 from datetime import datetime
 
 from common.shared.schemas.http import HttpsUrl
+from common.shared.schemas.model.utils import col
 from database.models import TelegramVacancy
 from database.models.enums import SourceEnum
-from pydantic import ConfigDict, computed_field
+from pydantic import ConfigDict, Field, computed_field
 from schemas.vacancy import BaseVacancyCreate, BaseVacancyRead, VacancyFields
 from utils import generate_vacancy_hash
 
@@ -15,9 +16,10 @@ class TelegramVacancyFields(VacancyFields):
 
 
 class TelegramVacancyCreate(BaseVacancyCreate):
-    data: str = TelegramVacancyFields.data
+    # В БД data и fingerprint очищаются у старых обработанных вакансий, но новая вакансия без них не создается
+    data: str = Field(**col(TelegramVacancy.data))
     channel_username: str = TelegramVacancyFields.channel_username
-    fingerprint: str = TelegramVacancyFields.fingerprint
+    fingerprint: str = Field(**col(TelegramVacancy.fingerprint))
     link: HttpsUrl = TelegramVacancyFields.link
     published_at: datetime = TelegramVacancyFields.published_at
 
@@ -35,7 +37,7 @@ class TelegramVacancyCreate(BaseVacancyCreate):
 class TelegramVacancyRead(BaseVacancyRead):
     id: int = TelegramVacancyFields.id
     hash: str = TelegramVacancyFields.hash
-    fingerprint: str = TelegramVacancyFields.fingerprint
+    fingerprint: str | None = TelegramVacancyFields.fingerprint
     link: HttpsUrl = TelegramVacancyFields.link
     published_at: datetime = TelegramVacancyFields.published_at
     source: SourceEnum = TelegramVacancyFields.source
@@ -15,19 +15,23 @@ class VacancyFields(ModelFields):
     id: int
     source: SourceEnum
     hash: str
-    fingerprint: str
+    fingerprint: str | None
+    content_hash: int
+    simhash: int
     link: HttpsUrl
-    data: str
+    data: str | None
     published_at: datetime
     processed_at: datetime | None
+    claimed_by: str | None
+    lease_until: datetime | None
 
 
 class VacancyRead(BaseVacancyRead):
     id: int = VacancyFields.id
     hash: str = VacancyFields.hash
-    data: str = VacancyFields.data
+    data: str | None = VacancyFields.data
     source: SourceEnum
-    fingerprint: str
+    fingerprint: str | None
     link: HttpsUrl
     published_at: datetime
     processed_at: datetime | None = VacancyFields.processed_at
@@ -5,6 +5,7 @@ from services.vacancy import VacancyService
 
 from services.habr import HabrVacancyService
 from services.head_hunter import HeadHunterVacancyService
+from services.parser_run import ParserRunService
 from services.telegram import TelegramVacancyService
 
 
@@ -12,6 +13,7 @@ __all__ = [
     "BaseVacancyService",
     "HabrVacancyService",
     "HeadHunterVacancyService",
+    "ParserRunService",
     "TelegramVacancyService",
     "VacancyService",
 ]
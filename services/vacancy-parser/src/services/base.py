@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from common.logger import get_logger
+from common.redis.bloom import RedisBloomFilter
 from common.shared.services import BaseUOWService
+from core import service_config
+from core.enums import FingerprintModeEnum
+from redis.exceptions import RedisError
 from schemas.vacancy import BaseVacancyCreate, BaseVacancyRead
 from unitofwork import UnitOfWork
 
@@ -17,6 +21,13 @@ __all__ = ["BaseVacancyService"]
 
 logger = get_logger(__name__)
 
+# Хеши всех сохраненных вакансий. Отсекает заведомо новые хеши до запроса в БД
+seen_hashes_filter = RedisBloomFilter(
+    "vacancies:seen",
+    error_rate=service_config.seen_hashes_error_rate,
+    capacity=service_config.seen_hashes_capacity,
+)
+
 
 class BaseVacancyService[
     VacancyReadType: BaseVacancyRead,
@@ -35,33 +46,67 @@ class BaseVacancyService[
     def _get_repo(self) -> "VacancyRepositoryType":
         pass
 
-    async def find_duplicate_vacancy_by_fingerprint(self, fingerprint: str) -> str | None:
-        return await self.repo.find_duplicate_vacancy_hash_by_fingerprint(fingerprint)
+    async def find_duplicate_vacancies(self, vacancies: Sequence[VacancyCreateType]) -> dict[str, str]:
+        """Возвращает словарь {fingerprint: хеш дубликата} для вакансий, у которых есть дубликат в БД.
+        Способ поиска задается настройкой `fingerprint_mode`.
+        """
+        if service_config.fingerprint_mode == FingerprintModeEnum.TRIGRAM:
+            return await self.repo.find_duplicate_vacancy_hashes_by_fingerprints([v.fingerprint for v in vacancies])
+
+        duplicates = await self.repo.find_duplicate_vacancy_hashes_by_simhashes(
+            [v.content_hash for v in vacancies], [v.simhash for v in vacancies]
+        )
+
+        return {v.fingerprint: duplicates[v.content_hash] for v in vacancies if v.content_hash in duplicates}
 
     async def get_existing_hashes(self, hashes: Iterable[str]) -> set[str]:
-        return await self.repo.get_existing_hashes(hashes)
+        """Возвращает set уже существующих хешей.
+        В БД проверяются только хеши, которые Bloom-фильтр считает возможно сохраненными.
+        """
+        hashes = list(hashes)
+        try:
+            maybe_seen = await seen_hashes_filter.might_contain(hashes)
+        except RedisError as e:
+            logger.warning("Seen hashes filter is unavailable, checking all hashes in DB", exc_info=e)
+            maybe_seen = [True] * len(hashes)
+
+        candidates = [h for h, maybe in zip(hashes, maybe_seen, strict=True) if maybe]
+        logger.debug("Seen hashes filter passed %d of %d hashes to DB", len(candidates), len(hashes))
+        if not candidates:
+            return set()
+
+        return await self.repo.get_existing_hashes(candidates)
 
     async def get_recent_vacancies(self, limit: int = 100) -> list[VacancyReadType]:
         """Получает последние актуальные вакансии из всех источников."""
         vacancies = await self.repo.get_recent_vacancies(limit=limit)
         return [self.read_schema.model_validate(v) for v in vacancies]
 
-    async def update_vacancy_published_at(self, vacancy_hash: str, published_at: datetime) -> bool:
-        """Обновляет дату публикации вакансии по её хэшу."""
-        return await self.repo.update_published_at(vacancy_hash, published_at)
+    async def update_vacancies_published_at(self, published_at_by_hash: Mapping[str, datetime]) -> int:
+        """Обновляет даты публикации вакансий по их хэшам."""
+        return await self.repo.update_published_at_bulk(published_at_by_hash)
 
     async def mark_vacancies_as_processed(self, vacancy_hashes: list[str]) -> None:
         """Bulk mark as processed."""
         await self.repo.mark_as_processed_bulk(vacancy_hashes)
         await self.commit()
 
-    async def add_vacancies_bulk(self, vacancies: list[VacancyCreateType]) -> None:
+    async def add_vacancies_bulk(self, vacancies: list[VacancyCreateType], *, skip_existing: bool = True) -> list[str]:
         """Добавляет сразу несколько вакансий пачкой.
-        Возвращает количество реально добавленных вакансий.
+        По умолчанию вакансии с уже существующим хешем молча пропускаются.
+        Возвращает хеши реально добавленных вакансий.
         """
         if not vacancies:
-            return
+            return []
 
-        vacancies = [self.repo.model(**v.model_dump()) for v in vacancies]
-        await self.repo.add_bulk(vacancies)
+        inserted_hashes = await self.repo.add_bulk(vacancies, skip_existing=skip_existing)
         await self.commit()
+
+        # Хеши попадают в фильтр только после коммита, иначе фильтр мог бы опередить БД
+        try:
+            await seen_hashes_filter.add(inserted_hashes)
+        except RedisError as e:
+            # Пропущенный хеш сочтется новым и отсеется при вставке, а в фильтр вернется при перестроении
+            logger.warning("Failed to add %d hashes to seen hashes filter", len(inserted_hashes), exc_info=e)
+
+        return inserted_hashes
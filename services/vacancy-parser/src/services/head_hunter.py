@@ -1,3 +1,6 @@
+from datetime import datetime
+
+from database.models.enums import SourceEnum
 from repositories import HeadHunterVacancyRepository
 from schemas.vacancy import HeadHunterVacancyCreate, HeadHunterVacancyRead
 
@@ -18,3 +21,11 @@ class HeadHunterVacancyService(
 
     def _get_repo(self) -> "HeadHunterVacancyRepository":
         return self._uow.hh_vacancies
+
+    async def get_listing_cursor(self) -> datetime | None:
+        """Возвращает дату публикации, до которой выдача HH уже просмотрена."""
+        return await self._uow.source_cursors.get_last_published_at(SourceEnum.HEAD_HUNTER)
+
+    async def advance_listing_cursor(self, last_published_at: datetime) -> None:
+        """Сдвигает курсор выдачи HH без коммита: он фиксируется вместе с последним батчем запуска."""
+        await self._uow.source_cursors.advance(SourceEnum.HEAD_HUNTER, last_published_at)
@@ -0,0 +1,26 @@
+from datetime import UTC, datetime, timedelta
+
+from common.shared.services import BaseUOWService
+from database.models.enums import SourceEnum
+from schemas.parser_run import ParserRunCreate, ParserRunRead, ParserSourceStats
+from unitofwork import UnitOfWork
+
+
+__all__ = ["ParserRunService"]
+
+
+class ParserRunService(BaseUOWService[UnitOfWork]):
+    async def add_run(self, run: ParserRunCreate) -> None:
+        await self._uow.parser_runs.add(run)
+        await self.commit()
+
+    async def get_recent_runs(
+        self, limit: int, source: SourceEnum | None = None, scope: str | None = None
+    ) -> list[ParserRunRead]:
+        runs = await self._uow.parser_runs.get_recent(limit, source, scope)
+        return [ParserRunRead.model_validate(run) for run in runs]
+
+    async def get_sources_stats(self, period: timedelta) -> list[ParserSourceStats]:
+        """Сводка запусков каждого источника и его частей за последний `period`."""
+        rows = await self._uow.parser_runs.get_stats(datetime.now(tz=UTC) - period)
+        return [ParserSourceStats.model_validate(row) for row in rows]
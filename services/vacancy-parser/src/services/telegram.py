@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from datetime import datetime
 
 from repositories import TelegramVacancyRepository
@@ -19,5 +20,16 @@ class TelegramVacancyService(BaseVacancyService[TelegramVacancyRead, TelegramVac
     def _get_repo(self) -> "TelegramVacancyRepository":
         return self._uow.tg_vacancies
 
-    async def get_last_vacancy_published_at(self, username: str) -> datetime | None:
-        return await self.repo.get_last_published_at(username)
+    async def get_last_vacancies_published_at(self, channel_usernames: Iterable[str]) -> dict[str, datetime]:
+        return await self.repo.get_last_published_at(channel_usernames)
+
+    async def get_channels_last_message_ids(
+        self, channel_usernames: Iterable[str]
+    ) -> dict[tuple[str, int | None], int | None]:
+        return await self._uow.tg_channel_cursors.get_last_message_ids(channel_usernames)
+
+    async def update_channel_cursor(
+        self, channel_username: str, channel_topic_id: int | None, last_message_id: int | None
+    ) -> None:
+        """Сохраняет курсор канала без коммита: он фиксируется вместе с вакансиями канала."""
+        await self._uow.tg_channel_cursors.upsert(channel_username, channel_topic_id, last_message_id)
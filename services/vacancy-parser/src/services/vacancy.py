@@ -1,6 +1,15 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from common.logger import get_logger
+from core import service_config
+from core.enums import VacancyExportFieldEnum
 from repositories import VacancyRepository
 from schemas.vacancy import VacancyRead
 from schemas.vacancy.vacancy import VacancyCreate
+from services.base import seen_hashes_filter
 
 from services import BaseVacancyService
 
@@ -8,6 +17,9 @@ from services import BaseVacancyService
 __all__ = ["VacancyService"]
 
 
+logger = get_logger(__name__)
+
+
 class VacancyService(BaseVacancyService[VacancyRead, VacancyCreate, VacancyRepository]):
     read_schema = VacancyRead
     create_schema = VacancyCreate
@@ -15,3 +27,86 @@ class VacancyService(BaseVacancyService[VacancyRead, VacancyCreate, VacancyRepos
 
     def _get_repo(self) -> "VacancyRepository":
         return self._uow.vacancies
+
+    def stream_unprocessed_vacancies(
+        self,
+        fields: Sequence[VacancyExportFieldEnum],
+        limit: int,
+        before: tuple[datetime, int] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Построчно отдает выбранные поля необработанных вакансий, начиная после курсора `(published_at, id)`."""
+        return self.repo.stream_unprocessed(fields, limit, before)
+
+    async def claim_vacancies(self, worker_id: str, limit: int, hashes: list[str] | None = None) -> list[VacancyRead]:
+        """Закрепляет за воркером пачку необработанных вакансий на `claim_lease_ttl` секунд."""
+        rows = await self.repo.claim_unprocessed(
+            worker_id, limit, timedelta(seconds=service_config.claim_lease_ttl), hashes
+        )
+        await self.commit()
+
+        return [self.read_schema.model_validate(row) for row in rows]
+
+    async def renew_vacancies_leases(self, worker_id: str, hashes: list[str]) -> list[str]:
+        """Продлевает аренду вакансий воркера еще на `claim_lease_ttl` секунд.
+        Вакансии, аренда которых истекла и перешла другому воркеру, не продлеваются.
+        """
+        renewed_hashes = await self.repo.renew_leases(
+            worker_id, hashes, timedelta(seconds=service_config.claim_lease_ttl)
+        )
+        await self.commit()
+
+        return renewed_hashes
+
+    async def ack_vacancies(self, worker_id: str, hashes: list[str]) -> list[str]:
+        """Подтверждает обработку закрепленных за воркером вакансий."""
+        acked_hashes = await self.repo.ack_claimed(worker_id, hashes)
+        await self.commit()
+
+        return acked_hashes
+
+    async def rebuild_seen_hashes_filter(self) -> int:
+        """Заново строит Bloom-фильтр из хешей всех вакансий в БД. Возвращает количество хешей."""
+        return await seen_hashes_filter.rebuild(self._iter_hashes())
+
+    async def _iter_hashes(self) -> AsyncIterator[list[str]]:
+        last_id = 0
+        while rows := await self.repo.get_hashes_after(last_id, service_config.seen_hashes_rebuild_batch_size):
+            last_id = rows[-1].id
+            yield [row.hash for row in rows]
+
+    async def purge_processed_data(self) -> int:
+        """Удаляет сырые данные вакансий, обработанных больше `data_retention_days` дней назад.
+        Возвращает количество очищенных вакансий.
+        """
+        processed_before = datetime.now(tz=UTC) - timedelta(days=service_config.data_retention_days)
+        return await self._clear_in_batches(self.repo.clear_processed_data, processed_before)
+
+    async def purge_processed_fingerprints(self) -> int:
+        """Удаляет отпечатки вакансий, обработанных больше `fingerprint_retention_days` дней назад.
+        Возвращает количество очищенных вакансий.
+        """
+        processed_before = datetime.now(tz=UTC) - timedelta(days=service_config.fingerprint_retention_days)
+        return await self._clear_in_batches(self.repo.clear_processed_fingerprints, processed_before)
+
+    async def _clear_in_batches(
+        self, clear_batch: Callable[[datetime, int, int], Awaitable[list[int]]], processed_before: datetime
+    ) -> int:
+        """Проходит по вакансиям пачками по id, коммитя каждую пачку отдельно.
+        Короткие транзакции и пауза между ними не держат блокировки строк подолгу
+        и дают autovacuum успевать за старыми версиями строк.
+        """
+        cleared_count = 0
+        last_id = 0
+        while True:
+            ids = await clear_batch(processed_before, last_id, service_config.retention_batch_size)
+            await self.commit()
+            if not ids:
+                break
+
+            cleared_count += len(ids)
+            last_id = ids[-1]
+            logger.debug("Cleared %d vacancies up to id %d", len(ids), last_id)
+
+            await asyncio.sleep(service_config.retention_batch_pause)
+
+        return cleared_count
@@ -1,4 +1,18 @@
-from tasks.vacancies import parse_vacancies
+from tasks.vacancies import (
+    parse_habr_vacancies,
+    parse_head_hunter_vacancies,
+    parse_telegram_vacancies,
+    purge_processed_vacancies,
+    rebuild_seen_hashes_filter,
+    reconcile_head_hunter_vacancies,
+)
 
 
-__all__ = ["parse_vacancies"]
+__all__ = [
+    "parse_habr_vacancies",
+    "parse_head_hunter_vacancies",
+    "parse_telegram_vacancies",
+    "purge_processed_vacancies",
+    "rebuild_seen_hashes_filter",
+    "reconcile_head_hunter_vacancies",
+]
@@ -1,4 +1,3 @@
-import asyncio
 from datetime import timedelta
 
 from celery_app import app
@@ -6,63 +5,146 @@ from common.logger import get_logger
 from common.redis.decorators.singleton import singleton
 from common.shared.utils import get_or_create_event_loop
 from constants.telegram import channel_links
+from core.config import service_config
 from parsers import HeadHunterParser, TelegramParser
 from parsers.habr import HabrParser
 from unitofwork import UnitOfWork
+from utils import get_consistent_hash_group
 
-from services import HabrVacancyService, HeadHunterVacancyService, TelegramVacancyService
+from services import HabrVacancyService, HeadHunterVacancyService, TelegramVacancyService, VacancyService
 
 
 logger = get_logger(__name__)
 
 
-@app.task(name="parse_vacancies")
-@singleton(timedelta(minutes=60))
-def parse_vacancies() -> None:
-    """Основная задача Celery для запуска всех парсеров."""
+# Мягкий лимит прерывает парсер исключением, жесткий убивает процесс воркера.
+# Блокировка живет столько же, сколько жесткий лимит, чтобы не пережить убитую задачу
+TELEGRAM_TIME_LIMIT = timedelta(minutes=20)
+HEAD_HUNTER_TIME_LIMIT = timedelta(minutes=40)
+HABR_TIME_LIMIT = timedelta(minutes=20)
+RECONCILE_TIME_LIMIT = timedelta(minutes=60)
+RETENTION_TIME_LIMIT = timedelta(minutes=60)
+SEEN_HASHES_REBUILD_TIME_LIMIT = timedelta(minutes=30)
+SOFT_TIME_LIMIT_MARGIN = timedelta(minutes=2)
+
+
+@app.task(
+    name="parse_telegram_vacancies",
+    soft_time_limit=int((TELEGRAM_TIME_LIMIT - SOFT_TIME_LIMIT_MARGIN).total_seconds()),
+    time_limit=int(TELEGRAM_TIME_LIMIT.total_seconds()),
+)
+@singleton(TELEGRAM_TIME_LIMIT)
+def parse_telegram_vacancies(group: int) -> None:
+    """Парсит группу каналов Telegram. Каналы распределяются по группам консистентным хешированием имени."""
     loop = get_or_create_event_loop()
-    loop.run_until_complete(run_all_parsers())
+    loop.run_until_complete(async_parse_telegram_vacancies(group))
 
 
-async def run_all_parsers() -> None:
-    """Запускает все парсеры параллельно и обрабатывает результаты."""
-    logger.info("Run all parsers")
+@app.task(
+    name="parse_head_hunter_vacancies",
+    soft_time_limit=int((HEAD_HUNTER_TIME_LIMIT - SOFT_TIME_LIMIT_MARGIN).total_seconds()),
+    time_limit=int(HEAD_HUNTER_TIME_LIMIT.total_seconds()),
+)
+@singleton(HEAD_HUNTER_TIME_LIMIT)
+def parse_head_hunter_vacancies() -> None:
+    loop = get_or_create_event_loop()
+    loop.run_until_complete(async_parse_head_hunter_vacancies())
 
-    tasks = [
-        parse_telegram_vacancies(),
-        parse_head_hunter_vacancies(),
-        parse_habr_vacancies(),
-    ]
 
-    for task in asyncio.as_completed(tasks):
-        try:
-            await task
-        except Exception as e:
-            logger.exception("Error running parser", exc_info=e)
+@app.task(
+    name="parse_habr_vacancies",
+    soft_time_limit=int((HABR_TIME_LIMIT - SOFT_TIME_LIMIT_MARGIN).total_seconds()),
+    time_limit=int(HABR_TIME_LIMIT.total_seconds()),
+)
+@singleton(HABR_TIME_LIMIT)
+def parse_habr_vacancies() -> None:
+    loop = get_or_create_event_loop()
+    loop.run_until_complete(async_parse_habr_vacancies())
+
+
+@app.task(
+    name="reconcile_head_hunter_vacancies",
+    soft_time_limit=int((RECONCILE_TIME_LIMIT - SOFT_TIME_LIMIT_MARGIN).total_seconds()),
+    time_limit=int(RECONCILE_TIME_LIMIT.total_seconds()),
+)
+@singleton(RECONCILE_TIME_LIMIT)
+def reconcile_head_hunter_vacancies() -> None:
+    """Повторно просматривает вакансии HeadHunter за полное окно поиска.
+    Основная задача ищет только вакансии новее курсора выдачи HH (`source_cursors`) и может пропустить
+    те, что появились в выдаче HH с задержкой больше перекрытия.
+    """
+    loop = get_or_create_event_loop()
+    loop.run_until_complete(async_parse_head_hunter_vacancies(full_window=True))
+
+
+@app.task(
+    name="purge_processed_vacancies",
+    soft_time_limit=int((RETENTION_TIME_LIMIT - SOFT_TIME_LIMIT_MARGIN).total_seconds()),
+    time_limit=int(RETENTION_TIME_LIMIT.total_seconds()),
+)
+@singleton(RETENTION_TIME_LIMIT)
+def purge_processed_vacancies() -> None:
+    """Очищает давно обработанные вакансии: сначала сырые данные, затем отпечатки.
+    Сама строка остается, чтобы хеш и SimHash продолжали защищать от повторного сохранения.
+    """
+    loop = get_or_create_event_loop()
+    loop.run_until_complete(async_purge_processed_vacancies())
+
+
+@app.task(
+    name="rebuild_seen_hashes_filter",
+    soft_time_limit=int((SEEN_HASHES_REBUILD_TIME_LIMIT - SOFT_TIME_LIMIT_MARGIN).total_seconds()),
+    time_limit=int(SEEN_HASHES_REBUILD_TIME_LIMIT.total_seconds()),
+)
+@singleton(SEEN_HASHES_REBUILD_TIME_LIMIT)
+def rebuild_seen_hashes_filter() -> None:
+    """Перестраивает Bloom-фильтр сохраненных хешей из БД.
+    Нужен после потери данных Redis или смены настроек фильтра, а по расписанию сбрасывает
+    накопленный при расширении фильтра рост ложноположительных ответов.
+    """
+    loop = get_or_create_event_loop()
+    loop.run_until_complete(async_rebuild_seen_hashes_filter())
+
 
+async def async_parse_telegram_vacancies(group: int) -> None:
+    groups_count = service_config.telegram_channel_groups
+    # Хешируется только имя канала, поэтому все топики канала попадают в одну группу
+    group_channel_links = [
+        link for link in channel_links if get_consistent_hash_group(link.channel_username, groups_count) == group
+    ]
+    logger.info("Parsing %d telegram channels of group %d/%d", len(group_channel_links), group, groups_count)
 
-async def parse_telegram_vacancies() -> None:
     async with UnitOfWork() as uow:
         service = TelegramVacancyService(uow)
-        parser = TelegramParser(uow, service, channel_links)
-        await parser.parse()
-        await parser.save_vacancies()
-        await uow.commit()
+        parser = TelegramParser(uow, service, group_channel_links, scope=f"group-{group}")
+        await parser.run()
 
 
-async def parse_head_hunter_vacancies() -> None:
+async def async_parse_head_hunter_vacancies(*, full_window: bool = False) -> None:
     async with UnitOfWork() as uow:
         service = HeadHunterVacancyService(uow)
-        parser = HeadHunterParser(uow, service)
-        await parser.parse()
-        await parser.save_vacancies()
-        await uow.commit()
+        parser = HeadHunterParser(uow, service, full_window=full_window)
+        await parser.run()
 
 
-async def parse_habr_vacancies() -> None:
+async def async_parse_habr_vacancies() -> None:
     async with UnitOfWork() as uow:
         service = HabrVacancyService(uow)
         parser = HabrParser(uow, service)
-        await parser.parse()
-        await parser.save_vacancies()
-        await uow.commit()
+        await parser.run()
+
+
+async def async_purge_processed_vacancies() -> None:
+    async with UnitOfWork() as uow:
+        service = VacancyService(uow)
+        data_count = await service.purge_processed_data()
+        logger.info("Purged data of %d processed vacancies", data_count)
+        fingerprints_count = await service.purge_processed_fingerprints()
+        logger.info("Purged fingerprints of %d processed vacancies", fingerprints_count)
+
+
+async def async_rebuild_seen_hashes_filter() -> None:
+    async with UnitOfWork() as uow:
+        service = VacancyService(uow)
+        count = await service.rebuild_seen_hashes_filter()
+        logger.info("Rebuilt seen hashes filter with %d hashes", count)
@@ -1,5 +1,12 @@
 from common.shared.unitofwork import BaseUnitOfWork
-from repositories import HeadHunterVacancyRepository, TelegramVacancyRepository, VacancyRepository
+from repositories import (
+    HeadHunterVacancyRepository,
+    ParserRunRepository,
+    SourceCursorRepository,
+    TelegramChannelCursorRepository,
+    TelegramVacancyRepository,
+    VacancyRepository,
+)
 from repositories.habr import HabrVacancyRepository
 
 
@@ -13,9 +20,15 @@ class UnitOfWork(BaseUnitOfWork):
     tg_vacancies: TelegramVacancyRepository
     hh_vacancies: HeadHunterVacancyRepository
     habr_vacancies: HabrVacancyRepository
+    tg_channel_cursors: TelegramChannelCursorRepository
+    source_cursors: SourceCursorRepository
+    parser_runs: ParserRunRepository
 
     def init_repositories(self) -> None:
         self.vacancies = VacancyRepository(self._session)
         self.tg_vacancies = TelegramVacancyRepository(self._session)
         self.hh_vacancies = HeadHunterVacancyRepository(self._session)
         self.habr_vacancies = HabrVacancyRepository(self._session)
+        self.tg_channel_cursors = TelegramChannelCursorRepository(self._session)
+        self.source_cursors = SourceCursorRepository(self._session)
+        self.parser_runs = ParserRunRepository(self._session)
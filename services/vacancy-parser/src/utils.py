@@ -1,16 +1,22 @@
+import bisect
+from collections import Counter
+from functools import lru_cache
 import hashlib
 import re
 
 from common.logger import get_logger
-from constants.fingerprint import FINGERPRINT_STOPWORDS
+from constants.fingerprint import FINGERPRINT_STOPWORDS, SIMHASH_BITS
 from database.models.enums import SourceEnum
 
 
 __all__ = [
     "clear_html",
+    "generate_content_hash",
     "generate_fingerprint",
     "generate_hash",
+    "generate_simhash",
     "generate_vacancy_hash",
+    "get_consistent_hash_group",
 ]
 
 
@@ -72,6 +78,61 @@ def generate_fingerprint(text: str) -> str:
     return truncate_by_bytes(split_words, 2704)
 
 
+def _to_signed_int64(value: int) -> int:
+    """Переводит беззнаковое 64-битное число в знаковое, чтобы оно помещалось в BIGINT."""
+    return value - (1 << SIMHASH_BITS) if value >= 1 << (SIMHASH_BITS - 1) else value
+
+
+def _hash_int64(value: str) -> int:
+    """Возвращает беззнаковый 64-битный хеш строки."""
+    digest = hashlib.blake2b(value.encode("utf-8"), digest_size=SIMHASH_BITS // 8).digest()
+    return int.from_bytes(digest, "big")
+
+
+@lru_cache
+def _hash_ring(groups_count: int, replicas: int = 64) -> tuple[list[int], list[int]]:
+    """Строит кольцо хешей: у каждой группы replicas виртуальных точек. Возвращает точки и их группы."""
+    points = sorted(
+        (_hash_int64(f"{group}:{replica}"), group) for group in range(groups_count) for replica in range(replicas)
+    )
+
+    return [point for point, _ in points], [group for _, group in points]
+
+
+def get_consistent_hash_group(key: str, groups_count: int) -> int:
+    """Возвращает номер группы для ключа по консистентному хешированию.
+    При изменении количества групп в другие группы переезжает только часть ключей.
+    """
+    points, groups = _hash_ring(groups_count)
+    index = bisect.bisect(points, _hash_int64(key)) % len(points)
+
+    return groups[index]
+
+
+def generate_content_hash(fingerprint: str) -> int:
+    """Генерирует точный 64-битный хеш содержимого вакансии по её fingerprint.
+    Используется для поиска полностью совпадающих вакансий.
+    """
+    return _to_signed_int64(_hash_int64(fingerprint))
+
+
+def generate_simhash(fingerprint: str) -> int:
+    """Генерирует 64-битный SimHash на основе слов fingerprint.
+    У похожих текстов SimHash отличается лишь в нескольких битах, поэтому
+    близость вакансий определяется расстоянием Хэмминга.
+    """
+    weights = [0] * SIMHASH_BITS
+
+    for word, count in Counter(fingerprint.split()).items():
+        word_hash = _hash_int64(word)
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if word_hash >> bit & 1 else -count
+
+    simhash = sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+    return _to_signed_int64(simhash)
+
+
 def clear_html(text: str) -> str:
     """Убирает HTML-теги из текста."""
     return re.sub(r"(<[^>]*>)|(&quot;)", "", text)
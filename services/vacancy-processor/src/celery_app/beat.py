@@ -1,13 +1,16 @@
 from datetime import timedelta
 
 from celery.schedules import schedule
+from core import service_config
 
 
 __all__ = ["beat_schedule"]
 
 beat_schedule = {
-    "process-vacancies-every-5-minutes": {
+    f"process-vacancies-worker-{worker}-every-30-minutes": {
         "task": "process_vacancies",
-        "schedule": schedule(run_every=timedelta(minutes=5)),
+        "schedule": schedule(run_every=timedelta(minutes=30)),
+        "args": (worker,),
     }
+    for worker in range(service_config.workers)
 }
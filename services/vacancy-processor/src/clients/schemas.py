@@ -7,8 +7,10 @@ from pydantic import BaseModel, Field
 
 __all__ = [
     "CompletionResponse",
-    "VacanciesListRequest",
-    "VacancyListResponse",
+    "VacancyClaimBody",
+    "VacancyClaimResponse",
+    "VacancyLeaseBody",
+    "VacancyLeaseRenewResponse",
     "VacancySchema",
 ]
 
@@ -26,15 +28,24 @@ class VacancySchema(BaseModel):
     published_at: datetime
 
 
-# FIXME: Дубляж. См. VacanciesListQuery
-class VacanciesListRequest(BaseModel):
+# FIXME: Дубляж. См. VacancyClaimBody
+class VacancyClaimBody(BaseModel):
+    worker_id: str = Field(max_length=64)
     limit: int = Field(ge=1, le=1000)
+    hashes: list[str] | None = None
 
 
-class VacancyListResponse(BaseModel):
+class VacancyClaimResponse(BaseModel):
     vacancies: list[VacancySchema]
+    lease_ttl: int
 
 
 # FIXME Дубляж
-class VacancyProcessedBody(BaseModel):
+class VacancyLeaseBody(BaseModel):
+    worker_id: str
     hashes: list[str]
+
+
+class VacancyLeaseRenewResponse(BaseModel):
+    hashes: list[str]
+    lease_ttl: int
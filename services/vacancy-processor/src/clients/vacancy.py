@@ -1,8 +1,8 @@
 from clients.schemas import (
-    VacanciesListRequest,
-    VacancyListResponse,
-    VacancyProcessedBody,
-    VacancySchema,
+    VacancyClaimBody,
+    VacancyClaimResponse,
+    VacancyLeaseBody,
+    VacancyLeaseRenewResponse,
 )
 from common.gateway.enums import ServiceEnum
 from common.gateway.utils import build_service_url
@@ -23,23 +23,33 @@ class _VacancyClient(BaseClient):
         super().configure_client()
         self.client.timeout = 30
 
-    async def get_vacancies(self) -> list[VacancySchema]:
-        params = VacanciesListRequest(limit=300)
-        response = await self.client.get(self.url, params=params.model_dump())
+    async def claim_vacancies(
+        self, worker_id: str, limit: int, hashes: list[str] | None = None
+    ) -> VacancyClaimResponse:
+        """Берет в обработку пачку вакансий, с `hashes` только указанных.
+        Пока аренда не истекла, другие воркеры их не получат.
+        """
+        body = VacancyClaimBody(worker_id=worker_id, limit=limit, hashes=hashes)
+        response = await self.client.post(f"{self.url}/claim", json=body.model_dump())
         response.raise_for_status()
 
-        data = response.json()
-        model_response = VacancyListResponse(**data)
+        claim = VacancyClaimResponse.model_validate_json(response.content)
+        logger.info("Claimed %d vacancies from vacancy parser", len(claim.vacancies))
 
-        logger.info("Received %d vacancies from vacancy parser", len(model_response.vacancies))
+        return claim
 
-        return model_response.vacancies
+    async def renew_leases(self, worker_id: str, hashes: list[str]) -> list[str]:
+        """Продлевает аренду вакансий. Возвращает хеши вакансий, которые все еще закреплены за воркером."""
+        body = VacancyLeaseBody(worker_id=worker_id, hashes=hashes)
+        response = await self.client.post(f"{self.url}/claim/renew", json=body.model_dump())
+        response.raise_for_status()
 
-    async def mark_vacancies_as_processed(self, hashes: list[str]) -> None:
-        url = f"{self.url}/mark-processed"
+        return VacancyLeaseRenewResponse.model_validate_json(response.content).hashes
 
-        body = VacancyProcessedBody(hashes=hashes)
-        response = await self.client.post(url, json=body.model_dump())
+    async def ack_vacancies(self, worker_id: str, hashes: list[str]) -> None:
+        """Подтверждает обработку вакансий, после чего парсер помечает их обработанными."""
+        body = VacancyLeaseBody(worker_id=worker_id, hashes=hashes)
+        response = await self.client.post(f"{self.url}/claim/ack", json=body.model_dump())
         response.raise_for_status()
 
 
@@ -0,0 +1,24 @@
+import asyncio
+import os
+import socket
+
+from common.sentry.initialize import init_sentry
+from core import service_config
+from utils.consumer import NewVacanciesConsumer
+
+
+async def consume() -> None:
+    name = f"{socket.gethostname()}:{os.getpid()}"
+    consumers = [NewVacanciesConsumer(f"{name}:{index}") for index in range(service_config.consumer_concurrency)]
+
+    await asyncio.gather(*(consumer.run() for consumer in consumers))
+
+
+def main() -> None:
+    init_sentry()
+
+    asyncio.run(consume())
+
+
+if __name__ == "__main__":
+    main()
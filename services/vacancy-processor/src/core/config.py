@@ -6,6 +6,13 @@ __all__ = ["service_config"]
 
 class ServiceConfig(BaseSettings):
     db_schema: str = "vacancy_processor"
+    # Количество параллельных обработчиков, каждый берет вакансии в аренду у парсера
+    workers: int = 4
+    claim_batch_size: int = 100
+    # Количество потребителей событий о новых вакансиях в одном процессе
+    consumer_concurrency: int = 4
+    # Через сколько секунд неподтвержденное событие забирает другой потребитель
+    consumer_claim_idle: int = 900  # 15 min
 
     model_config = SettingsConfigDict(env_prefix="VACANCY_PROCESSOR_")
 
@@ -1,40 +1,31 @@
 from datetime import timedelta
+import os
+import socket
 
 from celery_app import app
 from common.redis.decorators.singleton import singleton
 from common.shared.utils import get_or_create_event_loop
 from unitofwork import UnitOfWork
-from utils.extractor import VacancyExtractor
 from utils.processor import VacancyProcessor
 
-from services import GradeService, ProfessionService, SkillService, VacancyService, WorkFormatService
-
 
 @app.task(name="process_vacancies")
 @singleton(timedelta(minutes=60))
-def process_vacancies() -> None:
+def process_vacancies(worker: int) -> None:
+    """Обрабатывает вакансии в одном из `workers` параллельных слотов.
+    Слоты не пересекаются по вакансиям: каждая пачка берется у парсера в аренду.
+    Новые вакансии обрабатываются сразу по событиям парсера, а эта задача подбирает то,
+    что по событиям обработать не удалось.
+    """
     loop = get_or_create_event_loop()
-    loop.run_until_complete(async_process_vacancies())
+    loop.run_until_complete(async_process_vacancies(worker))
 
 
-async def async_process_vacancies() -> None:
-    extractor = VacancyExtractor()
+async def async_process_vacancies(worker: int) -> None:
+    worker_id = f"{socket.gethostname()}:{os.getpid()}:{worker}"
 
     async with UnitOfWork() as uow:
-        vacancy_service = VacancyService(uow)
-        grade_service = GradeService(uow)
-        profession_service = ProfessionService(uow)
-        work_format_service = WorkFormatService(uow)
-        skill_service = SkillService(uow)
-        processor = VacancyProcessor(
-            uow,
-            extractor,
-            vacancy_service,
-            grade_service,
-            profession_service,
-            work_format_service,
-            skill_service,
-        )
+        processor = VacancyProcessor.from_uow(uow, worker_id)
 
         vacancies_to_process = await processor.start()
         while vacancies_to_process != 0:
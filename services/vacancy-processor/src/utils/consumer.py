@@ -0,0 +1,75 @@
+import asyncio
+from datetime import UTC, datetime
+
+from common.logger import get_logger
+from common.shared.events import NewVacanciesEvent, new_vacancies_stream
+from core import service_config
+from unitofwork import UnitOfWork
+from utils.processor import VacancyProcessor
+
+
+__all__ = ["NewVacanciesConsumer"]
+
+
+logger = get_logger(__name__)
+
+
+CONSUMER_GROUP = "vacancy-processor"
+# Сколько ждать новых событий за одно чтение
+READ_BLOCK_MS = 5000
+# Пауза перед повторным чтением, если Redis недоступен
+READ_RETRY_DELAY = 5
+
+
+class NewVacanciesConsumer:
+    """Обрабатывает вакансии сразу по событиям парсера из Redis Stream.
+    Событие подтверждается только после коммита обработанных вакансий. Неподтвержденные события
+    упавших потребителей забираются повторно через `consumer_claim_idle` секунд.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    async def run(self) -> None:
+        await new_vacancies_stream.create_group(CONSUMER_GROUP)
+        logger.info("Consumer %s started", self.name)
+
+        while True:
+            try:
+                events = await self._next_events()
+            except Exception as e:
+                logger.exception("Failed to read new vacancies events", exc_info=e)
+                await asyncio.sleep(READ_RETRY_DELAY)
+                continue
+
+            for message_id, event in events:
+                await self._handle(message_id, event)
+
+    async def _next_events(self) -> list[tuple[str, NewVacanciesEvent]]:
+        events = await new_vacancies_stream.claim_stale(
+            CONSUMER_GROUP, self.name, min_idle_ms=service_config.consumer_claim_idle * 1000, count=1
+        )
+        if events:
+            return events
+
+        return await new_vacancies_stream.read(CONSUMER_GROUP, self.name, count=1, block_ms=READ_BLOCK_MS)
+
+    async def _handle(self, message_id: str, event: NewVacanciesEvent) -> None:
+        try:
+            async with UnitOfWork() as uow:
+                processor = VacancyProcessor.from_uow(uow, self.name)
+                await processor.start(event.hashes)
+                await uow.commit()
+        except Exception as e:
+            logger.exception("Failed to process new vacancies event %s", message_id, exc_info=e)
+            return
+
+        await new_vacancies_stream.ack(CONSUMER_GROUP, message_id)
+
+        latency = datetime.now(tz=UTC) - event.created_at
+        logger.info(
+            "Processed %d %s vacancies %.1fs after they were saved",
+            len(event.hashes),
+            event.source,
+            latency.total_seconds(),
+        )
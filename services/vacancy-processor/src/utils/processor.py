@@ -4,6 +4,7 @@ from itertools import starmap
 from clients import gpt_client, vacancy_client
 from clients.schemas import VacancySchema
 from common.logger import get_logger
+from core import service_config
 from schemas.vacancy import VacancyCreate
 from sqlalchemy.exc import IntegrityError
 from unitofwork import UnitOfWork
@@ -35,6 +36,7 @@ class VacancyProcessor:
         profession_service: ProfessionService,
         work_format_service: WorkFormatService,
         skill_service: SkillService,
+        worker_id: str,
     ) -> None:
         self.uow = uow
         self.vacancy_extractor = vacancy_extractor
@@ -43,24 +45,62 @@ class VacancyProcessor:
         self.profession_service = profession_service
         self.work_format_service = work_format_service
         self.skill_service = skill_service
+        self.worker_id = worker_id
+
+    @classmethod
+    def from_uow(cls, uow: UnitOfWork, worker_id: str) -> "VacancyProcessor":
+        return cls(
+            uow,
+            VacancyExtractor(),
+            VacancyService(uow),
+            GradeService(uow),
+            ProfessionService(uow),
+            WorkFormatService(uow),
+            SkillService(uow),
+            worker_id,
+        )
 
-    async def start(self) -> int:
+    async def start(self, hashes: list[str] | None = None) -> int:
+        """Берет в аренду пачку вакансий, обрабатывает их и подтверждает обработку.
+        С `hashes` берутся только указанные вакансии. Возвращает количество взятых вакансий.
+        """
         logger.debug("Start processing vacancies")
-        vacancies = await vacancy_client.get_vacancies()
+        claim = await vacancy_client.claim_vacancies(self.worker_id, service_config.claim_batch_size, hashes)
+        if not claim.vacancies:
+            logger.debug("No vacancies to process")
+            return 0
+
+        # Пока идут запросы к GPT, аренда продлевается в фоне, чтобы вакансии не ушли другому воркеру
+        renewal = asyncio.create_task(self._renew_leases([v.hash for v in claim.vacancies], claim.lease_ttl))
+        try:
+            vacancy_hashes_to_mark_as_processed = await self._process_vacancies(claim.vacancies)
+        finally:
+            renewal.cancel()
+
+        # Необработанные из-за ошибки вакансии вернутся в очередь, когда истечет их аренда
+        if vacancy_hashes_to_mark_as_processed:
+            await vacancy_client.ack_vacancies(self.worker_id, vacancy_hashes_to_mark_as_processed)
+            logger.debug("Acknowledged %s vacancies", len(vacancy_hashes_to_mark_as_processed))
+
+        return len(claim.vacancies)
+
+    async def _process_vacancies(self, vacancies: list[VacancySchema]) -> list[str]:
+        """Обрабатывает вакансии и возвращает хеши тех, что можно пометить обработанными."""
         existing_vacancies = await self.uow.vacancies.get_existing_hashes([v.hash for v in vacancies])
         vacancies_to_process = [v for v in vacancies if v.hash not in existing_vacancies]
 
+        # Уже сохраненные вакансии повторно не обрабатываются, но должны быть подтверждены
+        vacancy_hashes_to_mark_as_processed = [v.hash for v in vacancies if v.hash in existing_vacancies]
+
         if not vacancies_to_process:
-            logger.debug("No vacancies to process")
-            return 0
+            logger.debug("No new vacancies to process")
+            return vacancy_hashes_to_mark_as_processed
 
         logger.debug("Got %s new vacancies", len(vacancies_to_process))
 
         prompts = [make_vacancy_prompt(vacancy.data) for vacancy in vacancies_to_process]
         process_prompts_task = list(starmap(self._process_prompt, zip(prompts, vacancies_to_process, strict=True)))
 
-        vacancy_hashes_to_mark_as_processed: list[str] = []
-
         results = await asyncio.gather(*process_prompts_task, return_exceptions=True)
         for processed_vacancy, result in zip(vacancies_to_process, results, strict=True):
             if isinstance(result, BaseException):
@@ -80,14 +120,23 @@ class VacancyProcessor:
                 logger.warning("Duplicate vacancy: %s", processed_vacancy.link, exc_info=e)
                 vacancy_hashes_to_mark_as_processed.append(processed_vacancy.hash)
 
-        # Сохраним вакансии, перед их удалением
+        # Сохраним вакансии, перед подтверждением их обработки
         await self.uow.commit()
 
-        if vacancy_hashes_to_mark_as_processed:
-            await vacancy_client.mark_vacancies_as_processed(vacancy_hashes_to_mark_as_processed)
-            logger.debug("Deleting %s vacancies", len(vacancy_hashes_to_mark_as_processed))
+        return vacancy_hashes_to_mark_as_processed
+
+    async def _renew_leases(self, hashes: list[str], lease_ttl: int) -> None:
+        while hashes:
+            await asyncio.sleep(lease_ttl / 3)
+            try:
+                renewed_hashes = await vacancy_client.renew_leases(self.worker_id, hashes)
+            except Exception as e:
+                logger.warning("Failed to renew vacancies leases", exc_info=e)
+                continue
 
-        return len(vacancies_to_process)
+            if len(renewed_hashes) < len(hashes):
+                logger.warning("Lost leases of %d vacancies", len(hashes) - len(renewed_hashes))
+            hashes = renewed_hashes
 
     async def _process_prompt(
         self, prompt: str, vacancy: VacancySchema